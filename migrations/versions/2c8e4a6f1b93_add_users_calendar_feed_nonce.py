@@ -0,0 +1,26 @@
+"""Add users.calendar_feed_nonce for revocable calendar feed URLs
+
+Revision ID: 2c8e4a6f1b93
+Revises: d9c3e5a7f2b8
+Create Date: 2025-11-20 10:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c8e4a6f1b93'
+down_revision = 'd9c3e5a7f2b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('calendar_feed_nonce', sa.String(length=32), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('calendar_feed_nonce')
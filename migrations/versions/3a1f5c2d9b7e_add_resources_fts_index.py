@@ -0,0 +1,64 @@
+"""Add FTS5 full-text index over resources (SQLite only)
+
+Revision ID: 3a1f5c2d9b7e
+Revises: ebf4fea6087f
+Create Date: 2025-11-12 10:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a1f5c2d9b7e'
+down_revision = 'ebf4fea6087f'
+branch_labels = None
+depends_on = None
+
+
+FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS resources_fts USING fts5("
+    "title, description, location, "
+    "content='resources', content_rowid='resource_id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS resources_fts_ai AFTER INSERT ON resources BEGIN "
+    "INSERT INTO resources_fts(rowid, title, description, location) "
+    "VALUES (new.resource_id, new.title, new.description, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS resources_fts_ad AFTER DELETE ON resources BEGIN "
+    "INSERT INTO resources_fts(resources_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.resource_id, old.title, old.description, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS resources_fts_au "
+    "AFTER UPDATE OF title, description, location ON resources BEGIN "
+    "INSERT INTO resources_fts(resources_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.resource_id, old.title, old.description, old.location); "
+    "INSERT INTO resources_fts(rowid, title, description, location) "
+    "VALUES (new.resource_id, new.title, new.description, new.location); END",
+)
+
+
+def _fts5_available(bind):
+    if bind.dialect.name != 'sqlite':
+        return False
+    return bool(bind.execute(sa.text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar())
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not _fts5_available(bind):
+        # Other dialects fall back to ILIKE search in ResourceRepository.search
+        return
+
+    for statement in FTS_DDL:
+        op.execute(statement)
+    op.execute("INSERT INTO resources_fts(resources_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS resources_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS resources_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS resources_fts_ai")
+    op.execute("DROP TABLE IF EXISTS resources_fts")
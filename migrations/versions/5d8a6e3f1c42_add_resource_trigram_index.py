@@ -0,0 +1,84 @@
+"""Add resource_terms and term_trigrams tables for typo-tolerant search
+
+Revision ID: 5d8a6e3f1c42
+Revises: 7c4e2b91d0a3
+Create Date: 2025-11-13 09:20:00.000000
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8a6e3f1c42'
+down_revision = '7c4e2b91d0a3'
+branch_labels = None
+depends_on = None
+
+
+CATEGORY_LABELS = {
+    'study_room': 'Study Room',
+    'equipment': 'Equipment',
+    'lab': 'Lab / Workshop',
+    'space': 'Event Space',
+    'tutoring': 'Tutoring / Mentoring',
+}
+
+
+def _terms(title, location, category):
+    text = ' '.join(filter(None, [title, location, CATEGORY_LABELS.get(category, category)]))
+    return list(dict.fromkeys(t[:32] for t in re.findall(r'\w+', text.lower())))
+
+
+def _trigrams(term):
+    padded = f'  {term} '
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def upgrade():
+    resource_terms = op.create_table('resource_terms',
+    sa.Column('term', sa.String(length=32), nullable=False),
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['resource_id'], ['resources.resource_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('term', 'resource_id')
+    )
+    with op.batch_alter_table('resource_terms', schema=None) as batch_op:
+        batch_op.create_index('idx_resource_terms_resource', ['resource_id'], unique=False)
+
+    term_trigrams = op.create_table('term_trigrams',
+    sa.Column('trigram', sa.String(length=3), nullable=False),
+    sa.Column('term', sa.String(length=32), nullable=False),
+    sa.PrimaryKeyConstraint('trigram', 'term')
+    )
+    with op.batch_alter_table('term_trigrams', schema=None) as batch_op:
+        batch_op.create_index('idx_term_trigrams_term', ['term'], unique=False)
+
+    # Backfill from existing resources
+    bind = op.get_bind()
+    resources = bind.execute(
+        sa.text('SELECT resource_id, title, location, category FROM resources')
+    )
+    rows, vocabulary = [], {}
+    for resource_id, title, location, category in resources:
+        for term in _terms(title, location, category):
+            rows.append({'term': term, 'resource_id': resource_id})
+            vocabulary.setdefault(term, None)
+    if rows:
+        op.bulk_insert(resource_terms, rows)
+        op.bulk_insert(
+            term_trigrams,
+            [{'trigram': g, 'term': t} for t in vocabulary for g in _trigrams(t)],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('term_trigrams', schema=None) as batch_op:
+        batch_op.drop_index('idx_term_trigrams_term')
+
+    op.drop_table('term_trigrams')
+    with op.batch_alter_table('resource_terms', schema=None) as batch_op:
+        batch_op.drop_index('idx_resource_terms_resource')
+
+    op.drop_table('resource_terms')
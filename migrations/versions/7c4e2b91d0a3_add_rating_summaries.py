@@ -0,0 +1,51 @@
+"""Add rating_summaries table with persisted per-resource review aggregates
+
+Revision ID: 7c4e2b91d0a3
+Revises: 3a1f5c2d9b7e
+Create Date: 2025-11-12 14:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c4e2b91d0a3'
+down_revision = '3a1f5c2d9b7e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('rating_summaries',
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('rating_1', sa.Integer(), nullable=False),
+    sa.Column('rating_2', sa.Integer(), nullable=False),
+    sa.Column('rating_3', sa.Integer(), nullable=False),
+    sa.Column('rating_4', sa.Integer(), nullable=False),
+    sa.Column('rating_5', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint('review_count >= 0', name='check_summary_count_non_negative'),
+    sa.ForeignKeyConstraint(['resource_id'], ['resources.resource_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('resource_id')
+    )
+
+    # Backfill from existing visible reviews
+    op.execute(
+        "INSERT INTO rating_summaries (resource_id, review_count, rating_sum, "
+        "rating_1, rating_2, rating_3, rating_4, rating_5, updated_at) "
+        "SELECT resource_id, COUNT(*), SUM(rating), "
+        "SUM(CASE WHEN rating = 1 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN rating = 2 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN rating = 3 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN rating = 4 THEN 1 ELSE 0 END), "
+        "SUM(CASE WHEN rating = 5 THEN 1 ELSE 0 END), "
+        "CURRENT_TIMESTAMP "
+        "FROM reviews WHERE NOT is_hidden GROUP BY resource_id"
+    )
+
+
+def downgrade():
+    op.drop_table('rating_summaries')
@@ -0,0 +1,29 @@
+"""Add cache_generations table for versioned search-result caching
+
+Revision ID: 9b2d4f7a6c15
+Revises: 5d8a6e3f1c42
+Create Date: 2025-11-13 15:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b2d4f7a6c15'
+down_revision = '5d8a6e3f1c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cache_generations',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('generation', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('cache_generations')
@@ -0,0 +1,47 @@
+"""Add waitlist_entries table for queued booking requests
+
+Revision ID: a6d4f1c8e2b5
+Revises: f3b8d2a6c1e7
+Create Date: 2025-11-18 14:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6d4f1c8e2b5'
+down_revision = 'f3b8d2a6c1e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('waitlist_entries',
+    sa.Column('entry_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('requester_id', sa.Integer(), nullable=False),
+    sa.Column('start_datetime', sa.DateTime(), nullable=False),
+    sa.Column('end_datetime', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('booking_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('promoted_at', sa.DateTime(), nullable=True),
+    sa.CheckConstraint("status IN ('waiting', 'promoted', 'cancelled', 'expired')", name='check_valid_waitlist_status'),
+    sa.CheckConstraint('end_datetime > start_datetime', name='check_waitlist_end_after_start'),
+    sa.ForeignKeyConstraint(['booking_id'], ['bookings.booking_id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['requester_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['resource_id'], ['resources.resource_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('entry_id')
+    )
+    with op.batch_alter_table('waitlist_entries', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_waitlist_entries_requester_id'), ['requester_id'], unique=False)
+        batch_op.create_index('idx_waitlist_resource_status_window', ['resource_id', 'status', 'start_datetime', 'end_datetime'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('waitlist_entries', schema=None) as batch_op:
+        batch_op.drop_index('idx_waitlist_resource_status_window')
+        batch_op.drop_index(batch_op.f('ix_waitlist_entries_requester_id'))
+
+    op.drop_table('waitlist_entries')
@@ -0,0 +1,43 @@
+"""Add partial bookings indexes for conflict checks and the approval queue
+
+Revision ID: b7e2c9f4a1d6
+Revises: a6d4f1c8e2b5
+Create Date: 2025-11-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c9f4a1d6'
+down_revision = 'a6d4f1c8e2b5'
+branch_labels = None
+depends_on = None
+
+APPROVED = sa.text("status = 'approved'")
+PENDING = sa.text("status = 'pending'")
+
+
+def upgrade():
+    op.create_index(
+        'idx_bookings_approved_window',
+        'bookings',
+        ['status', 'resource_id', 'start_datetime', 'end_datetime'],
+        unique=False,
+        sqlite_where=APPROVED,
+        postgresql_where=APPROVED,
+    )
+    op.create_index(
+        'idx_bookings_pending_created',
+        'bookings',
+        ['created_at'],
+        unique=False,
+        sqlite_where=PENDING,
+        postgresql_where=PENDING,
+    )
+
+
+def downgrade():
+    op.drop_index('idx_bookings_pending_created', table_name='bookings')
+    op.drop_index('idx_bookings_approved_window', table_name='bookings')
@@ -0,0 +1,59 @@
+"""Add booking_series table and bookings.series_id for recurring bookings
+
+Revision ID: c4e7a1b9d3f2
+Revises: 9b2d4f7a6c15
+Create Date: 2025-11-14 10:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a1b9d3f2'
+down_revision = '9b2d4f7a6c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('booking_series',
+    sa.Column('series_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('requester_id', sa.Integer(), nullable=True),
+    sa.Column('start_datetime', sa.DateTime(), nullable=False),
+    sa.Column('end_datetime', sa.DateTime(), nullable=False),
+    sa.Column('frequency', sa.String(length=10), nullable=False),
+    sa.Column('interval', sa.Integer(), nullable=False),
+    sa.Column('weekdays', sa.String(length=20), nullable=True),
+    sa.Column('until', sa.Date(), nullable=True),
+    sa.Column('count', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint("frequency IN ('daily', 'weekly')", name='check_valid_series_frequency'),
+    sa.CheckConstraint('interval >= 1', name='check_series_interval_positive'),
+    sa.CheckConstraint('end_datetime > start_datetime', name='check_series_end_after_start'),
+    sa.ForeignKeyConstraint(['requester_id'], ['users.user_id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['resource_id'], ['resources.resource_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('series_id')
+    )
+    with op.batch_alter_table('booking_series', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_booking_series_requester_id'), ['requester_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_booking_series_resource_id'), ['resource_id'], unique=False)
+
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('series_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_bookings_series_id'), ['series_id'], unique=False)
+        batch_op.create_foreign_key('fk_bookings_series_id', 'booking_series', ['series_id'], ['series_id'], ondelete='SET NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_bookings_series_id', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_bookings_series_id'))
+        batch_op.drop_column('series_id')
+
+    with op.batch_alter_table('booking_series', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_booking_series_resource_id'))
+        batch_op.drop_index(batch_op.f('ix_booking_series_requester_id'))
+
+    op.drop_table('booking_series')
@@ -0,0 +1,34 @@
+"""Add booking_daily_rollups table for incremental booking analytics
+
+Revision ID: d9c3e5a7f2b8
+Revises: b7e2c9f4a1d6
+Create Date: 2025-11-20 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9c3e5a7f2b8'
+down_revision = 'b7e2c9f4a1d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('booking_daily_rollups',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('booking_count', sa.Integer(), nullable=False),
+    sa.Column('booked_minutes', sa.Integer(), nullable=False),
+    sa.Column('created_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'resource_id', 'status')
+    )
+    # Existing bookings are backfilled with `flask rebuild-booking-rollups`
+
+
+def downgrade():
+    op.drop_table('booking_daily_rollups')
@@ -0,0 +1,39 @@
+"""Add job_runs table for maintenance job bookkeeping
+
+Revision ID: e1a7c3d5b9f4
+Revises: c4e7a1b9d3f2
+Create Date: 2025-11-16 09:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a7c3d5b9f4'
+down_revision = 'c4e7a1b9d3f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('job_runs',
+    sa.Column('run_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_name', sa.String(length=50), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('rows_affected', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.CheckConstraint("status IN ('succeeded', 'failed')", name='check_valid_job_run_status'),
+    sa.PrimaryKeyConstraint('run_id')
+    )
+    with op.batch_alter_table('job_runs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_job_runs_job_name'), ['job_name'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('job_runs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_job_runs_job_name'))
+
+    op.drop_table('job_runs')
@@ -0,0 +1,30 @@
+"""Add composite bookings index for per-user My Bookings tabs
+
+Revision ID: f3b8d2a6c1e7
+Revises: e1a7c3d5b9f4
+Create Date: 2025-11-17 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d2a6c1e7'
+down_revision = 'e1a7c3d5b9f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_bookings_requester_status_start',
+            ['requester_id', 'status', 'start_datetime'],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('idx_bookings_requester_status_start')
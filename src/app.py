@@ -85,6 +85,9 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     # Register CLI commands
     register_cli_commands(app)
 
+    # Start in-process periodic jobs (disabled unless configured)
+    register_scheduled_jobs(app)
+
     # Register Vite asset helper for manifest-aware URLs
     app.jinja_env.globals["asset_url"] = asset_url
     app.jinja_env.globals["vite_asset"] = vite_asset
@@ -209,6 +212,7 @@ def register_blueprints(app: Flask) -> None:
     - messages: user-to-user messaging
     - reviews: ratings & feedback
     - admin: dashboard, moderation, analytics
+    - calendar: iCalendar subscription feeds
     """
     # Import blueprints (delayed import to avoid circular dependencies)
     from src.routes.auth import auth_bp
@@ -218,6 +222,7 @@ def register_blueprints(app: Flask) -> None:
     from src.routes.messages import messages_bp
     from src.routes.admin import admin_bp
     from src.routes.concierge import concierge_bp
+    from src.routes.calendar import calendar_bp
 
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix="/auth")
@@ -227,6 +232,7 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(messages_bp)  # Phase 7: Messages
     app.register_blueprint(admin_bp)  # Phase 8: Admin Dashboard
     app.register_blueprint(concierge_bp)  # Phase 9: AI Concierge
+    app.register_blueprint(calendar_bp)  # iCalendar feeds
 
     # Homepage route - redirect to appropriate page based on auth status
     @app.route("/")
@@ -304,6 +310,11 @@ def register_cli_commands(app: Flask) -> None:
     Usage:
         flask init-db    # Initialize database with tables
         flask seed-db    # Seed database with sample data (development only)
+        flask rebuild-search-index  # Backfill the resource full-text and trigram indexes
+        flask rebuild-rating-summaries  # Backfill persisted review aggregates
+        flask import-bookings FILE  # Bulk import bookings from CSV/JSON/JSON Lines
+        flask complete-bookings  # Mark approved bookings that have ended as completed
+        flask rebuild-booking-rollups  # Backfill/repair the daily booking analytics rollups
     """
     import click
 
@@ -319,6 +330,97 @@ def register_cli_commands(app: Flask) -> None:
         db.create_all()
         click.echo("Database initialized successfully!")
 
+    @app.cli.command("rebuild-search-index")
+    def rebuild_search_index():
+        """Create and repopulate the resource full-text and trigram search indexes."""
+        from src.repositories.resource_repo import ResourceRepository
+
+        if ResourceRepository.rebuild_search_index():
+            click.echo("Resource search index rebuilt.")
+        else:
+            click.echo("Full-text search unavailable on this database; using LIKE fallback.")
+        click.echo("Trigram index rebuilt.")
+
+    @app.cli.command("rebuild-rating-summaries")
+    def rebuild_rating_summaries():
+        """Recompute persisted per-resource rating summaries from reviews."""
+        from src.repositories.review_repo import ReviewRepository
+
+        count = ReviewRepository.rebuild_rating_summaries()
+        click.echo(f"Rebuilt rating summaries for {count} resource(s).")
+
+    @app.cli.command("import-bookings")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option(
+        "--format",
+        "fmt",
+        type=click.Choice(["csv", "json", "jsonl"]),
+        help="File format (default: from the extension)",
+    )
+    @click.option(
+        "--status",
+        type=click.Choice(["approved", "pending"]),
+        default="approved",
+        show_default=True,
+        help="Status for rows without a status column",
+    )
+    @click.option("--dry-run", is_flag=True, help="Validate and report without writing")
+    @click.option(
+        "--errors-out",
+        type=click.Path(dir_okay=False, writable=True),
+        help="Write rejected rows to this CSV file",
+    )
+    @click.option("--chunk-size", type=click.IntRange(1, 10000), default=500, show_default=True)
+    def import_bookings(path, fmt, status, dry_run, errors_out, chunk_size):
+        """Bulk import bookings, rejecting invalid or conflicting rows."""
+        from src.services.booking_import_service import BookingImportError, BookingImportService
+
+        try:
+            fmt = fmt or BookingImportService.detect_format(path)
+            with open(path, newline="", encoding="utf-8-sig") as stream:
+                report = BookingImportService.import_stream(
+                    stream, fmt, default_status=status, dry_run=dry_run, chunk_size=chunk_size
+                )
+        except BookingImportError as e:
+            raise click.ClickException(str(e))
+
+        verb = "would be imported" if dry_run else "imported"
+        click.echo(
+            f"{report['imported']} of {report['total']} booking(s) {verb}; "
+            f"{report['rejected']} rejected."
+        )
+        if errors_out and report["errors"]:
+            with open(errors_out, "w", newline="", encoding="utf-8") as stream:
+                BookingImportService.write_error_report(report["errors"], stream)
+            click.echo(f"Error report written to {errors_out}.")
+        else:
+            for error in report["errors"][:20]:
+                click.echo(f"  line {error['line']}: {'; '.join(error['errors'])}")
+            if report["rejected"] > 20:
+                click.echo(f"  ... {report['rejected'] - 20} more (use --errors-out)")
+
+    @app.cli.command("complete-bookings")
+    @click.option("--chunk-size", type=click.IntRange(1, 10000), default=500, show_default=True)
+    def complete_bookings(chunk_size):
+        """Mark approved bookings whose end time has passed as completed."""
+        from src.services.booking_service import BookingService
+
+        run = BookingService.complete_finished_bookings(chunk_size=chunk_size)
+        click.echo(f"Completed {run.rows_affected} booking(s).")
+
+    @app.cli.command("rebuild-booking-rollups")
+    @click.option(
+        "--since",
+        type=click.DateTime(formats=["%Y-%m-%d"]),
+        help="Only rebuild days from this date on (default: all days)",
+    )
+    def rebuild_booking_rollups(since):
+        """Recompute the daily booking analytics rollups from the bookings table."""
+        from src.repositories.analytics_repo import AnalyticsRepository
+
+        written = AnalyticsRepository.rebuild(since=since.date() if since else None)
+        click.echo(f"Rebuilt {written} booking rollup row(s).")
+
     @app.cli.command("seed-db")
     def seed_database():
         """Seed database with sample data (development only)."""
@@ -331,6 +433,29 @@ def register_cli_commands(app: Flask) -> None:
         click.echo("Database seeding not yet implemented.")
 
 
+def register_scheduled_jobs(app: Flask) -> None:
+    """
+    Start periodic maintenance jobs in this process when configured.
+
+    BOOKING_COMPLETION_INTERVAL > 0 runs the booking completion sweep every N
+    seconds. Leave it at 0 when a cron job calls `flask complete-bookings`.
+    """
+    interval = app.config.get("BOOKING_COMPLETION_INTERVAL", 0)
+    if not interval or app.config.get("TESTING"):
+        return
+
+    from src.services.booking_service import COMPLETION_JOB, BookingService
+    from src.utils.scheduler import schedule_job
+
+    chunk_size = app.config.get("BOOKING_COMPLETION_CHUNK_SIZE", 500)
+    schedule_job(
+        app,
+        COMPLETION_JOB,
+        interval,
+        lambda: BookingService.complete_finished_bookings(chunk_size=chunk_size),
+    )
+
+
 # User loader for Flask-Login (required)
 @login_manager.user_loader
 def load_user(user_id: str):
@@ -41,6 +41,30 @@ class Config:
     # Pagination
     ITEMS_PER_PAGE: int = 20
 
+    # In-process caches (seconds / max entries per worker)
+    FACET_CACHE_TTL: int = 300
+    FACET_CACHE_SIZE: int = 128
+    SEARCH_CACHE_TTL: int = 120
+    SEARCH_CACHE_SIZE: int = 512
+    AVAILABILITY_RULES_CACHE_SIZE: int = 1024
+    BOOKING_STATS_CACHE_TTL: int = 30
+    PLATFORM_STATS_CACHE_TTL: int = 60
+    # Interval trees of approved bookings per resource (conflict pre-checks, free slots)
+    BOOKING_INTERVAL_CACHE_ENABLED: bool = (
+        os.environ.get("BOOKING_INTERVAL_CACHE_ENABLED", "false").lower() == "true"
+    )
+    BOOKING_INTERVAL_CACHE_DAYS: int = 60
+    BOOKING_INTERVAL_CACHE_SIZE: int = 256
+    BOOKING_INTERVAL_CACHE_TTL: int = 60
+
+    # iCalendar feeds (days before/after today included in each feed)
+    CALENDAR_FEED_PAST_DAYS: int = 30
+    CALENDAR_FEED_FUTURE_DAYS: int = 180
+
+    # Background jobs (seconds between runs; 0 disables the in-process scheduler)
+    BOOKING_COMPLETION_INTERVAL: int = int(os.environ.get("BOOKING_COMPLETION_INTERVAL", 0))
+    BOOKING_COMPLETION_CHUNK_SIZE: int = 500
+
     # Flask-Login
     REMEMBER_COOKIE_DURATION: int = 86400  # 1 day
     REMEMBER_COOKIE_SECURE: bool = False  # Set to True in production
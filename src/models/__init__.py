@@ -17,19 +17,29 @@ from src.app import db
 
 # Import all model classes
 from src.models.user import User
-from src.models.resource import Resource
-from src.models.booking import Booking
+from src.models.resource import Resource, ResourceTerm, TermTrigram
+from src.models.booking import Booking, BookingDailyRollup, BookingSeries, WaitlistEntry
 from src.models.message import Message, MessageThread
-from src.models.review import Review, ReviewAggregate
+from src.models.review import Review, ReviewAggregate, RatingSummary
+from src.models.cache_generation import CacheGeneration
+from src.models.job_run import JobRun
 
 # Export all models for easy importing
 __all__ = [
     "db",
     "User",
     "Resource",
+    "ResourceTerm",
+    "TermTrigram",
     "Booking",
+    "BookingSeries",
+    "WaitlistEntry",
+    "BookingDailyRollup",
     "Message",
     "MessageThread",
     "Review",
     "ReviewAggregate",
+    "RatingSummary",
+    "CacheGeneration",
+    "JobRun",
 ]
@@ -6,7 +6,7 @@ Per docs/ERD.md specifications and .clinerules architecture.
 """
 
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
 from src.app import db
 
@@ -32,6 +32,7 @@ class Booking(db.Model):
     Relationships:
         - resource: The resource being booked
         - requester: User who made the booking request
+        - series: Recurring series the booking was expanded from, if any
         - reviews: Optional review after booking completion
     """
 
@@ -61,6 +62,14 @@ class Booking(db.Model):
     # Booking Status
     status = db.Column(db.String(20), nullable=False, default="pending", index=True)
 
+    # Recurring series this occurrence belongs to (NULL for one-off bookings)
+    series_id = db.Column(
+        db.Integer,
+        db.ForeignKey("booking_series.series_id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
     # Timestamps
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(
@@ -72,6 +81,8 @@ class Booking(db.Model):
 
     requester = db.relationship("User", back_populates="bookings", foreign_keys=[requester_id])
 
+    series = db.relationship("BookingSeries", back_populates="bookings")
+
     # Note: Review relationship added in Review model (one-to-one)
 
     # Constraints
@@ -83,6 +94,29 @@ class Booking(db.Model):
         db.CheckConstraint("end_datetime > start_datetime", name="check_end_after_start"),
         # Composite index for efficient conflict detection queries
         db.Index("idx_bookings_resource_datetime", "resource_id", "start_datetime", "end_datetime"),
+        # Per-user tab listings (My Bookings) filter by status and sort by start
+        db.Index("idx_bookings_requester_status_start", "requester_id", "status", "start_datetime"),
+        # Conflict checks only look at approved bookings; the partial index
+        # skips pending/cancelled/rejected rows. Leading with status gives the
+        # conflict query one more seek term than idx_bookings_resource_datetime,
+        # so SQLite always prefers it, and interval scans are answered from the
+        # index alone
+        db.Index(
+            "idx_bookings_approved_window",
+            "status",
+            "resource_id",
+            "start_datetime",
+            "end_datetime",
+            sqlite_where=db.text("status = 'approved'"),
+            postgresql_where=db.text("status = 'approved'"),
+        ),
+        # Pending approval queue, oldest request first
+        db.Index(
+            "idx_bookings_pending_created",
+            "created_at",
+            sqlite_where=db.text("status = 'pending'"),
+            postgresql_where=db.text("status = 'pending'"),
+        ),
     )
 
     def __init__(
@@ -186,7 +220,8 @@ class Booking(db.Model):
         """
         Mark booking as completed.
 
-        This is typically called automatically after end_datetime passes.
+        Finished bookings are normally completed in bulk by
+        BookingService.complete_finished_bookings; this handles single bookings.
         Only approved bookings can be completed.
 
         Raises:
@@ -262,6 +297,7 @@ class Booking(db.Model):
             "start_datetime": self.start_datetime.isoformat() if self.start_datetime else None,
             "end_datetime": self.end_datetime.isoformat() if self.end_datetime else None,
             "status": self.status,
+            "series_id": self.series_id,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "duration_hours": self.get_duration_hours(),
@@ -281,3 +317,208 @@ class Booking(db.Model):
                 data["requester_email"] = self.requester.email
 
         return data
+
+
+class BookingSeries(db.Model):
+    """
+    Recurring booking series (RRULE-like daily/weekly pattern).
+
+    The series records the pattern it was created from; each accepted
+    occurrence is stored as an ordinary Booking with series_id set, so
+    conflict detection, approvals and cancellation work per occurrence.
+
+    Relationships:
+        - resource: The resource being booked
+        - requester: User who created the series
+        - bookings: Occurrences created from the series
+    """
+
+    __tablename__ = "booking_series"
+
+    FREQUENCIES = ("daily", "weekly")
+
+    series_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    resource_id = db.Column(
+        db.Integer,
+        db.ForeignKey("resources.resource_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    requester_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.user_id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
+    # Pattern: first occurrence, repeat frequency/interval and termination
+    start_datetime = db.Column(db.DateTime, nullable=False)
+    end_datetime = db.Column(db.DateTime, nullable=False)
+    frequency = db.Column(db.String(10), nullable=False, default="weekly")
+    interval = db.Column(db.Integer, nullable=False, default=1)
+    weekdays = db.Column(db.String(20), nullable=True)  # e.g. "1,3" (Monday = 0)
+    until = db.Column(db.Date, nullable=True)
+    count = db.Column(db.Integer, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    resource = db.relationship("Resource", foreign_keys=[resource_id])
+    requester = db.relationship("User", foreign_keys=[requester_id])
+    bookings = db.relationship("Booking", back_populates="series", passive_deletes=True)
+
+    __table_args__ = (
+        db.CheckConstraint(frequency.in_(FREQUENCIES), name="check_valid_series_frequency"),
+        db.CheckConstraint("interval >= 1", name="check_series_interval_positive"),
+        db.CheckConstraint("end_datetime > start_datetime", name="check_series_end_after_start"),
+    )
+
+    def get_weekdays(self) -> List[int]:
+        """Return the weekly pattern's weekdays (Monday = 0)."""
+        if not self.weekdays:
+            return []
+        return [int(day) for day in self.weekdays.split(",") if day.strip()]
+
+    def __repr__(self) -> str:
+        """String representation of BookingSeries."""
+        return (
+            f"<BookingSeries {self.series_id}: "
+            f"Resource={self.resource_id} {self.frequency}/{self.interval}>"
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert series to dictionary (for JSON responses)."""
+        return {
+            "series_id": self.series_id,
+            "resource_id": self.resource_id,
+            "requester_id": self.requester_id,
+            "start_datetime": self.start_datetime.isoformat(),
+            "end_datetime": self.end_datetime.isoformat(),
+            "frequency": self.frequency,
+            "interval": self.interval,
+            "weekdays": self.get_weekdays(),
+            "until": self.until.isoformat() if self.until else None,
+            "count": self.count,
+        }
+
+
+class WaitlistEntry(db.Model):
+    """
+    Queued request for a (resource, window) that is currently booked.
+
+    Status Workflow:
+        - waiting: Queued; eligible for promotion when an overlapping booking is freed
+        - promoted: Turned into a booking (booking_id set)
+        - cancelled: Withdrawn by the requester
+        - expired: Window started before a slot was freed
+
+    Entries are promoted first-come first-served among those that fit the
+    freed slot, looked up through idx_waitlist_resource_status_window rather
+    than by scanning the queue.
+
+    Relationships:
+        - resource: The resource being waited for
+        - requester: User waiting
+        - booking: Booking created on promotion
+    """
+
+    __tablename__ = "waitlist_entries"
+
+    STATUSES = ("waiting", "promoted", "cancelled", "expired")
+
+    entry_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    resource_id = db.Column(
+        db.Integer,
+        db.ForeignKey("resources.resource_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    requester_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.user_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    start_datetime = db.Column(db.DateTime, nullable=False)
+    end_datetime = db.Column(db.DateTime, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="waiting")
+    booking_id = db.Column(
+        db.Integer,
+        db.ForeignKey("bookings.booking_id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    promoted_at = db.Column(db.DateTime, nullable=True)
+
+    resource = db.relationship("Resource", foreign_keys=[resource_id])
+    requester = db.relationship("User", foreign_keys=[requester_id])
+    booking = db.relationship("Booking", foreign_keys=[booking_id])
+
+    __table_args__ = (
+        db.CheckConstraint(status.in_(STATUSES), name="check_valid_waitlist_status"),
+        db.CheckConstraint("end_datetime > start_datetime", name="check_waitlist_end_after_start"),
+        # Overlap lookups for a freed slot: resource + waiting, range on start
+        db.Index(
+            "idx_waitlist_resource_status_window",
+            "resource_id",
+            "status",
+            "start_datetime",
+            "end_datetime",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of WaitlistEntry."""
+        return f"<WaitlistEntry {self.entry_id}: Resource={self.resource_id} {self.status}>"
+
+    def to_dict(self) -> Dict:
+        """Convert entry to dictionary (for JSON responses)."""
+        return {
+            "entry_id": self.entry_id,
+            "resource_id": self.resource_id,
+            "requester_id": self.requester_id,
+            "start_datetime": self.start_datetime.isoformat(),
+            "end_datetime": self.end_datetime.isoformat(),
+            "status": self.status,
+            "booking_id": self.booking_id,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "promoted_at": self.promoted_at.isoformat() if self.promoted_at else None,
+        }
+
+
+class BookingDailyRollup(db.Model):
+    """
+    Per-day booking counts by resource and current booking status.
+
+    Maintained incrementally by AnalyticsRepository in the same transaction as
+    every booking insert, status/time change and delete, so analytics read
+    O(days x resources) rows instead of scanning bookings. Categories are
+    joined from resources when reading, so recategorizing a resource needs no
+    repair. `flask rebuild-booking-rollups` recomputes the rows (backfill).
+
+    resource_id deliberately has no foreign key: deltas for bookings deleted
+    together with their resource are applied after the resource row is gone.
+    Readers inner-join resources, so rows of deleted resources are ignored.
+
+    Columns:
+        - booking_count / booked_minutes: bookings *starting* on day (local time)
+        - created_count: bookings *created* on day (UTC)
+    """
+
+    __tablename__ = "booking_daily_rollups"
+
+    day = db.Column(db.Date, primary_key=True)
+    resource_id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(20), primary_key=True)
+    booking_count = db.Column(db.Integer, nullable=False, default=0)
+    booked_minutes = db.Column(db.Integer, nullable=False, default=0)
+    created_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        """String representation of BookingDailyRollup."""
+        return (
+            f"<BookingDailyRollup {self.day} resource={self.resource_id}/{self.status}: "
+            f"{self.booking_count} starting, {self.created_count} created>"
+        )
@@ -0,0 +1,106 @@
+"""
+Cache Generation Model - Campus Resource Hub
+Database-stored version counters for cross-process cache invalidation.
+
+A cache keys its entries by the current generation of the data it derives
+from. Writes that change that data bump the counter right after they commit,
+in a separate short transaction, so every worker stops serving entries
+computed from older data without writers queueing on the counter row.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Mapping
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from src.app import db
+from src.utils.sql import upsert
+
+
+class CacheGeneration(db.Model):
+    """
+    Named monotonically increasing generation counter.
+
+    Names:
+        - search: bumped on searchable resource, rating and approved-booking changes
+    """
+
+    __tablename__ = "cache_generations"
+
+    name = db.Column(db.String(50), primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    @staticmethod
+    def current(name: str) -> int:
+        """Return the committed generation for name (0 if never bumped)."""
+        value = db.session.execute(
+            select(CacheGeneration.generation).where(CacheGeneration.name == name)
+        ).scalar()
+        return value or 0
+
+    @staticmethod
+    def bump(name: str) -> None:
+        """
+        Increment the generation in its own short transaction (creates the row if missing).
+
+        Call after the write it reflects has committed, so the counter row is
+        never locked for the length of a writer's transaction.
+        """
+        table = CacheGeneration.__table__
+        now = datetime.utcnow()
+        with db.engine.begin() as connection:
+            upsert(
+                connection,
+                table,
+                {"name": name, "generation": 1, "updated_at": now},
+                ["name"],
+                {"generation": table.c.generation + 1, "updated_at": now},
+            )
+
+    def __repr__(self) -> str:
+        return f"<CacheGeneration {self.name}={self.generation}>"
+
+
+def bump_generation_on_write(
+    name: str, relevant: Mapping[type, Callable[[Any, Any, str], bool]]
+) -> None:
+    """
+    Bump the named generation after each commit that wrote relevant rows.
+
+    Mapper events flag the owning session when relevant(connection, target,
+    operation) is true; operation is "insert", "update" or "delete" and update
+    checks run before the UPDATE, so stored values are still readable. The bump
+    runs from after_commit in its own transaction; rolled-back writes discard
+    the flag.
+
+    Args:
+        name: Generation name
+        relevant: Map of ORM model class to its relevance check
+    """
+    flag = f"generation:{name}"
+
+    def _listener(check, operation):
+        def _mark_dirty(mapper, connection, target):
+            session = object_session(target)
+            if session is not None and not session.info.get(flag):
+                if check(connection, target, operation):
+                    session.info[flag] = True
+
+        return _mark_dirty
+
+    for model, check in relevant.items():
+        event.listen(model, "after_insert", _listener(check, "insert"))
+        event.listen(model, "before_update", _listener(check, "update"))
+        event.listen(model, "before_delete", _listener(check, "delete"))
+
+    def _after_commit(session):
+        if session.info.pop(flag, False):
+            CacheGeneration.bump(name)
+
+    def _after_soft_rollback(session, previous_transaction):
+        session.info.pop(flag, None)
+
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_soft_rollback", _after_soft_rollback)
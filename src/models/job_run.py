@@ -0,0 +1,52 @@
+"""
+Job Run Model - Campus Resource Hub
+Audit trail for periodic maintenance jobs.
+
+Each run of a background job (CLI or in-process scheduler) records when it ran
+and how many rows it changed, so admins can see that derived state such as
+booking completion is being kept up to date.
+"""
+
+from datetime import datetime
+from typing import Dict
+
+from src.app import db
+
+
+class JobRun(db.Model):
+    """
+    One execution of a named maintenance job.
+
+    Statuses:
+        - succeeded: Job finished; rows_affected is final
+        - failed: Job raised; rows_affected counts the chunks committed before the error
+    """
+
+    __tablename__ = "job_runs"
+
+    run_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    job_name = db.Column(db.String(50), nullable=False, index=True)
+    started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    rows_affected = db.Column(db.Integer, nullable=False, default=0)
+    status = db.Column(db.String(20), nullable=False, default="succeeded")
+    error = db.Column(db.Text, nullable=True)
+
+    __table_args__ = (
+        db.CheckConstraint("status IN ('succeeded', 'failed')", name="check_valid_job_run_status"),
+    )
+
+    def to_dict(self) -> Dict:
+        """Convert job run to dictionary for JSON serialization."""
+        return {
+            "run_id": self.run_id,
+            "job_name": self.job_name,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "rows_affected": self.rows_affected,
+            "status": self.status,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"<JobRun {self.job_name} #{self.run_id} {self.status} rows={self.rows_affected}>"
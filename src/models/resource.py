@@ -7,7 +7,11 @@ Per docs/ERD.md specifications and .clinerules architecture.
 
 from datetime import datetime
 from typing import Optional, Dict, List
+from weakref import WeakKeyDictionary
 import json
+import re
+
+from sqlalchemy import event, text
 
 from src.app import db
 
@@ -77,6 +81,10 @@ class Resource(db.Model):
         "Review", back_populates="resource", lazy="dynamic", cascade="all, delete-orphan"
     )
 
+    rating_summary = db.relationship(
+        "RatingSummary", back_populates="resource", uselist=False, cascade="all, delete-orphan"
+    )
+
     # Constraints
     CATEGORY_CHOICES = ("study_room", "equipment", "lab", "space", "tutoring")
     CATEGORY_ALIASES = {
@@ -94,6 +102,13 @@ class Resource(db.Model):
         "space": "space",
         "tutoring": "tutoring",
     }
+    CATEGORY_LABELS = {
+        "study_room": "Study Room",
+        "equipment": "Equipment",
+        "lab": "Lab / Workshop",
+        "space": "Event Space",
+        "tutoring": "Tutoring / Mentoring",
+    }
 
     __table_args__ = (
         db.CheckConstraint(
@@ -233,6 +248,14 @@ class Resource(db.Model):
         """Check if resource is published and visible."""
         return self.status == "published"
 
+    def is_visible_to(self, user) -> bool:
+        """Check if a user may view the resource (unpublished: owner and admin/staff only)."""
+        if self.is_published():
+            return True
+        return bool(user is not None and user.is_authenticated) and (
+            user.user_id == self.owner_id or user.role in ["admin", "staff"]
+        )
+
     def is_draft(self) -> bool:
         """Check if resource is in draft status."""
         return self.status == "draft"
@@ -258,21 +281,20 @@ class Resource(db.Model):
 
     def get_average_rating(self) -> Optional[float]:
         """
-        Calculate average rating from reviews.
+        Get average rating of visible reviews from the persisted summary.
 
         Returns:
             Average rating (1-5) or None if no reviews
         """
-        reviews_list = self.reviews.all()
-        if not reviews_list:
+        if not self.rating_summary:
             return None
-
-        total = sum(review.rating for review in reviews_list)
-        return round(total / len(reviews_list), 1)
+        return self.rating_summary.get_average_rating()
 
     def get_review_count(self) -> int:
-        """Get total number of reviews."""
-        return self.reviews.count()
+        """Get number of visible reviews from the persisted summary."""
+        if not self.rating_summary:
+            return 0
+        return self.rating_summary.review_count
 
     def get_booking_count(self) -> int:
         """Get total number of bookings (all statuses)."""
@@ -314,3 +336,149 @@ class Resource(db.Model):
             data["booking_count"] = self.get_booking_count()
 
         return data
+
+
+# --------------------------------------------------------------------------- #
+# Full-text search index (SQLite FTS5)
+# --------------------------------------------------------------------------- #
+
+RESOURCE_FTS_TABLE = "resources_fts"
+
+# Whether the FTS index exists, per engine. Looked up once by
+# ResourceRepository.fts_enabled, then kept current by create/drop below.
+FTS_INDEX_STATE: "WeakKeyDictionary" = WeakKeyDictionary()
+
+# External-content FTS5 table mirroring title/description/location. Triggers keep
+# it in sync with every INSERT/UPDATE/DELETE on resources, regardless of code path.
+RESOURCE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS resources_fts USING fts5("
+    "title, description, location, "
+    "content='resources', content_rowid='resource_id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS resources_fts_ai AFTER INSERT ON resources BEGIN "
+    "INSERT INTO resources_fts(rowid, title, description, location) "
+    "VALUES (new.resource_id, new.title, new.description, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS resources_fts_ad AFTER DELETE ON resources BEGIN "
+    "INSERT INTO resources_fts(resources_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.resource_id, old.title, old.description, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS resources_fts_au "
+    "AFTER UPDATE OF title, description, location ON resources BEGIN "
+    "INSERT INTO resources_fts(resources_fts, rowid, title, description, location) "
+    "VALUES ('delete', old.resource_id, old.title, old.description, old.location); "
+    "INSERT INTO resources_fts(rowid, title, description, location) "
+    "VALUES (new.resource_id, new.title, new.description, new.location); END",
+)
+
+
+def fts5_available(connection) -> bool:
+    """Return True when the connection is SQLite compiled with FTS5."""
+    if connection.dialect.name != "sqlite":
+        return False
+    return bool(
+        connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar()
+    )
+
+
+def create_resource_fts(connection) -> bool:
+    """
+    Create the FTS5 index and sync triggers (idempotent) and rebuild its contents.
+
+    Returns:
+        True if the index exists afterwards, False on dialects without FTS5
+    """
+    if not fts5_available(connection):
+        return False
+    for statement in RESOURCE_FTS_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("INSERT INTO resources_fts(resources_fts) VALUES ('rebuild')"))
+    FTS_INDEX_STATE[connection.engine] = True
+    return True
+
+
+@event.listens_for(Resource.__table__, "after_create")
+def _create_resource_fts(target, connection, **kw) -> None:
+    """Create the FTS index alongside the resources table (db.create_all)."""
+    create_resource_fts(connection)
+
+
+@event.listens_for(Resource.__table__, "before_drop")
+def _drop_resource_fts(target, connection, **kw) -> None:
+    """Drop the FTS index before the resources table (db.drop_all)."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS resources_fts"))
+        FTS_INDEX_STATE.pop(connection.engine, None)
+
+
+# --------------------------------------------------------------------------- #
+# Trigram index (typo-tolerant matching)
+# --------------------------------------------------------------------------- #
+
+# Terms longer than this are truncated before indexing
+MAX_TERM_LENGTH = 32
+
+
+def search_terms(text_value: Optional[str]) -> List[str]:
+    """Split text into distinct lowercase word terms (order preserved)."""
+    seen: Dict[str, None] = {}
+    for term in re.findall(r"\w+", (text_value or "").lower()):
+        seen.setdefault(term[:MAX_TERM_LENGTH], None)
+    return list(seen)
+
+
+def term_trigrams(term: str) -> List[str]:
+    """
+    Return the distinct padded trigrams of a term (pg_trgm style).
+
+    "lab" -> ["  l", " la", "lab", "ab "]
+    """
+    padded = f"  {term} "
+    return list(dict.fromkeys(padded[i : i + 3] for i in range(len(padded) - 2)))
+
+
+class ResourceTerm(db.Model):
+    """
+    One indexed term (word) of a resource's title, location or category label.
+
+    The primary key leads with term, so resolving matched terms to resources is
+    an index seek.
+    """
+
+    __tablename__ = "resource_terms"
+
+    term = db.Column(db.String(MAX_TERM_LENGTH), primary_key=True)
+    resource_id = db.Column(
+        db.Integer,
+        db.ForeignKey("resources.resource_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    __table_args__ = (db.Index("idx_resource_terms_resource", "resource_id"),)
+
+    @staticmethod
+    def terms_for(resource: "Resource") -> List[str]:
+        """Return the terms indexed for a resource."""
+        label = Resource.CATEGORY_LABELS.get(resource.category, resource.category)
+        return search_terms(" ".join(filter(None, [resource.title, resource.location, label])))
+
+    def __repr__(self) -> str:
+        return f"<ResourceTerm {self.term} -> {self.resource_id}>"
+
+
+class TermTrigram(db.Model):
+    """
+    Trigram posting for a distinct indexed term (the fuzzy-match vocabulary).
+
+    Postings are per distinct term rather than per resource, so a misspelled
+    query word is matched against the vocabulary without touching resource rows.
+    Terms no longer used by any resource are harmless and dropped on rebuild.
+    """
+
+    __tablename__ = "term_trigrams"
+
+    trigram = db.Column(db.String(3), primary_key=True)
+    term = db.Column(db.String(MAX_TERM_LENGTH), primary_key=True)
+
+    __table_args__ = (db.Index("idx_term_trigrams_term", "term"),)
+
+    def __repr__(self) -> str:
+        return f"<TermTrigram {self.trigram!r} -> {self.term}>"
@@ -269,6 +269,79 @@ class Review(db.Model):
         return data
 
 
+class RatingSummary(db.Model):
+    """
+    Persisted per-resource rating aggregate (visible reviews only).
+
+    Maintained incrementally by ReviewRepository inside the same transaction
+    as each review create/update/delete/hide/unhide, so rating reads are a
+    single primary-key lookup instead of a scan over every review.
+
+    Columns:
+        - review_count / rating_sum: running totals for the average
+        - rating_1 .. rating_5: histogram of star ratings
+    """
+
+    __tablename__ = "rating_summaries"
+
+    resource_id = db.Column(
+        db.Integer,
+        db.ForeignKey("resources.resource_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    resource = db.relationship("Resource", back_populates="rating_summary")
+
+    __table_args__ = (
+        db.CheckConstraint("review_count >= 0", name="check_summary_count_non_negative"),
+    )
+
+    def __init__(self, resource_id: int):
+        """
+        Initialize an empty summary for a resource.
+
+        Args:
+            resource_id: ID of resource being summarized
+        """
+        self.resource_id = resource_id
+        self.review_count = 0
+        self.rating_sum = 0
+        for rating in range(1, 6):
+            setattr(self, f"rating_{rating}", 0)
+
+    def get_average_rating(self) -> Optional[float]:
+        """Average rating rounded to one decimal, or None without reviews."""
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 1)
+
+    def get_rating_distribution(self) -> Dict[int, int]:
+        """
+        Get count of reviews for each rating level.
+
+        Returns:
+            Dict like {5: 10, 4: 5, 3: 2, 2: 1, 1: 0}
+        """
+        return {rating: getattr(self, f"rating_{rating}") or 0 for rating in range(1, 6)}
+
+    def __repr__(self) -> str:
+        """String representation of RatingSummary."""
+        return (
+            f"<RatingSummary Resource={self.resource_id}: "
+            f"{self.review_count} reviews, avg={self.get_average_rating()}>"
+        )
+
+
 class ReviewAggregate:
     """
     Helper class for calculating review statistics.
@@ -5,6 +5,7 @@ Defines the User entity for authentication and RBAC.
 Per docs/ERD.md specifications and .clinerules architecture.
 """
 
+import secrets
 from datetime import datetime
 from typing import Optional
 from flask_login import UserMixin
@@ -53,6 +54,9 @@ class User(UserMixin, db.Model):
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     suspended_at = db.Column(db.DateTime, nullable=True)
 
+    # Calendar feed token nonce (rotating it revokes previously issued feed URLs)
+    calendar_feed_nonce = db.Column(db.String(32), nullable=True)
+
     # Relationships (defined with lazy='dynamic' for query efficiency)
     resources = db.relationship(
         "Resource", back_populates="owner", lazy="dynamic", foreign_keys="Resource.owner_id"
@@ -165,6 +169,10 @@ class User(UserMixin, db.Model):
         self.is_active = True
         self.suspended_at = None
 
+    def rotate_calendar_feed_nonce(self) -> None:
+        """Replace the calendar feed nonce, invalidating existing feed URLs."""
+        self.calendar_feed_nonce = secrets.token_urlsafe(16)
+
     # Flask-Login required methods
     def get_id(self) -> str:
         """Return user ID as string for Flask-Login."""
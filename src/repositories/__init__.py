@@ -10,6 +10,9 @@ from src.repositories.resource_repo import ResourceRepository
 from src.repositories.booking_repo import BookingRepository
 from src.repositories.message_repo import MessageRepository
 from src.repositories.review_repo import ReviewRepository
+from src.repositories.job_run_repo import JobRunRepository
+from src.repositories.waitlist_repo import WaitlistRepository
+from src.repositories.analytics_repo import AnalyticsRepository
 
 __all__ = [
     "UserRepository",
@@ -17,4 +20,7 @@ __all__ = [
     "BookingRepository",
     "MessageRepository",
     "ReviewRepository",
+    "JobRunRepository",
+    "WaitlistRepository",
+    "AnalyticsRepository",
 ]
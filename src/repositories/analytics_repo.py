@@ -0,0 +1,286 @@
+"""
+Analytics Repository - Campus Resource Hub
+Data Access Layer for BookingDailyRollup.
+
+Per .clinerules: All database operations encapsulated in repositories.
+
+Every booking contributes to two rollup rows of its resource and its current
+status: booking_count/booked_minutes on the day it starts, and created_count
+on the day it was created. Each booking write applies the difference between
+the old and new contribution inside the writing transaction:
+- ORM writes through the mapper events registered at the end of this module
+  (collected per flush, applied in one pass after it)
+- Core/bulk writes in BookingRepository through apply_rows/apply_for_bookings
+
+Readers join resources for the current category, so recategorizing a resource
+or deleting it with its bookings needs no repair.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import event, func, inspect, or_, select, update
+from sqlalchemy.orm import Session, object_session
+
+from src.models import db, Booking, BookingDailyRollup, Resource
+from src.utils.sql import stored_values, upsert
+
+
+# (day, resource_id, status) -> [booking_count, booked_minutes, created_count]
+Deltas = Dict[Tuple[date, int, str], List[int]]
+
+_PENDING_KEY = "analytics:booking_rollup_deltas"
+_TRACKED = ("resource_id", "start_datetime", "end_datetime", "status")
+
+
+class AnalyticsRepository:
+    """Repository for incrementally maintained booking rollups."""
+
+    @staticmethod
+    def apply_rows(rows: Iterable[Mapping], sign: int = 1) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) the contribution of booking rows.
+
+        For writes that bypass mapper events. Does not commit.
+
+        Args:
+            rows: Mappings with resource_id, start_datetime, end_datetime,
+                status and created_at
+            sign: 1 to add, -1 to remove
+        """
+        deltas = _new_deltas()
+        for row in rows:
+            _contribute(deltas, row, sign)
+        _apply(db.session.connection(), deltas)
+
+    @staticmethod
+    def apply_for_bookings(booking_ids: Sequence[int], sign: int = 1) -> None:
+        """
+        Add or remove the stored contribution of bookings, by ID.
+
+        Call with sign=-1 before and sign=1 after a Core UPDATE of those rows;
+        rows the UPDATE did not change cancel out. Does not commit.
+        """
+        if not booking_ids:
+            return
+        rows = db.session.execute(
+            select(*[getattr(Booking, name) for name in _TRACKED], Booking.created_at).where(
+                Booking.booking_id.in_(list(booking_ids))
+            )
+        ).mappings()
+        AnalyticsRepository.apply_rows(rows, sign)
+
+    @staticmethod
+    def rebuild(since: Optional[date] = None) -> int:
+        """
+        Recompute rollups from the bookings table (backfill/repair) and commit.
+
+        Args:
+            since: Only rebuild days from this date on (default: every day)
+
+        Returns:
+            Number of rollup rows written
+        """
+        query = db.session.query(*[getattr(Booking, name) for name in _TRACKED], Booking.created_at)
+        if since is not None:
+            since_dt = datetime.combine(since, time.min)
+            query = query.filter(
+                or_(Booking.start_datetime >= since_dt, Booking.created_at >= since_dt)
+            )
+
+        deltas = _new_deltas()
+        for row in query.yield_per(1000):
+            _contribute(deltas, row._mapping, 1, since=since)
+
+        stale = BookingDailyRollup.query
+        if since is not None:
+            stale = stale.filter(BookingDailyRollup.day >= since)
+        stale.delete(synchronize_session=False)
+        written = _apply(db.session.connection(), deltas)
+        db.session.commit()
+        return written
+
+    @staticmethod
+    def get_daily_counts(start_day: date, end_day: date) -> Dict[date, int]:
+        """Get the number of bookings starting on each day in [start_day, end_day]."""
+        rows = (
+            _rollups_of_existing_resources(
+                BookingDailyRollup.day, func.sum(BookingDailyRollup.booking_count)
+            )
+            .filter(BookingDailyRollup.day.between(start_day, end_day))
+            .group_by(BookingDailyRollup.day)
+            .all()
+        )
+        return {day: int(count or 0) for day, count in rows}
+
+    @staticmethod
+    def get_created_by_status(since: Optional[date] = None) -> Dict[str, int]:
+        """Get bookings created on or after since, by current status."""
+        query = _rollups_of_existing_resources(
+            BookingDailyRollup.status, func.sum(BookingDailyRollup.created_count)
+        )
+        if since is not None:
+            query = query.filter(BookingDailyRollup.day >= since)
+        rows = query.group_by(BookingDailyRollup.status).all()
+        return {status: int(count) for status, count in rows if count}
+
+    @staticmethod
+    def get_created_by_category(
+        statuses: Sequence[str], since: Optional[date] = None, limit: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """Get (category, count) of bookings created on or after since, most first."""
+        total = func.sum(BookingDailyRollup.created_count)
+        query = _rollups_of_existing_resources(Resource.category, total).filter(
+            BookingDailyRollup.status.in_(list(statuses))
+        )
+        if since is not None:
+            query = query.filter(BookingDailyRollup.day >= since)
+        query = query.group_by(Resource.category).having(total > 0)
+        query = query.order_by(total.desc(), Resource.category)
+        if limit:
+            query = query.limit(limit)
+        return [(category, int(count)) for category, count in query.all()]
+
+
+def _rollups_of_existing_resources(*columns):
+    """Rollup query joined to resources (drops rows of deleted resources)."""
+    return db.session.query(*columns).join(
+        Resource, Resource.resource_id == BookingDailyRollup.resource_id
+    )
+
+
+def _new_deltas() -> Deltas:
+    return defaultdict(lambda: [0, 0, 0])
+
+
+def _contribute(deltas: Deltas, row: Mapping, sign: int, since: Optional[date] = None) -> None:
+    """Add sign times one booking's contribution (days before since are skipped)."""
+    start, end = row["start_datetime"], row["end_datetime"]
+    start_day = start.date()
+    if since is None or start_day >= since:
+        entry = deltas[(start_day, row["resource_id"], row["status"])]
+        entry[0] += sign
+        entry[1] += sign * int((end - start).total_seconds() // 60)
+    created = row["created_at"]
+    if created is not None and (since is None or created.date() >= since):
+        deltas[(created.date(), row["resource_id"], row["status"])][2] += sign
+
+
+def _apply(connection, deltas: Deltas) -> int:
+    """
+    Apply deltas with one atomic statement per rollup row.
+
+    Rows gaining anything are upserted (INSERT ... ON CONFLICT DO UPDATE), so
+    concurrent writers creating the same day's row cannot collide; pure
+    decrements are plain UPDATEs, so no row is created for days that were not
+    backfilled yet and counts never start negative.
+
+    Returns:
+        Number of rollup rows touched
+    """
+    table = BookingDailyRollup.__table__
+    now = datetime.utcnow()
+    touched = 0
+    for (day, resource_id, status), (count, minutes, created) in deltas.items():
+        if not (count or minutes or created):
+            continue
+        touched += 1
+        changes = {
+            "booking_count": table.c.booking_count + count,
+            "booked_minutes": table.c.booked_minutes + minutes,
+            "created_count": table.c.created_count + created,
+            "updated_at": now,
+        }
+        if max(count, minutes, created) <= 0:
+            connection.execute(
+                update(table)
+                .where(
+                    table.c.day == day,
+                    table.c.resource_id == resource_id,
+                    table.c.status == status,
+                )
+                .values(changes)
+            )
+            continue
+        upsert(
+            connection,
+            table,
+            {
+                "day": day,
+                "resource_id": resource_id,
+                "status": status,
+                "booking_count": max(count, 0),
+                "booked_minutes": max(minutes, 0),
+                "created_count": max(created, 0),
+                "updated_at": now,
+            },
+            ["day", "resource_id", "status"],
+            changes,
+        )
+    return touched
+
+
+# Incremental maintenance for ORM writes
+
+
+def _pending(target) -> Optional[Deltas]:
+    session = object_session(target)
+    if session is None:
+        return None
+    return session.info.setdefault(_PENDING_KEY, _new_deltas())
+
+
+def _current(target) -> Dict:
+    values = {name: getattr(target, name) for name in _TRACKED}
+    values["created_at"] = target.created_at
+    return values
+
+
+def _after_insert(mapper, connection, target):
+    deltas = _pending(target)
+    if deltas is not None:
+        _contribute(deltas, _current(target), 1)
+
+
+def _before_update(mapper, connection, target):
+    # Before the UPDATE, so values whose old state was never loaded can still
+    # be read from the row
+    state = inspect(target)
+    if not any(state.attrs[name].history.has_changes() for name in _TRACKED):
+        return
+    deltas = _pending(target)
+    if deltas is None:
+        return
+    old = stored_values(connection, target, _TRACKED + ("created_at",))
+    new = dict(old)
+    for name in _TRACKED:
+        history = state.attrs[name].history
+        if history.added:
+            new[name] = history.added[0]
+    _contribute(deltas, old, -1)
+    _contribute(deltas, new, 1)
+
+
+def _before_delete(mapper, connection, target):
+    # Before the DELETE, so expired attributes can still be loaded
+    deltas = _pending(target)
+    if deltas is not None:
+        _contribute(deltas, _current(target), -1)
+
+
+def _after_flush(session, flush_context):
+    deltas = session.info.pop(_PENDING_KEY, None)
+    if deltas:
+        _apply(session.connection(), deltas)
+
+
+def _after_soft_rollback(session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Booking, "after_insert", _after_insert)
+event.listen(Booking, "before_update", _before_update)
+event.listen(Booking, "before_delete", _before_delete)
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "after_soft_rollback", _after_soft_rollback)
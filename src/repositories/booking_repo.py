@@ -6,9 +6,31 @@ Per .clinerules: All database operations encapsulated in repositories.
 Includes conflict detection queries.
 """
 
-from typing import List, Optional, Dict, Sequence
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Sequence
 from datetime import datetime, date, time
-from src.models import db, Booking
+
+from sqlalchemy import and_, case, func, or_, select, update
+
+from src.models import db, Booking, BookingSeries, Resource
+from src.repositories.analytics_repo import AnalyticsRepository
+
+
+# My Bookings tabs; every booking belongs to exactly one
+REQUESTER_TABS = ("upcoming", "pending", "past", "cancelled")
+
+
+def _status_filter(statuses: Sequence[str]):
+    """
+    Status clause for a list of statuses.
+
+    A single status is compared with "=" so SQLite can match it against the
+    partial indexes (idx_bookings_approved_window); it never does for IN.
+    """
+    statuses = list(statuses)
+    if len(statuses) == 1:
+        return Booking.status == statuses[0]
+    return Booking.status.in_(statuses)
 
 
 class BookingRepository:
@@ -34,6 +56,95 @@ class BookingRepository:
         db.session.commit()
         return booking
 
+    @staticmethod
+    def create_many(
+        resource_id: int,
+        requester_id: int,
+        windows: Sequence[tuple],
+        status: str = "pending",
+        series_id: Optional[int] = None,
+    ) -> List[Booking]:
+        """
+        Add one booking per (start, end) window in a single flush.
+
+        Does not commit, so the caller controls the transaction (e.g. inside
+        resource_write_lock).
+        """
+        bookings = []
+        for start_datetime, end_datetime in windows:
+            booking = Booking(
+                resource_id=resource_id,
+                requester_id=requester_id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                status=status,
+            )
+            booking.series_id = series_id
+            bookings.append(booking)
+        db.session.add_all(bookings)
+        db.session.flush()
+        return bookings
+
+    @staticmethod
+    def bulk_insert(rows: Sequence[Dict], batch_size: int = 500) -> int:
+        """
+        Insert booking rows (dicts of column values) with bulk_insert_mappings.
+
+        Bypasses the ORM unit of work and mapper events, so callers must handle
+        any cache invalidation (booking rollups are updated here). Does not
+        commit.
+
+        Returns:
+            Number of rows inserted
+        """
+        now = datetime.utcnow()
+        for offset in range(0, len(rows), batch_size):
+            batch = [
+                {"created_at": now, "updated_at": now, **row}
+                for row in rows[offset : offset + batch_size]
+            ]
+            db.session.execute(Booking.__table__.insert(), batch)
+            AnalyticsRepository.apply_rows(batch)
+        return len(rows)
+
+    @staticmethod
+    def complete_finished_chunk(cutoff: datetime, limit: int = 500) -> int:
+        """
+        Mark up to limit approved bookings that ended at or before cutoff as completed.
+
+        Runs as a single set-based UPDATE over the lowest matching booking IDs.
+        Bypasses mapper events, so callers must handle any cache invalidation
+        (booking rollups are updated here). Does not commit.
+
+        Returns:
+            Number of rows changed (0 once nothing is left to complete)
+        """
+        chunk = db.session.scalars(
+            select(Booking.booking_id)
+            .where(Booking.status == "approved", Booking.end_datetime <= cutoff)
+            .order_by(Booking.booking_id)
+            .limit(limit)
+        ).all()
+        if not chunk:
+            return 0
+        AnalyticsRepository.apply_for_bookings(chunk, -1)
+        result = db.session.execute(
+            update(Booking)
+            .where(Booking.booking_id.in_(chunk), Booking.status == "approved")
+            .values(status="completed", updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        AnalyticsRepository.apply_for_bookings(chunk, 1)
+        return result.rowcount
+
+    @staticmethod
+    def create_series(**fields) -> BookingSeries:
+        """Add a BookingSeries and flush to assign its ID (caller commits)."""
+        series = BookingSeries(**fields)
+        db.session.add(series)
+        db.session.flush()
+        return series
+
     @staticmethod
     def get_by_id(booking_id: int) -> Optional[Booking]:
         """Get booking by ID."""
@@ -102,6 +213,63 @@ class BookingRepository:
 
         return query.all()
 
+    @staticmethod
+    def lock_resource(resource_id: int) -> None:
+        """Take the booking write lock for one resource (see lock_resources)."""
+        BookingRepository.lock_resources([resource_id])
+
+    @staticmethod
+    def lock_resources(resource_ids: Sequence[int]) -> None:
+        """
+        Take the booking write lock for resources until the transaction ends.
+
+        SQLite only has a database-wide write lock, so the transaction is started
+        with BEGIN IMMEDIATE; concurrent writers wait on the busy timeout instead
+        of both reading a stale "no conflict" answer. Other databases row-lock the
+        resource with SELECT ... FOR UPDATE, so different resources never wait
+        on each other. Rows are locked in ID order so multi-resource writers
+        cannot deadlock.
+
+        Anything loaded before the lock may be stale, so the session is expired.
+        """
+        connection = db.session.connection()
+        if connection.dialect.name == "sqlite":
+            # pysqlite only opens a transaction before DML; if one is already open
+            # this connection holds the write lock already
+            if not connection.connection.driver_connection.in_transaction:
+                connection.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            db.session.execute(
+                select(Resource.resource_id)
+                .where(Resource.resource_id.in_(sorted(set(resource_ids))))
+                .order_by(Resource.resource_id)
+                .with_for_update()
+            )
+        db.session.expire_all()
+
+    @staticmethod
+    @contextmanager
+    def resource_write_lock(*resource_ids: int) -> Iterator[None]:
+        """
+        Run a block as one serialized unit per resource (one or more).
+
+        Conflict checks and writes inside the block cannot interleave with another
+        writer booking the same resource. The block commits on success and rolls
+        back (releasing the lock) on any exception.
+
+        Example:
+            >>> with BookingRepository.resource_write_lock(resource_id):
+            ...     if not BookingRepository.find_conflicts(resource_id, start, end):
+            ...         BookingRepository.create(resource_id, user_id, start, end)
+        """
+        BookingRepository.lock_resources(resource_ids)
+        try:
+            yield
+            db.session.commit()
+        except BaseException:
+            db.session.rollback()
+            raise
+
     @staticmethod
     def has_conflict(
         resource_id: int,
@@ -136,6 +304,38 @@ class BookingRepository:
         db.session.commit()
         return booking
 
+    @staticmethod
+    def get_by_ids(booking_ids: Sequence[int]) -> List[Booking]:
+        """Get bookings by ID in one query (missing IDs are omitted)."""
+        if not booking_ids:
+            return []
+        return Booking.query.filter(Booking.booking_id.in_(list(booking_ids))).all()
+
+    @staticmethod
+    def bulk_update_status(
+        booking_ids: Sequence[int], status: str, from_status: str = "pending"
+    ) -> int:
+        """
+        Move bookings still in from_status to status with one UPDATE.
+
+        Bypasses mapper events, so callers must handle any cache invalidation
+        (booking rollups are updated here). Does not commit.
+
+        Returns:
+            Number of rows changed
+        """
+        if not booking_ids:
+            return 0
+        AnalyticsRepository.apply_for_bookings(booking_ids, -1)
+        result = db.session.execute(
+            update(Booking)
+            .where(Booking.booking_id.in_(list(booking_ids)), Booking.status == from_status)
+            .values(status=status, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        AnalyticsRepository.apply_for_bookings(booking_ids, 1)
+        return result.rowcount
+
     @staticmethod
     def update_status(booking_id: int, status: str) -> Optional[Booking]:
         """Update only the booking status."""
@@ -210,6 +410,48 @@ class BookingRepository:
             query = query.filter_by(status=status)
         return query.order_by(Booking.start_datetime.desc()).all()
 
+    @staticmethod
+    def get_intervals_in_range(
+        resource_ids: Sequence[int],
+        start_datetime: datetime,
+        end_datetime: datetime,
+        statuses: Optional[Sequence[str]] = None,
+        with_ids: bool = False,
+    ) -> List[tuple]:
+        """
+        Get (resource_id, start, end) rows of bookings overlapping a window.
+
+        Selects only the three columns for many resources at once, ordered by
+        resource then start time, so callers can build grids without loading
+        full Booking objects.
+
+        Args:
+            resource_ids: Resources to include
+            start_datetime: Window start
+            end_datetime: Window end
+            statuses: Optional list of statuses to include
+            with_ids: Prefix each row with booking_id
+                ((booking_id, resource_id, start, end))
+        """
+        if not resource_ids:
+            return []
+
+        columns = [Booking.resource_id, Booking.start_datetime, Booking.end_datetime]
+        if with_ids:
+            columns.insert(0, Booking.booking_id)
+        query = db.session.query(*columns).filter(
+            Booking.resource_id.in_(list(resource_ids)),
+            Booking.start_datetime < end_datetime,
+            Booking.end_datetime > start_datetime,
+        )
+
+        if statuses:
+            query = query.filter(_status_filter(statuses))
+
+        return [
+            tuple(row) for row in query.order_by(Booking.resource_id, Booking.start_datetime).all()
+        ]
+
     @staticmethod
     def get_for_day(
         resource_id: int,
@@ -226,15 +468,32 @@ class BookingRepository:
         """
         start_dt = datetime.combine(day, time.min)
         end_dt = datetime.combine(day, time.max)
+        return BookingRepository.get_in_range(resource_id, start_dt, end_dt, statuses)
 
+    @staticmethod
+    def get_in_range(
+        resource_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[Booking]:
+        """
+        Get bookings for a resource overlapping [start_datetime, end_datetime), by start time.
+
+        Args:
+            resource_id: Resource identifier
+            start_datetime: Range start
+            end_datetime: Range end
+            statuses: Optional list of statuses to include
+        """
         query = Booking.query.filter(
             Booking.resource_id == resource_id,
-            Booking.start_datetime < end_dt,
-            Booking.end_datetime > start_dt,
+            Booking.start_datetime < end_datetime,
+            Booking.end_datetime > start_datetime,
         )
 
         if statuses:
-            query = query.filter(Booking.status.in_(statuses))
+            query = query.filter(_status_filter(statuses))
 
         return query.order_by(Booking.start_datetime.asc()).all()
 
@@ -246,6 +505,163 @@ class BookingRepository:
             query = query.filter_by(status=status)
         return query.order_by(Booking.start_datetime.desc()).all()
 
+    @staticmethod
+    def count_requester_tabs(requester_id: int, now: datetime) -> Dict[str, int]:
+        """
+        Count a user's bookings per My Bookings tab with one GROUP BY.
+
+        Returns:
+            {tab: count} for every tab in REQUESTER_TABS (missing tabs are 0)
+        """
+        tab = case(
+            (Booking.status.in_(["cancelled", "rejected"]), "cancelled"),
+            (or_(Booking.status == "completed", Booking.end_datetime < now), "past"),
+            (Booking.status == "approved", "upcoming"),
+            else_="pending",
+        ).label("tab")
+        rows = (
+            db.session.query(tab, func.count(Booking.booking_id))
+            .filter(Booking.requester_id == requester_id)
+            .group_by(tab)
+            .all()
+        )
+        counts = {name: 0 for name in REQUESTER_TABS}
+        counts.update({name: count for name, count in rows})
+        return counts
+
+    @staticmethod
+    def get_requester_tab(
+        requester_id: int,
+        tab: str,
+        now: datetime,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> List[tuple]:
+        """
+        Get one page of a user's bookings for a My Bookings tab.
+
+        Each tab is its own query on (requester_id, status, start_datetime), so
+        only the visible page is loaded. Pair with count_requester_tabs for
+        totals, which uses the same tab definitions:
+            - upcoming: approved and not yet ended, soonest first
+            - pending: pending and not yet ended, soonest first
+            - past: completed, or approved/pending and ended, latest first
+            - cancelled: cancelled or rejected, most recently requested first
+
+        Returns:
+            List of (Booking, Resource) tuples
+
+        Raises:
+            ValueError: If tab is not in REQUESTER_TABS
+        """
+        if tab == "upcoming":
+            condition = and_(Booking.status == "approved", Booking.end_datetime >= now)
+            order = (Booking.start_datetime.asc(), Booking.booking_id.asc())
+        elif tab == "pending":
+            condition = and_(Booking.status == "pending", Booking.end_datetime >= now)
+            order = (Booking.start_datetime.asc(), Booking.booking_id.asc())
+        elif tab == "past":
+            condition = or_(
+                Booking.status == "completed",
+                and_(Booking.status.in_(["approved", "pending"]), Booking.end_datetime < now),
+            )
+            order = (Booking.start_datetime.desc(), Booking.booking_id.desc())
+        elif tab == "cancelled":
+            condition = Booking.status.in_(["cancelled", "rejected"])
+            order = (Booking.created_at.desc(), Booking.booking_id.desc())
+        else:
+            raise ValueError(f"Unknown bookings tab: {tab}")
+
+        return [
+            tuple(row)
+            for row in db.session.query(Booking, Resource)
+            .join(Resource, Booking.resource_id == Resource.resource_id)
+            .filter(Booking.requester_id == requester_id, condition)
+            .order_by(*order)
+            .limit(per_page)
+            .offset((max(page, 1) - 1) * per_page)
+            .all()
+        ]
+
+    @staticmethod
+    def _feed_filter(
+        start_datetime: datetime,
+        end_datetime: datetime,
+        statuses: Sequence[str],
+        resource_id: Optional[int] = None,
+        requester_id: Optional[int] = None,
+    ) -> list:
+        """Filter clauses shared by the calendar feed fingerprint and rows."""
+        clauses = [
+            _status_filter(statuses),
+            Booking.start_datetime < end_datetime,
+            Booking.end_datetime > start_datetime,
+        ]
+        if resource_id is not None:
+            clauses.append(Booking.resource_id == resource_id)
+        if requester_id is not None:
+            clauses.append(Booking.requester_id == requester_id)
+        return clauses
+
+    @staticmethod
+    def get_feed_fingerprint(
+        start_datetime: datetime,
+        end_datetime: datetime,
+        statuses: Sequence[str],
+        resource_id: Optional[int] = None,
+        requester_id: Optional[int] = None,
+    ) -> tuple:
+        """
+        Get (max updated_at, row count, max resource updated_at) of a calendar feed.
+
+        One aggregate query; any insert, status change or edit in the window
+        changes one of the first two values, and an edit to a resource the
+        feed shows (its title and location are in every event) the third.
+        """
+        row = (
+            db.session.query(
+                func.max(Booking.updated_at),
+                func.count(Booking.booking_id),
+                func.max(Resource.updated_at),
+            )
+            .join(Resource, Booking.resource_id == Resource.resource_id)
+            .filter(
+                *BookingRepository._feed_filter(
+                    start_datetime, end_datetime, statuses, resource_id, requester_id
+                )
+            )
+            .one()
+        )
+        return row[0], row[1], row[2]
+
+    @staticmethod
+    def iter_feed(
+        start_datetime: datetime,
+        end_datetime: datetime,
+        statuses: Sequence[str],
+        resource_id: Optional[int] = None,
+        requester_id: Optional[int] = None,
+        batch_size: int = 200,
+    ) -> Iterator[tuple]:
+        """
+        Stream (Booking, Resource) rows for a calendar feed in start order.
+
+        Rows are fetched batch_size at a time rather than loaded as one list.
+        """
+        query = (
+            db.session.query(Booking, Resource)
+            .join(Resource, Booking.resource_id == Resource.resource_id)
+            .filter(
+                *BookingRepository._feed_filter(
+                    start_datetime, end_datetime, statuses, resource_id, requester_id
+                )
+            )
+            .order_by(Booking.start_datetime, Booking.booking_id)
+            .yield_per(batch_size)
+        )
+        for booking, resource in query:
+            yield booking, resource
+
     @staticmethod
     def get_pending_approvals(resource_id: Optional[int] = None) -> List[Booking]:
         """Get all pending bookings awaiting approval."""
@@ -274,3 +690,13 @@ class BookingRepository:
     def count_by_status(status: str) -> int:
         """Get count of bookings by status."""
         return Booking.query.filter_by(status=status).count()
+
+    @staticmethod
+    def count_all_by_status() -> Dict[str, int]:
+        """Get booking counts for every status present, from one GROUP BY query."""
+        rows = (
+            db.session.query(Booking.status, func.count(Booking.booking_id))
+            .group_by(Booking.status)
+            .all()
+        )
+        return {status: count for status, count in rows}
@@ -0,0 +1,52 @@
+"""
+Job Run Repository - Campus Resource Hub
+Data Access Layer for JobRun model.
+
+Per .clinerules: All database operations encapsulated in repositories.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from src.models import db, JobRun
+
+
+class JobRunRepository:
+    """Repository for recording maintenance job executions."""
+
+    @staticmethod
+    def start(job_name: str) -> JobRun:
+        """Record the start of a job run and commit it."""
+        run = JobRun(job_name=job_name, started_at=datetime.utcnow(), rows_affected=0)
+        db.session.add(run)
+        db.session.commit()
+        return run
+
+    @staticmethod
+    def finish(run: JobRun, rows_affected: int, error: Optional[str] = None) -> JobRun:
+        """Record the outcome of a job run and commit it."""
+        run.rows_affected = rows_affected
+        run.finished_at = datetime.utcnow()
+        run.status = "failed" if error else "succeeded"
+        run.error = error
+        db.session.commit()
+        return run
+
+    @staticmethod
+    def get_latest(job_name: str) -> Optional[JobRun]:
+        """Get the most recent run of a job."""
+        return (
+            JobRun.query.filter_by(job_name=job_name)
+            .order_by(JobRun.started_at.desc(), JobRun.run_id.desc())
+            .first()
+        )
+
+    @staticmethod
+    def get_recent(job_name: str, limit: int = 20) -> List[JobRun]:
+        """Get the most recent runs of a job, newest first."""
+        return (
+            JobRun.query.filter_by(job_name=job_name)
+            .order_by(JobRun.started_at.desc(), JobRun.run_id.desc())
+            .limit(limit)
+            .all()
+        )
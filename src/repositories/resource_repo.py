@@ -5,10 +5,55 @@ Data Access Layer for Resource model.
 Per .clinerules: All database operations encapsulated in repositories.
 """
 
-from typing import List, Optional, Dict, Sequence, Union, Any
-from sqlalchemy import or_, func
+import math
+import re
+from typing import List, Optional, Dict, Sequence, Tuple, Union, Any
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    or_,
+    case,
+    func,
+    literal,
+    select,
+    table,
+    column,
+    literal_column,
+    text,
+    union_all,
+)
+from sqlalchemy.orm import joinedload
 from datetime import datetime
-from src.models import db, Resource, Booking
+from src.models import db, Resource, ResourceTerm, TermTrigram, Booking, RatingSummary, User
+from src.models.resource import (
+    FTS_INDEX_STATE,
+    RESOURCE_FTS_TABLE,
+    create_resource_fts,
+    search_terms,
+    term_trigrams,
+)
+from src.utils.sql import insert_ignore
+
+# Column weights for bm25(): title matches outrank location, then description
+FTS_COLUMN_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Trigram matching: minimum Jaccard similarity per query term, max query terms
+# considered and max fuzzy candidates fed back into search
+FUZZY_THRESHOLD = 0.4
+FUZZY_MAX_TERMS = 6
+FUZZY_LIMIT = 50
+
+# Trigram matching only runs when exact matching finds fewer resources than
+# this (default: one /resources listing page)
+FUZZY_MIN_MATCHES = 20
+
+# Keyset sorts: sort name -> (key column, ascending); resource_id breaks ties
+KEYSET_SORTS = {
+    "created_desc": (Resource.created_at, False),
+    "created_asc": (Resource.created_at, True),
+    "title_asc": (Resource.title, True),
+    "title_desc": (Resource.title, False),
+}
 
 
 class ResourceRepository:
@@ -51,6 +96,8 @@ class ResourceRepository:
                 status=kwargs.get("status", "draft"),
             )
         db.session.add(resource_model)
+        db.session.flush()
+        ResourceRepository._index_terms(resource_model)
         db.session.commit()
         return resource_model
 
@@ -59,6 +106,17 @@ class ResourceRepository:
         """Get resource by ID."""
         return Resource.query.get(resource_id)
 
+    @staticmethod
+    def get_by_ids(resource_ids: Sequence[int]) -> List[Resource]:
+        """Get resources by ID in one query, ordered by title."""
+        if not resource_ids:
+            return []
+        return (
+            Resource.query.filter(Resource.resource_id.in_(list(resource_ids)))
+            .order_by(Resource.title.asc(), Resource.resource_id.asc())
+            .all()
+        )
+
     @staticmethod
     def get_all(
         page: int = 1,
@@ -90,8 +148,43 @@ class ResourceRepository:
 
     @staticmethod
     def search(
+        query_str: Optional[str] = None, page: int = 1, per_page: int = 50, **filters: Any
+    ) -> List[Resource]:
+        """
+        Search resources by title, description, or location.
+
+        On SQLite the query string is matched against the FTS5 index (word prefixes)
+        and results are ranked by bm25 (sort=None or "relevance"). Other dialects,
+        and queries no word starts with, use ILIKE substring matching.
+
+        Note: Returns every match as a list for backward compatibility (page is
+        ignored); use search_page() to load a single page. Filters are the
+        keywords of _search_query().
+        """
+        return ResourceRepository._search_query(query_str, per_page, **filters).all()
+
+    @staticmethod
+    def search_page(page: int = 1, per_page: int = 50, **filters: Any) -> Dict[str, Any]:
+        """
+        Load one page of search() results (LIMIT/OFFSET) and the total from a COUNT(*).
+
+        Returns:
+            Dict shaped like get_all(): items, total, page, per_page, pages
+        """
+        paginated = ResourceRepository._search_query(per_page=per_page, **filters).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        return {
+            "items": paginated.items,
+            "total": paginated.total,
+            "page": paginated.page,
+            "per_page": paginated.per_page,
+            "pages": paginated.pages,
+        }
+
+    @staticmethod
+    def _search_query(
         query_str: Optional[str] = None,
-        page: int = 1,
         per_page: int = 50,
         category: Optional[str] = None,
         location: Optional[str] = None,
@@ -104,11 +197,11 @@ class ResourceRepository:
         availability_start: Optional[datetime] = None,
         availability_end: Optional[datetime] = None,
         sort: Optional[str] = None,
-    ) -> List[Resource]:
+    ):
         """
-        Search resources by title, description, or location.
+        Build the filtered, ordered query behind search() and search_page().
 
-        Note: Returns list for backward compatibility with routes/resources.py
+        per_page is the page size the fuzzy pass must fill (see _apply_filters).
         """
         query = Resource.query
 
@@ -120,20 +213,208 @@ class ResourceRepository:
         else:
             query = query.filter(Resource.status == "published")
 
-        # Apply search filter if query string provided
+        query, relevance = ResourceRepository._apply_filters(
+            query,
+            query_str=query_str,
+            category=category,
+            location=location,
+            categories=categories,
+            locations=locations,
+            capacity_min=capacity_min,
+            capacity_max=capacity_max,
+            availability_start=availability_start,
+            availability_end=availability_end,
+            fuzzy_below=per_page,
+        )
+
+        # Ordering (defaults to newest first); rating joins the persisted rating summary and
+        # popularity an aggregate subquery, so both compose with LIMIT/OFFSET
+        if sort == "created_asc":
+            query = query.order_by(Resource.created_at.asc())
+        elif sort == "title_asc":
+            query = query.order_by(Resource.title.asc())
+        elif sort == "title_desc":
+            query = query.order_by(Resource.title.desc())
+        elif sort == "rating_desc":
+            query = query.outerjoin(
+                RatingSummary, RatingSummary.resource_id == Resource.resource_id
+            )
+            average = func.round(
+                func.coalesce(RatingSummary.rating_sum, 0)
+                * 1.0
+                / func.nullif(RatingSummary.review_count, 0),
+                1,
+            )
+            query = query.order_by(
+                func.coalesce(average, 0).desc(),
+                func.coalesce(RatingSummary.review_count, 0).desc(),
+                Resource.created_at.desc(),
+            )
+        elif sort == "popular":
+            popularity = ResourceRepository._booking_count_subquery()
+            query = query.outerjoin(popularity, popularity.c.resource_id == Resource.resource_id)
+            query = query.order_by(
+                func.coalesce(popularity.c.booking_count, 0).desc(),
+                Resource.created_at.desc(),
+            )
+        elif relevance is not None and sort in (None, "relevance"):
+            # bm25 scores are negative; lower is a better match
+            query = query.order_by(relevance.asc(), Resource.created_at.desc())
+        else:
+            query = query.order_by(Resource.created_at.desc())
+
+        return query
+
+    @staticmethod
+    def search_keyset(
+        after: Optional[Tuple[Any, int]] = None,
+        limit: int = 50,
+        sort: str = "created_desc",
+        statuses: Optional[Sequence[str]] = None,
+        **filters: Any,
+    ) -> List[Resource]:
+        """
+        Return one page of resources after a keyset position.
+
+        Seeks with ``(key, resource_id) > / < (after)`` instead of OFFSET, so deep
+        pages cost the same as the first one.
+
+        Args:
+            after: (sort key value, resource_id) of the last row already returned
+            limit: Maximum rows to return
+            sort: One of KEYSET_SORTS
+            statuses: Statuses to include (default: published)
+            **filters: Any keyword accepted by _apply_filters
+
+        Returns:
+            List of resources in keyset order (owner eagerly loaded)
+
+        Raises:
+            ValueError: If sort is not a keyset sort
+        """
+        if sort not in KEYSET_SORTS:
+            raise ValueError(f"Unsupported sort for keyset pagination: {sort}")
+        key_column, ascending = KEYSET_SORTS[sort]
+
+        query = Resource.query.options(joinedload(Resource.owner))  # type: ignore[arg-type]
+        query = query.filter(Resource.status.in_(statuses or ["published"]))
+        query, _ = ResourceRepository._apply_filters(query, fuzzy_below=limit, **filters)
+
+        if after is not None:
+            value, last_id = after
+            if ascending:
+                seek = or_(
+                    key_column > value,
+                    and_(key_column == value, Resource.resource_id > last_id),
+                )
+            else:
+                seek = or_(
+                    key_column < value,
+                    and_(key_column == value, Resource.resource_id < last_id),
+                )
+            query = query.filter(seek)
+
+        if ascending:
+            query = query.order_by(key_column.asc(), Resource.resource_id.asc())
+        else:
+            query = query.order_by(key_column.desc(), Resource.resource_id.desc())
+
+        return query.limit(limit).all()
+
+    @staticmethod
+    def keyset_key(resource: Resource, sort: str) -> Tuple[Any, int]:
+        """Return the (sort key value, resource_id) position of a resource."""
+        key_column, _ = KEYSET_SORTS[sort]
+        return getattr(resource, key_column.key), resource.resource_id
+
+    @staticmethod
+    def _apply_filters(
+        query,
+        query_str: Optional[str] = None,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        categories: Optional[Sequence[str]] = None,
+        locations: Optional[Sequence[str]] = None,
+        capacity_min: Optional[int] = None,
+        capacity_max: Optional[int] = None,
+        availability_start: Optional[datetime] = None,
+        availability_end: Optional[datetime] = None,
+        fuzzy_below: int = FUZZY_MIN_MATCHES,
+    ):
+        """
+        Apply the catalogue filter set (everything except status and ordering).
+
+        Shared by search() and the facet aggregate so both count the same rows.
+        Trigram matches are only added when exact matching finds fewer than
+        fuzzy_below resources (usually the page size), i.e. when the query is
+        likely misspelled.
+
+        Returns:
+            Tuple of (filtered query, bm25 relevance column or None)
+        """
+        relevance: Optional[ColumnElement] = None
+
+        # Apply search filter if query string provided. Trigram matches widen the
+        # result set to misspellings; they rank after exact/prefix matches.
         if query_str:
-            search_filter = or_(
-                Resource.title.ilike(f"%{query_str}%"),
-                Resource.description.ilike(f"%{query_str}%"),
-                Resource.location.ilike(f"%{query_str}%"),
+            # FTS matches word prefixes only; when no word starts with the query,
+            # fall back to ILIKE so mid-word substrings ("book" in "notebook") match
+            match_expr = ResourceRepository._fts_match_expression(query_str)
+            matched = 0
+            if match_expr and ResourceRepository.fts_enabled():
+                matched = ResourceRepository._fts_match_count(match_expr, fuzzy_below)
+            use_fts = matched > 0
+            if not use_fts:
+                text_filter = or_(
+                    Resource.title.ilike(f"%{query_str}%"),
+                    Resource.description.ilike(f"%{query_str}%"),
+                    Resource.location.ilike(f"%{query_str}%"),
+                )
+                matched = (
+                    db.session.query(Resource.resource_id)
+                    .filter(text_filter)
+                    .limit(fuzzy_below)
+                    .count()
+                )
+
+            fuzzy = ResourceRepository.fuzzy_search(query_str) if matched < fuzzy_below else {}
+            fuzzy_score = (
+                case(fuzzy, value=Resource.resource_id, else_=0.0) if fuzzy else literal(0.0)
             )
-            query = query.filter(search_filter)
+
+            if use_fts:
+                fts = table(RESOURCE_FTS_TABLE, column("rowid"))
+                hits = (
+                    select(
+                        fts.c.rowid.label("resource_id"),
+                        func.bm25(literal_column(RESOURCE_FTS_TABLE), *FTS_COLUMN_WEIGHTS).label(
+                            "rank"
+                        ),
+                    )
+                    .where(literal_column(RESOURCE_FTS_TABLE).op("MATCH")(match_expr))
+                    .subquery()
+                )
+                if fuzzy:
+                    query = query.outerjoin(hits, hits.c.resource_id == Resource.resource_id)
+                    query = query.filter(
+                        or_(hits.c.resource_id.isnot(None), Resource.resource_id.in_(fuzzy))
+                    )
+                else:
+                    query = query.join(hits, hits.c.resource_id == Resource.resource_id)
+                # bm25 scores are negative, fuzzy-only rows get 1 - similarity (>= 0)
+                relevance = func.coalesce(hits.c.rank, 1.0 - fuzzy_score)
+            else:
+                search_filter = text_filter
+                if fuzzy:
+                    search_filter = or_(search_filter, Resource.resource_id.in_(fuzzy))
+                    relevance = 1.0 - fuzzy_score
+                query = query.filter(search_filter)
 
         # Apply category filter (single or multiple)
         if categories:
             query = query.filter(Resource.category.in_(categories))
         elif category:
-            query = query.filter_by(category=category)
+            query = query.filter(Resource.category == category)
 
         # Apply location filter (single or multiple, partial match)
         if locations:
@@ -165,28 +446,282 @@ class ResourceRepository:
                 )
                 query = query.filter(~Resource.resource_id.in_(conflicts))
 
-        # Base ordering (defaults to newest first)
-        if sort == "created_asc":
-            query = query.order_by(Resource.created_at.asc())
-        elif sort == "title_asc":
-            query = query.order_by(Resource.title.asc())
-        elif sort == "title_desc":
-            query = query.order_by(Resource.title.desc())
-        else:
-            query = query.order_by(Resource.created_at.desc())
+        return query, relevance
+
+    @staticmethod
+    def _booking_count_subquery():
+        """Per-resource booking count across all statuses (GROUP BY)."""
+        return (
+            db.session.query(
+                Booking.resource_id.label("resource_id"),
+                func.count(Booking.booking_id).label("booking_count"),
+            )
+            .group_by(Booking.resource_id)
+            .subquery()
+        )
+
+    @staticmethod
+    def get_card_metadata(resource_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Bulk-load listing card metadata for a page of resources.
+
+        Two grouped queries replace the per-card relationship calls (rating,
+        review count, booking count, owner name) that caused N+1 queries.
 
-        results = query.all()
+        Args:
+            resource_ids: IDs of the resources being rendered
 
-        # Derived sorting (rating/popularity) happens in Python since it depends on relationships
-        if sort == "rating_desc":
-            results.sort(
-                key=lambda r: (r.get_average_rating() or 0, r.get_review_count()), reverse=True
+        Returns:
+            Dict keyed by resource_id with average_rating, review_count,
+            booking_count and owner_name
+        """
+        ids = list({rid for rid in resource_ids if rid is not None})
+        if not ids:
+            return {}
+
+        rows = (
+            db.session.query(
+                Resource.resource_id,
+                User.name,
+                RatingSummary.review_count,
+                RatingSummary.rating_sum,
             )
-        elif sort == "popular":
-            results.sort(key=lambda r: r.get_booking_count(), reverse=True)
+            .outerjoin(User, User.user_id == Resource.owner_id)
+            .outerjoin(RatingSummary, RatingSummary.resource_id == Resource.resource_id)
+            .filter(Resource.resource_id.in_(ids))
+            .all()
+        )
+        booking_counts = dict(
+            db.session.query(Booking.resource_id, func.count(Booking.booking_id))
+            .filter(Booking.resource_id.in_(ids))
+            .group_by(Booking.resource_id)
+            .all()
+        )
+
+        metadata: Dict[int, Dict[str, Any]] = {}
+        for resource_id, owner_name, review_count, rating_sum in rows:
+            review_count = review_count or 0
+            metadata[resource_id] = {
+                "average_rating": round(rating_sum / review_count, 1) if review_count else None,
+                "review_count": review_count,
+                "booking_count": booking_counts.get(resource_id, 0),
+                "owner_name": owner_name,
+            }
+        return metadata
 
+    @staticmethod
+    def fts_enabled() -> bool:
+        """
+        Check whether the FTS5 resource index exists on the current database.
+
+        Looked up once per engine; creating or dropping the index in this
+        process updates the cached answer.
+        """
+        bind = db.session.get_bind()
+        enabled = FTS_INDEX_STATE.get(bind)
+        if enabled is None:
+            enabled = bind.dialect.name == "sqlite" and (
+                db.session.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": RESOURCE_FTS_TABLE},
+                ).first()
+                is not None
+            )
+            FTS_INDEX_STATE[bind] = enabled
+        return enabled
+
+    @staticmethod
+    def _fts_match_count(match_expr: str, limit: int) -> int:
+        """Count resources matching the FTS expression, up to limit (index-only probe)."""
+        fts: ColumnElement = literal_column(RESOURCE_FTS_TABLE)
+        probe = (
+            select(literal(1))
+            .select_from(table(RESOURCE_FTS_TABLE))
+            .where(fts.op("MATCH")(match_expr))
+            .limit(limit)
+            .subquery()
+        )
+        return db.session.execute(select(func.count()).select_from(probe)).scalar() or 0
+
+    @staticmethod
+    def _fts_match_expression(query_str: str) -> Optional[str]:
+        """
+        Convert free text into a safe FTS5 MATCH expression.
+
+        Each word becomes a quoted prefix term ("lib"* matches "library") and all
+        terms must match. Returns None when the input has no searchable words.
+        """
+        terms = re.findall(r"\w+", query_str.lower())
+        if not terms:
+            return None
+        return " AND ".join(f'"{term}"*' for term in terms[:16])
+
+    @staticmethod
+    def rebuild_search_index() -> bool:
+        """
+        Create (if missing) and repopulate the full-text index from resources.
+
+        Also rebuilds the trigram index, which exists on every dialect.
+
+        Returns:
+            True if the FTS index was rebuilt, False if the dialect lacks FTS5
+        """
+        rebuilt = create_resource_fts(db.session.connection())
+        ResourceRepository.rebuild_trigram_index()
+        return rebuilt
+
+    @staticmethod
+    def rebuild_trigram_index() -> int:
+        """
+        Repopulate the term and trigram-vocabulary indexes from all resources.
+
+        Returns:
+            Number of distinct terms in the vocabulary
+        """
+        ResourceTerm.query.delete(synchronize_session=False)
+        TermTrigram.query.delete(synchronize_session=False)
+
+        vocabulary: Dict[str, None] = {}
+        rows: List[Dict[str, Any]] = []
+        for resource in Resource.query.yield_per(500):
+            for term in ResourceTerm.terms_for(resource):
+                rows.append({"term": term, "resource_id": resource.resource_id})
+                vocabulary.setdefault(term, None)
+
+        if rows:
+            db.session.execute(ResourceTerm.__table__.insert(), rows)
+            db.session.execute(
+                TermTrigram.__table__.insert(),
+                [
+                    {"trigram": gram, "term": term}
+                    for term in vocabulary
+                    for gram in term_trigrams(term)
+                ],
+            )
+        db.session.commit()
+        return len(vocabulary)
+
+    @staticmethod
+    def _index_terms(resource: Resource) -> None:
+        """Replace a resource's indexed terms and extend the vocabulary (caller commits)."""
+        ResourceTerm.query.filter_by(resource_id=resource.resource_id).delete(
+            synchronize_session=False
+        )
+        terms = ResourceTerm.terms_for(resource)
+        if not terms:
+            return
+
+        db.session.execute(
+            ResourceTerm.__table__.insert(),
+            [{"term": term, "resource_id": resource.resource_id} for term in terms],
+        )
+        known = {
+            term
+            for (term,) in db.session.query(TermTrigram.term)
+            .filter(TermTrigram.term.in_(terms))
+            .distinct()
+        }
+        new_rows = [
+            {"trigram": gram, "term": term}
+            for term in terms
+            if term not in known
+            for gram in term_trigrams(term)
+        ]
+        # Another transaction may add the same new term concurrently
+        insert_ignore(db.session, TermTrigram.__table__, new_rows, ["trigram", "term"])
+
+    @staticmethod
+    def _top_resources_for_terms(similar: Dict[str, float], limit: int) -> Dict[int, float]:
+        """
+        Resolve a single word's similar terms to resources, best term first.
+
+        Each term is an index seek bounded by the remaining limit, so frequent
+        terms never load their full posting list.
+        """
+        results: Dict[int, float] = {}
+        for term, similarity in sorted(similar.items(), key=lambda item: (-item[1], item[0])):
+            remaining = limit - len(results)
+            if remaining <= 0:
+                break
+            query = db.session.query(ResourceTerm.resource_id).filter(ResourceTerm.term == term)
+            if results:
+                query = query.filter(~ResourceTerm.resource_id.in_(list(results)))
+            for (resource_id,) in query.order_by(ResourceTerm.resource_id).limit(remaining):
+                results[resource_id] = round(similarity, 4)
         return results
 
+    @staticmethod
+    def fuzzy_search(
+        query_str: str, threshold: float = FUZZY_THRESHOLD, limit: int = FUZZY_LIMIT
+    ) -> Dict[int, float]:
+        """
+        Find resources whose title, location or category label approximately match.
+
+        Each query term is first matched against the vocabulary of distinct indexed
+        terms by trigram Jaccard similarity (HAVING prunes terms that cannot reach
+        the threshold), then the similar terms are resolved to resources through
+        the term index. Neither step scans resources. Every query term must match
+        some term of a resource (AND semantics, like the FTS query).
+
+        Args:
+            query_str: Raw user query
+            threshold: Minimum similarity per query term (0-1)
+            limit: Maximum resources returned
+
+        Returns:
+            Dict of resource_id -> mean similarity, best matches first
+        """
+        words = search_terms(query_str)[:FUZZY_MAX_TERMS]
+        if not words:
+            return {}
+
+        shared = func.count(TermTrigram.trigram)
+        per_word = []
+        for index, word in enumerate(words):
+            grams = term_trigrams(word)
+            # Jaccard = s / (q + t - s) <= s / q, so s must reach threshold * q
+            min_shared = max(1, math.ceil(threshold * len(grams)))
+            candidates = (
+                db.session.query(TermTrigram.term, shared)
+                .filter(TermTrigram.trigram.in_(grams))
+                .group_by(TermTrigram.term)
+                .having(shared >= min_shared)
+                .all()
+            )
+
+            similar: Dict[str, float] = {}
+            for term, overlap in candidates:
+                similarity = overlap / (len(grams) + len(term_trigrams(term)) - overlap)
+                if similarity >= threshold:
+                    similar[term] = similarity
+            if not similar:
+                return {}
+
+            per_word.append(
+                select(
+                    ResourceTerm.resource_id.label("resource_id"),
+                    literal(index).label("word"),
+                    func.max(case(similar, value=ResourceTerm.term, else_=0.0)).label("score"),
+                )
+                .where(ResourceTerm.term.in_(similar))
+                .group_by(ResourceTerm.resource_id)
+            )
+
+        if len(words) == 1:
+            return ResourceRepository._top_resources_for_terms(similar, limit)
+
+        # Intersect and rank in SQL so only the top `limit` rows leave the database
+        matches = union_all(*per_word).subquery() if len(per_word) > 1 else per_word[0].subquery()
+        total = func.sum(matches.c.score)
+        rows = db.session.execute(
+            select(matches.c.resource_id, total)
+            .group_by(matches.c.resource_id)
+            .having(func.count(matches.c.word) == len(words))
+            .order_by(total.desc(), matches.c.resource_id)
+            .limit(limit)
+        ).all()
+        return {resource_id: round(score / len(words), 4) for resource_id, score in rows}
+
     @staticmethod
     def update(resource_or_id: Union[Resource, int], **kwargs: Any) -> Optional[Resource]:
         """Update resource fields."""
@@ -208,6 +743,9 @@ class ResourceRepository:
         if "availability_rules" in kwargs:
             resource.set_availability_rules(kwargs["availability_rules"])
 
+        if any(field in kwargs for field in ("title", "location", "category")):
+            ResourceRepository._index_terms(resource)
+
         resource.updated_at = datetime.utcnow()
         db.session.commit()
         return resource
@@ -219,6 +757,7 @@ class ResourceRepository:
         if not resource:
             return False
 
+        ResourceTerm.query.filter_by(resource_id=resource_id).delete(synchronize_session=False)
         db.session.delete(resource)
         db.session.commit()
         return True
@@ -243,6 +782,33 @@ class ResourceRepository:
         """Get count of resources by status."""
         return Resource.query.filter_by(status=status).count()
 
+    @staticmethod
+    def get_facet_rows(
+        statuses: Optional[Sequence[str]] = None, **filters: Any
+    ) -> List[Tuple[Optional[str], str, str, Optional[int], int]]:
+        """
+        Count resources grouped by (location, category, status, capacity) in one query.
+
+        Args:
+            statuses: Restrict to these statuses (None counts every status)
+            **filters: Any keyword accepted by _apply_filters (query_str, categories, ...)
+
+        Returns:
+            List of (location, category, status, capacity, count) rows
+        """
+        query = db.session.query(Resource)
+        if statuses:
+            query = query.filter(Resource.status.in_(statuses))
+        query, _ = ResourceRepository._apply_filters(query, **filters)
+
+        dimensions = (Resource.location, Resource.category, Resource.status, Resource.capacity)
+        rows = (
+            query.with_entities(*dimensions, func.count(Resource.resource_id))
+            .group_by(*dimensions)
+            .all()
+        )
+        return [tuple(row) for row in rows]
+
     @staticmethod
     def get_location_facets(status: Optional[str] = "published") -> List[Dict[str, object]]:
         """
@@ -3,8 +3,11 @@ Review Repository - Campus Resource Hub
 Data Access Layer for Review model.
 """
 
-from typing import List, Optional, Dict
-from src.models import db, Review
+from typing import Any, List, Optional, Dict
+from datetime import datetime
+from sqlalchemy import func, update
+from src.models import db, Review, RatingSummary
+from src.utils.sql import upsert
 
 
 class ReviewRepository:
@@ -27,6 +30,7 @@ class ReviewRepository:
             booking_id=booking_id,
         )
         db.session.add(review)
+        ReviewRepository._apply_rating(resource_id, rating, 1)
         db.session.commit()
         return review
 
@@ -84,7 +88,11 @@ class ReviewRepository:
             return None
 
         if rating is not None:
+            old_rating = review.rating
             review.update_rating(rating)
+            if review.is_visible() and old_rating != rating:
+                ReviewRepository._apply_rating(review.resource_id, old_rating, -1)
+                ReviewRepository._apply_rating(review.resource_id, rating, 1)
         if comment is not None:
             review.update_comment(comment)
 
@@ -98,6 +106,8 @@ class ReviewRepository:
         if not review:
             return False
 
+        if review.is_visible():
+            ReviewRepository._apply_rating(review.resource_id, review.rating, -1)
         db.session.delete(review)
         db.session.commit()
         return True
@@ -109,6 +119,8 @@ class ReviewRepository:
         if not review:
             return None
 
+        if review.is_visible():
+            ReviewRepository._apply_rating(review.resource_id, review.rating, -1)
         review.hide(admin_id, reason)
         db.session.commit()
         return review
@@ -120,21 +132,110 @@ class ReviewRepository:
         if not review:
             return None
 
+        if not review.is_visible():
+            ReviewRepository._apply_rating(review.resource_id, review.rating, 1)
         review.unhide()
         db.session.commit()
         return review
 
+    @staticmethod
+    def get_rating_summary(resource_id: int) -> Optional[RatingSummary]:
+        """Get the persisted rating summary for a resource (primary-key lookup)."""
+        return db.session.get(RatingSummary, resource_id)
+
     @staticmethod
     def get_average_rating(resource_id: int) -> Optional[float]:
         """Get average rating for a resource."""
-        reviews = ReviewRepository.get_by_resource(resource_id, include_hidden=False)
-        if not reviews:
-            return None
-
-        total = sum(r.rating for r in reviews)
-        return round(total / len(reviews), 1)
+        summary = ReviewRepository.get_rating_summary(resource_id)
+        return summary.get_average_rating() if summary else None
 
     @staticmethod
     def count_by_resource(resource_id: int) -> int:
         """Count reviews for a resource."""
-        return Review.query.filter_by(resource_id=resource_id, is_hidden=False).count()
+        summary = ReviewRepository.get_rating_summary(resource_id)
+        return summary.review_count if summary else 0
+
+    @staticmethod
+    def delete_by_reviewer(reviewer_id: int) -> int:
+        """
+        Delete every review written by a user, removing visible ones from their
+        resources' rating summaries. The caller commits (e.g. with the user delete).
+
+        Returns:
+            Number of reviews deleted
+        """
+        reviews = Review.query.filter_by(reviewer_id=reviewer_id).all()
+        for review in reviews:
+            if review.is_visible():
+                ReviewRepository._apply_rating(review.resource_id, review.rating, -1)
+            db.session.delete(review)
+        return len(reviews)
+
+    @staticmethod
+    def _apply_rating(resource_id: int, rating: int, delta: int) -> None:
+        """
+        Add (delta=1) or remove (delta=-1) one rating from a resource's summary.
+
+        Runs as one atomic statement in the caller's transaction so concurrent
+        writers never lose increments; the first rating of a resource is an
+        INSERT ... ON CONFLICT DO UPDATE, so simultaneous first reviews cannot
+        both insert the row. The caller commits.
+        """
+        table = RatingSummary.__table__
+        bucket = f"rating_{rating}"
+        now = datetime.utcnow()
+        changes = {
+            "review_count": table.c.review_count + delta,
+            "rating_sum": table.c.rating_sum + rating * delta,
+            bucket: table.c[bucket] + delta,
+            "updated_at": now,
+        }
+        if delta < 0:
+            db.session.execute(
+                update(table).where(table.c.resource_id == resource_id).values(changes)
+            )
+            return
+
+        values: Dict[str, Any] = {
+            **{f"rating_{level}": 0 for level in range(1, 6)},
+            "resource_id": resource_id,
+            "review_count": delta,
+            "rating_sum": rating * delta,
+            "updated_at": now,
+            bucket: delta,
+        }
+        upsert(db.session, table, values, ["resource_id"], changes)
+
+    @staticmethod
+    def rebuild_rating_summaries() -> int:
+        """
+        Recompute every rating summary from the reviews table (backfill/repair).
+
+        Returns:
+            Number of resources with at least one visible review
+        """
+        rows = (
+            db.session.query(Review.resource_id, Review.rating, func.count(Review.review_id))
+            .filter(Review.is_hidden.is_(False))
+            .group_by(Review.resource_id, Review.rating)
+            .all()
+        )
+
+        now = datetime.utcnow()
+        summaries: Dict[int, RatingSummary] = {}
+        for resource_id, rating, count in rows:
+            summary = summaries.get(resource_id)
+            if summary is None:
+                summary = summaries[resource_id] = RatingSummary(resource_id=resource_id)
+                summary.updated_at = now
+            summary.review_count += count
+            summary.rating_sum += rating * count
+            setattr(summary, f"rating_{rating}", count)
+
+        RatingSummary.query.filter(~RatingSummary.resource_id.in_(list(summaries))).delete(
+            synchronize_session="fetch"
+        )
+        for summary in summaries.values():
+            db.session.merge(summary)
+        db.session.commit()
+        return len(summaries)
@@ -63,6 +63,21 @@ class UserRepository:
         """Get user by email address."""
         return User.query.filter_by(email=email.lower()).first()
 
+    @staticmethod
+    def get_by_ids(user_ids: List[int]) -> Dict[int, User]:
+        """Get users for many IDs in one query, keyed by ID."""
+        if not user_ids:
+            return {}
+        return {user.user_id: user for user in User.query.filter(User.user_id.in_(set(user_ids)))}
+
+    @staticmethod
+    def get_by_emails(emails: List[str]) -> Dict[str, User]:
+        """Get users for many email addresses in one query, keyed by lowercased email."""
+        normalized = {email.strip().lower() for email in emails if email}
+        if not normalized:
+            return {}
+        return {user.email: user for user in User.query.filter(User.email.in_(normalized))}
+
     @staticmethod
     def get_all(page: int = 1, per_page: int = 50, role: Optional[str] = None) -> Dict:
         """
@@ -0,0 +1,123 @@
+"""
+Waitlist Repository - Campus Resource Hub
+Data Access Layer for WaitlistEntry model.
+
+Per .clinerules: All database operations encapsulated in repositories.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Set, Tuple
+
+from src.models import db, Booking, WaitlistEntry
+
+
+class WaitlistRepository:
+    """Repository for waitlist entries and freed-slot lookups."""
+
+    @staticmethod
+    def create(
+        resource_id: int,
+        requester_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> WaitlistEntry:
+        """Add a waiting entry and flush to assign its ID (caller commits)."""
+        entry = WaitlistEntry(
+            resource_id=resource_id,
+            requester_id=requester_id,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            status="waiting",
+        )
+        db.session.add(entry)
+        db.session.flush()
+        return entry
+
+    @staticmethod
+    def get_by_id(entry_id: int) -> Optional[WaitlistEntry]:
+        """Get waitlist entry by ID."""
+        return db.session.get(WaitlistEntry, entry_id)
+
+    @staticmethod
+    def find_waiting_overlapping(
+        resource_id: int, start_datetime: datetime, end_datetime: datetime
+    ) -> List[WaitlistEntry]:
+        """
+        Get waiting entries for a resource overlapping a window, oldest first.
+
+        Served by idx_waitlist_resource_status_window: equality on resource and
+        status, then a range on start_datetime.
+        """
+        return (
+            WaitlistEntry.query.filter(
+                WaitlistEntry.resource_id == resource_id,
+                WaitlistEntry.status == "waiting",
+                WaitlistEntry.start_datetime < end_datetime,
+                WaitlistEntry.end_datetime > start_datetime,
+            )
+            .order_by(WaitlistEntry.created_at, WaitlistEntry.entry_id)
+            .all()
+        )
+
+    @staticmethod
+    def get_promoted_pending_windows(
+        resource_id: int, start_datetime: datetime, end_datetime: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """Get (start, end) of still-pending bookings promoted from the waitlist in a window."""
+        return [
+            (start, end)
+            for start, end in db.session.query(Booking.start_datetime, Booking.end_datetime)
+            .join(WaitlistEntry, WaitlistEntry.booking_id == Booking.booking_id)
+            .filter(
+                WaitlistEntry.resource_id == resource_id,
+                WaitlistEntry.status == "promoted",
+                Booking.status == "pending",
+                Booking.start_datetime < end_datetime,
+                Booking.end_datetime > start_datetime,
+            )
+        ]
+
+    @staticmethod
+    def get_promoted_booking_ids(booking_ids: Sequence[int]) -> Set[int]:
+        """Get which of the given bookings were created by a waitlist promotion."""
+        if not booking_ids:
+            return set()
+        return {
+            booking_id
+            for (booking_id,) in db.session.query(WaitlistEntry.booking_id).filter(
+                WaitlistEntry.booking_id.in_(list(booking_ids)),
+                WaitlistEntry.status == "promoted",
+            )
+        }
+
+    @staticmethod
+    def find_for_requester(
+        requester_id: int, resource_id: int, start_datetime: datetime, end_datetime: datetime
+    ) -> Optional[WaitlistEntry]:
+        """Get a requester's waiting entry overlapping a window on a resource, if any."""
+        return WaitlistEntry.query.filter(
+            WaitlistEntry.resource_id == resource_id,
+            WaitlistEntry.status == "waiting",
+            WaitlistEntry.requester_id == requester_id,
+            WaitlistEntry.start_datetime < end_datetime,
+            WaitlistEntry.end_datetime > start_datetime,
+        ).first()
+
+    @staticmethod
+    def get_by_requester(requester_id: int, status: Optional[str] = None) -> List[WaitlistEntry]:
+        """Get a user's waitlist entries, soonest window first."""
+        query = WaitlistEntry.query.filter_by(requester_id=requester_id)
+        if status:
+            query = query.filter_by(status=status)
+        return query.order_by(WaitlistEntry.start_datetime, WaitlistEntry.entry_id).all()
+
+    @staticmethod
+    def update_status(
+        entry: WaitlistEntry, status: str, booking_id: Optional[int] = None
+    ) -> WaitlistEntry:
+        """Move an entry to a new status (caller commits)."""
+        entry.status = status
+        if status == "promoted":
+            entry.booking_id = booking_id
+            entry.promoted_at = datetime.utcnow()
+        return entry
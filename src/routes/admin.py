@@ -10,12 +10,27 @@ Reviewed and extended by developer on 2025-11-06
 
 from datetime import datetime
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+import io
+
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    render_template,
+    request,
+    redirect,
+    url_for,
+    flash,
+    jsonify,
+)
 from flask_login import login_required, current_user
 from sqlalchemy import or_
 
 from src.security.rbac import require_admin
 from src.services.admin_service import AdminService, AdminServiceError
+from src.services.booking_service import BookingService
+from src.services.search_service import SearchService
+from src.services.booking_import_service import BookingImportError, BookingImportService
 from src.repositories.user_repo import UserRepository
 from src.models.user import User
 
@@ -34,12 +49,15 @@ def dashboard():
 
     Security: Admin only
 
+    Query Parameters:
+        refresh: "1" to recompute the cached platform statistics
+
     Returns:
         HTML: Dashboard with stats cards, charts, recent activity
     """
     try:
-        # Get platform statistics
-        raw_stats = AdminService.get_platform_stats()
+        # Get platform statistics (cached; ?refresh=1 recomputes them)
+        raw_stats = AdminService.get_platform_stats(refresh=request.args.get("refresh") == "1")
 
         # Restructure stats for template (nested dictionaries)
         stats = {
@@ -50,6 +68,7 @@ def dashboard():
             "pending_bookings": raw_stats["pending_bookings"],
             "total_messages": raw_stats["total_messages"],
             "total_reviews": raw_stats["total_reviews"],
+            "generated_at": raw_stats["generated_at"],
             "role_distribution": {
                 "admin": raw_stats["admins"],
                 "staff": raw_stats["staff"],
@@ -212,14 +231,22 @@ def bulk_booking_approvals():
     except ValueError:
         booking_ids = []
 
+    wants_json = request.is_json or request.headers.get("X-Requested-With") == "XMLHttpRequest"
     try:
         result = AdminService.process_booking_approvals(booking_ids, action, current_user.user_id)
-        flash(f"{result['processed']} bookings updated. {result['skipped']} skipped.", "success")
     except AdminServiceError as e:
+        if wants_json:
+            return jsonify({"error": str(e)}), 400
         flash(str(e), "danger")
+        return redirect(url_for("admin.dashboard"))
+
+    if wants_json:
+        return jsonify({"message": "Processed bulk approvals", **result}), 200
 
-    if request.is_json or request.headers.get("X-Requested-With") == "XMLHttpRequest":
-        return jsonify({"message": "Processed bulk approvals"}), 200
+    message = f"{result['processed']} bookings updated. {result['skipped']} skipped."
+    if result["conflicts"]:
+        message += f" {result['conflicts']} left pending because of conflicts."
+    flash(message, "warning" if result["conflicts"] else "success")
 
     return redirect(url_for("admin.dashboard"))
 
@@ -253,7 +280,7 @@ def analytics():
     period = request.args.get("period", 30, type=int)
     period = max(7, min(period, 90))
 
-    stats = AdminService.get_platform_stats()
+    stats = AdminService.get_platform_stats(refresh=request.args.get("refresh") == "1")
     analytics_data = AdminService.get_analytics_snapshot(period)
 
     return render_template(
@@ -388,17 +415,107 @@ def stats():
 
     Security: Admin only
 
+    Query Parameters:
+        refresh: "1" to recompute instead of serving the cached counts
+
     Returns:
-        JSON: Platform statistics
+        JSON: Platform statistics (cached for PLATFORM_STATS_CACHE_TTL seconds)
     """
     try:
-        stats = AdminService.get_platform_stats()
+        stats = AdminService.get_platform_stats(refresh=request.args.get("refresh") == "1")
         return jsonify(stats), 200
 
     except AdminServiceError as e:
         return jsonify({"error": str(e)}), 500
 
 
+@admin_bp.route("/bookings/stats")
+@login_required
+@require_admin
+def booking_stats():
+    """
+    Get booking counts by status as JSON, for dashboards that poll.
+
+    GET /admin/bookings/stats
+
+    Security: Admin only
+
+    Returns:
+        JSON: total plus a count per booking status, served from a short-TTL
+        cache that booking writes invalidate
+    """
+    return jsonify(BookingService.get_booking_statistics()), 200
+
+
+@admin_bp.route("/cache-stats")
+@login_required
+@require_admin
+def cache_stats():
+    """
+    Get in-process cache metrics for this worker as JSON.
+
+    GET /admin/cache-stats
+
+    Security: Admin only
+
+    Returns:
+        JSON: Search cache hit/miss counters and generation, plus size and
+        counters of every other cache created in this app
+    """
+    caches = {
+        name: cache.stats() for name, cache in current_app.extensions.get("caches", {}).items()
+    }
+    return jsonify({"search": SearchService.cache_stats(), "caches": caches}), 200
+
+
+@admin_bp.route("/bookings/import", methods=["POST"])
+@login_required
+@require_admin
+def import_bookings():
+    """
+    Bulk import bookings from an uploaded CSV, JSON or JSON Lines file.
+
+    POST /admin/bookings/import (multipart)
+        file: Upload (.csv, .json, .jsonl)
+        status: Default status for rows without one (approved|pending)
+        dry_run: "1" to validate without writing
+        report: "csv" to download rejected rows as CSV instead of JSON
+
+    Security: Admin only
+
+    Returns:
+        JSON: total, imported, rejected, dry_run and per-row errors
+    """
+    upload = request.files.get("file")
+    if upload is None or not upload.filename:
+        return jsonify({"error": "No file uploaded"}), 400
+
+    try:
+        fmt = BookingImportService.detect_format(upload.filename)
+        stream = io.TextIOWrapper(upload.stream, encoding="utf-8-sig", newline="")
+        report = BookingImportService.import_stream(
+            stream,
+            fmt,
+            default_status=request.form.get("status", "approved"),
+            dry_run=request.form.get("dry_run") in ("1", "true", "on"),
+        )
+    except BookingImportError as e:
+        return jsonify({"error": str(e)}), 400
+    except UnicodeDecodeError:
+        return jsonify({"error": "File must be UTF-8 encoded"}), 400
+
+    if request.values.get("report") == "csv":
+        output = io.StringIO()
+        BookingImportService.write_error_report(report["errors"], output)
+        return Response(
+            output.getvalue(),
+            mimetype="text/csv",
+            headers={"Content-Disposition": "attachment; filename=booking-import-errors.csv"},
+        )
+
+    return jsonify(report), 200
+
+
 @admin_bp.route("/ping")
 @login_required
 @require_admin
@@ -9,19 +9,31 @@ AI Contribution: Cline generated booking route structure
 Reviewed by developer on 2025-11-05
 """
 
+import math
 from datetime import datetime
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
 
-from src.repositories.booking_repo import BookingRepository
+from src.repositories.booking_repo import REQUESTER_TABS, BookingRepository
 from src.repositories.resource_repo import ResourceRepository
-from src.services.booking_service import BookingService
+from src.repositories.waitlist_repo import WaitlistRepository
+from src.services.booking_service import (
+    BookingService,
+    BookingConflictError,
+    BookingStatusError,
+)
+from src.services.availability_service import AvailabilityService, AvailabilityViolationError
+from src.services.calendar_service import CalendarService
+from src.services.recurring_booking_service import RecurrenceError, RecurringBookingService
+from src.services.waitlist_service import WaitlistError, WaitlistService
 from src.security.rbac import require_staff
 
 
 # Create bookings blueprint
 bookings_bp = Blueprint("bookings", __name__, url_prefix="/bookings")
 
+MY_BOOKINGS_PER_PAGE = 20
+
 
 @bookings_bp.route("/new")
 @login_required
@@ -92,30 +104,34 @@ def create():
             flash("Cannot book resources in the past", "error")
             return redirect(url_for("bookings.new", resource_id=resource_id))
 
-        # Check for booking conflicts
-        conflicts = BookingService.check_booking_conflicts(
-            resource_id=resource_id,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            exclude_booking_id=None,
-        )
-
-        if conflicts:
-            flash(f"Time slot unavailable - {len(conflicts)} conflicting booking(s) found", "error")
+        # Validation: must fit the resource's availability rules (days, hours, max length)
+        try:
+            AvailabilityService.validate_booking(resource, start_datetime, end_datetime)
+        except AvailabilityViolationError as e:
+            flash(str(e), "error")
             return redirect(url_for("bookings.new", resource_id=resource_id))
 
         # Determine initial status (auto-approve for now, can add approval logic later)
         # Future: Check resource.requires_approval flag
         initial_status = "approved"
 
-        # Create booking
-        booking = BookingRepository.create(
-            resource_id=resource_id,
-            requester_id=current_user.user_id,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            status=initial_status,
-        )
+        # Conflict check and insert run as one locked unit per resource
+        try:
+            booking = BookingService.create_booking(
+                resource_id=resource_id,
+                requester_id=current_user.user_id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                enforce_rules=False,
+                status=initial_status,
+            )
+        except BookingConflictError as e:
+            flash(
+                f"Time slot unavailable - {len(e.conflicts)} conflicting booking(s) found. "
+                "You can join the waitlist to be booked automatically if it frees up.",
+                "error",
+            )
+            return redirect(url_for("bookings.new", resource_id=resource_id))
 
         if initial_status == "approved":
             flash(f"Booking confirmed for {resource.title}!", "success")
@@ -132,6 +148,189 @@ def create():
         return redirect(url_for("bookings.new", resource_id=resource_id))
 
 
+@bookings_bp.route("/series", methods=["POST"])
+@login_required
+@require_staff
+def create_series():
+    """
+    Create a recurring booking series (staff/admin only).
+
+    Accepts a JSON body or form data:
+        resource_id: ID of resource
+        start_date: First occurrence date (YYYY-MM-DD)
+        start_time, end_time: Occurrence times (HH:MM)
+        frequency: "weekly" (default) or "daily"
+        interval: Repeat every N weeks/days (default 1)
+        weekdays: Weekly only - list or comma-separated names/numbers (Monday = 0)
+        until: Last date (YYYY-MM-DD) and/or count: number of occurrences
+
+    Occurrences that conflict with approved bookings or fall outside the
+    resource's availability rules are skipped and reported; the rest are
+    created (auto-approved, like single bookings) in one transaction.
+    JSON requests receive the per-occurrence report.
+    """
+    data = request.get_json(silent=True) or request.form
+    wants_json = request.is_json
+    resource_id = None
+
+    try:
+        resource_id = int(data.get("resource_id") or 0)
+        start_date = data.get("start_date")
+        start_datetime = datetime.strptime(
+            f"{start_date} {data.get('start_time')}", "%Y-%m-%d %H:%M"
+        )
+        end_datetime = datetime.strptime(f"{start_date} {data.get('end_time')}", "%Y-%m-%d %H:%M")
+        until_raw = data.get("until")
+        until = datetime.strptime(until_raw, "%Y-%m-%d").date() if until_raw else None
+        count = int(data["count"]) if data.get("count") else None
+        interval = int(data.get("interval") or 1)
+    except (TypeError, ValueError) as e:
+        return _request_error(f"Invalid series details: {e}", resource_id, wants_json)
+
+    if hasattr(data, "getlist"):
+        weekdays = [day for value in data.getlist("weekdays") for day in value.split(",")]
+    else:
+        weekdays = data.get("weekdays") or []
+        if isinstance(weekdays, str):
+            weekdays = weekdays.split(",")
+
+    if start_datetime < datetime.now():
+        return _request_error("Cannot book resources in the past", resource_id, wants_json)
+
+    resource = ResourceRepository.get_by_id(resource_id)
+    if not resource or resource.status != "published":
+        return _request_error("Resource not available for booking", None, wants_json, 404)
+
+    try:
+        result = RecurringBookingService.create_series(
+            resource_id=resource_id,
+            requester_id=current_user.user_id,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            frequency=data.get("frequency") or "weekly",
+            interval=interval,
+            weekdays=weekdays,
+            until=until,
+            count=count,
+            status="approved",
+        )
+    except RecurrenceError as e:
+        return _request_error(str(e), resource_id, wants_json)
+
+    created, conflicts = result["created"], result["conflicts"]
+    if wants_json:
+        return (
+            jsonify(
+                {
+                    "series_id": result["series_id"],
+                    "requested": result["requested"],
+                    "created": [
+                        {
+                            "booking_id": item["booking_id"],
+                            "start": item["start"].isoformat(),
+                            "end": item["end"].isoformat(),
+                        }
+                        for item in created
+                    ],
+                    "conflicts": [
+                        {
+                            **item,
+                            "start": item["start"].isoformat(),
+                            "end": item["end"].isoformat(),
+                        }
+                        for item in conflicts
+                    ],
+                }
+            ),
+            201 if created else 409,
+        )
+
+    if created:
+        flash(
+            f"Created {len(created)} of {result['requested']} bookings for {resource.title}.",
+            "success",
+        )
+    for item in conflicts:
+        flash(f"Skipped {item['start']:%a %b %d %H:%M}: {item['reason']}", "warning")
+    return redirect(url_for("bookings.my_bookings"))
+
+
+def _request_error(message: str, resource_id, wants_json: bool, status: int = 400):
+    """Return a series or waitlist request error as JSON or a flash + redirect."""
+    if wants_json:
+        return jsonify({"error": message}), status
+    flash(message, "error")
+    if resource_id:
+        return redirect(url_for("bookings.new", resource_id=resource_id))
+    return redirect(url_for("resources.index"))
+
+
+@bookings_bp.route("/waitlist", methods=["GET"])
+@login_required
+def waitlist():
+    """List the current user's waiting waitlist entries (JSON)."""
+    entries = WaitlistRepository.get_by_requester(current_user.user_id, status="waiting")
+    return jsonify({"entries": [entry.to_dict() for entry in entries]})
+
+
+@bookings_bp.route("/waitlist", methods=["POST"])
+@login_required
+def join_waitlist():
+    """
+    Join the waitlist for a booked time slot.
+
+    Accepts a JSON body or form data with the same fields as booking creation:
+        resource_id, start_date, start_time, end_date, end_time
+
+    The request is promoted to a booking automatically when an overlapping
+    booking is cancelled or rejected.
+    """
+    data = request.get_json(silent=True) or request.form
+    wants_json = request.is_json
+    resource_id = None
+
+    try:
+        resource_id = int(data.get("resource_id") or 0)
+        start_datetime = datetime.strptime(
+            f"{data.get('start_date')} {data.get('start_time')}", "%Y-%m-%d %H:%M"
+        )
+        end_datetime = datetime.strptime(
+            f"{data.get('end_date') or data.get('start_date')} {data.get('end_time')}",
+            "%Y-%m-%d %H:%M",
+        )
+    except (TypeError, ValueError) as e:
+        return _request_error(f"Invalid date/time format: {e}", resource_id, wants_json)
+
+    try:
+        entry = WaitlistService.join(
+            resource_id, current_user.user_id, start_datetime, end_datetime
+        )
+    except (WaitlistError, AvailabilityViolationError) as e:
+        return _request_error(str(e), resource_id, wants_json)
+
+    if wants_json:
+        return jsonify(entry.to_dict()), 201
+    flash("You're on the waitlist. We'll book the slot for you if it frees up.", "success")
+    return redirect(url_for("bookings.my_bookings"))
+
+
+@bookings_bp.route("/waitlist/<int:entry_id>/leave", methods=["POST"])
+@login_required
+def leave_waitlist(entry_id):
+    """Withdraw one of the current user's waitlist entries."""
+    try:
+        entry = WaitlistService.leave(entry_id, current_user.user_id)
+    except ValueError:
+        return _request_error("Waitlist entry not found", None, request.is_json, 404)
+    except WaitlistError as e:
+        return _request_error(str(e), None, request.is_json)
+
+    if request.is_json:
+        return jsonify(entry.to_dict())
+    flash("You've left the waitlist.", "info")
+    return redirect(url_for("bookings.my_bookings"))
+
+
 @bookings_bp.route("/<int:booking_id>")
 @login_required
 def detail(booking_id):
@@ -180,25 +379,16 @@ def approve(booking_id):
         flash("Booking not found", "error")
         return redirect(url_for("bookings.my_bookings"))
 
-    if booking.status != "pending":
-        flash(f"Cannot approve booking with status: {booking.status}", "error")
+    # Status and conflicts are re-checked under the resource's write lock
+    try:
+        BookingService.approve_booking(booking_id)
+    except BookingStatusError as e:
+        flash(str(e), "error")
         return redirect(url_for("bookings.detail", booking_id=booking_id))
-
-    # Check for conflicts again (in case new bookings were made)
-    conflicts = BookingService.check_booking_conflicts(
-        resource_id=booking.resource_id,
-        start_datetime=booking.start_datetime,
-        end_datetime=booking.end_datetime,
-        exclude_booking_id=booking_id,
-    )
-
-    if conflicts:
-        flash(f"Cannot approve - {len(conflicts)} conflicting booking(s) exist", "error")
+    except BookingConflictError as e:
+        flash(f"Cannot approve - {len(e.conflicts)} conflicting booking(s) exist", "error")
         return redirect(url_for("bookings.detail", booking_id=booking_id))
 
-    # Approve booking
-    booking = BookingRepository.update_status(booking_id, "approved")
-
     flash("Booking approved successfully", "success")
     return redirect(url_for("bookings.detail", booking_id=booking_id))
 
@@ -216,13 +406,13 @@ def reject(booking_id):
         flash("Booking not found", "error")
         return redirect(url_for("bookings.my_bookings"))
 
-    if booking.status != "pending":
-        flash(f"Cannot reject booking with status: {booking.status}", "error")
+    # Reject booking and promote any waitlisted request for the freed slot
+    try:
+        BookingService.deny_booking(booking_id)
+    except BookingStatusError as e:
+        flash(str(e), "error")
         return redirect(url_for("bookings.detail", booking_id=booking_id))
 
-    # Reject booking
-    booking = BookingRepository.update_status(booking_id, "rejected")
-
     flash("Booking rejected", "info")
     return redirect(url_for("bookings.detail", booking_id=booking_id))
 
@@ -244,14 +434,13 @@ def cancel(booking_id):
         flash("You can only cancel your own bookings", "error")
         return redirect(url_for("bookings.detail", booking_id=booking_id))
 
-    # Can only cancel pending or approved bookings
-    if booking.status not in ["pending", "approved"]:
-        flash(f"Cannot cancel booking with status: {booking.status}", "error")
+    # Cancel booking and promote any waitlisted request for the freed slot
+    try:
+        BookingService.cancel_booking(booking_id)
+    except BookingStatusError as e:
+        flash(str(e), "error")
         return redirect(url_for("bookings.detail", booking_id=booking_id))
 
-    # Cancel booking
-    booking = BookingRepository.update_status(booking_id, "cancelled")
-
     flash("Booking cancelled", "info")
     return redirect(url_for("bookings.my_bookings"))
 
@@ -291,32 +480,37 @@ def complete(booking_id):
 @login_required
 def my_bookings():
     """
-    User's booking dashboard showing all their bookings.
+    User's booking dashboard, one tab at a time.
 
-    Tabs: Upcoming, Past, Cancelled
-    """
-    # Get all user's bookings
-    user_bookings = BookingRepository.get_by_requester(current_user.user_id)
+    Tabs: Upcoming, Pending, Past, Cancelled/Rejected. Only the selected tab's
+    page is loaded; the badge counts for every tab come from one GROUP BY.
 
-    # Categorize bookings
+    Query params:
+        tab: upcoming (default), pending, past or cancelled
+        page: Page number (1-based)
+    """
+    tab = request.args.get("tab", "upcoming")
+    if tab not in REQUESTER_TABS:
+        tab = "upcoming"
+    page = max(request.args.get("page", 1, type=int) or 1, 1)
     now = datetime.now()
-    upcoming = []
-    past = []
-    cancelled = []
-
-    for booking in user_bookings:
-        if booking.status == "cancelled":
-            cancelled.append(booking)
-        elif booking.end_datetime < now:
-            past.append(booking)
-        else:
-            upcoming.append(booking)
 
-    # Sort by date
-    upcoming.sort(key=lambda b: b.start_datetime)
-    past.sort(key=lambda b: b.start_datetime, reverse=True)
-    cancelled.sort(key=lambda b: b.created_at, reverse=True)
+    counts = BookingRepository.count_requester_tabs(current_user.user_id, now)
+    pages = max(math.ceil(counts[tab] / MY_BOOKINGS_PER_PAGE), 1)
+    page = min(page, pages)
+    bookings = BookingRepository.get_requester_tab(
+        current_user.user_id, tab, now, page=page, per_page=MY_BOOKINGS_PER_PAGE
+    )
 
     return render_template(
-        "bookings/my_bookings.html", upcoming=upcoming, past=past, cancelled=cancelled
+        "bookings/my_bookings.html",
+        tab=tab,
+        tabs=REQUESTER_TABS,
+        counts=counts,
+        bookings=bookings,
+        page=page,
+        pages=pages,
+        calendar_feed_url=url_for(
+            "calendar.user_feed", token=CalendarService.feed_token(current_user), _external=True
+        ),
     )
@@ -0,0 +1,137 @@
+"""
+Campus Resource Hub - Calendar Feed Routes
+
+iCalendar (.ics) subscription feeds for calendar clients:
+- /calendar/resources/<id>.ics: approved bookings of a published resource
+- /calendar/users/<token>.ics: a user's own bookings (signed token URL)
+- /calendar/feed-url, /calendar/feed-url/rotate: get or revoke that URL
+
+Feeds carry an ETag and Last-Modified; conditional polls for unchanged feeds
+get a 304 after one aggregate query, and changed feeds are streamed.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from flask import Blueprint, Response, abort, jsonify, request, stream_with_context, url_for
+from flask_login import current_user, login_required
+
+from src.repositories.resource_repo import ResourceRepository
+from src.services.calendar_service import (
+    RESOURCE_FEED_STATUSES,
+    USER_FEED_STATUSES,
+    CalendarService,
+)
+
+
+# Create calendar blueprint
+calendar_bp = Blueprint("calendar", __name__, url_prefix="/calendar")
+
+
+@calendar_bp.route("/resources/<int:resource_id>.ics")
+def resource_feed(resource_id):
+    """
+    iCalendar feed of a resource's approved bookings.
+
+    Security: Public for published resources (no requester details are
+    included); unpublished resources only for their owner and admin/staff.
+    """
+    resource = ResourceRepository.get_by_id(resource_id)
+    if resource is None or not resource.is_visible_to(current_user):
+        abort(404)
+
+    window = CalendarService.feed_window()
+    etag, last_modified = CalendarService.fingerprint(
+        f"resource:{resource_id}",
+        window,
+        RESOURCE_FEED_STATUSES,
+        resource_id=resource_id,
+        extra_modified=resource.updated_at,
+    )
+    return _feed_response(
+        etag,
+        last_modified,
+        lambda: CalendarService.iter_feed(
+            resource.title,
+            window,
+            RESOURCE_FEED_STATUSES,
+            request.host.split(":")[0],
+            resource_id=resource_id,
+            public=True,
+        ),
+        f"resource-{resource_id}.ics",
+    )
+
+
+@calendar_bp.route("/users/<token>.ics")
+def user_feed(token):
+    """
+    iCalendar feed of a user's pending, approved and completed bookings.
+
+    Security: The URL's signed token identifies the user (calendar clients
+    cannot send session cookies); rotating the user's nonce revokes it.
+    """
+    user = CalendarService.user_from_token(token)
+    if user is None:
+        abort(404)
+
+    user_id = user.user_id
+    window = CalendarService.feed_window()
+    # The user's name is the calendar title, so it is part of the feed identity
+    etag, last_modified = CalendarService.fingerprint(
+        f"user:{user_id}:{user.name}", window, USER_FEED_STATUSES, requester_id=user_id
+    )
+    return _feed_response(
+        etag,
+        last_modified,
+        lambda: CalendarService.iter_feed(
+            f"{user.name} - Bookings",
+            window,
+            USER_FEED_STATUSES,
+            request.host.split(":")[0],
+            requester_id=user_id,
+        ),
+        "my-bookings.ics",
+    )
+
+
+@calendar_bp.route("/feed-url")
+@login_required
+def feed_url():
+    """Return the current user's private calendar subscription URL (JSON)."""
+    token = CalendarService.feed_token(current_user)
+    return jsonify({"url": url_for("calendar.user_feed", token=token, _external=True)})
+
+
+@calendar_bp.route("/feed-url/rotate", methods=["POST"])
+@login_required
+def rotate_feed_url():
+    """Revoke the current user's subscription URL and return a new one (JSON)."""
+    token = CalendarService.rotate_feed_token(current_user.user_id)
+    return jsonify({"url": url_for("calendar.user_feed", token=token, _external=True)})
+
+
+def _feed_response(
+    etag: str, last_modified: Optional[datetime], make_body, filename: str
+) -> Response:
+    """Answer 304 when the client's copy is current, otherwise stream the feed."""
+    modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0) if last_modified else None
+
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = bool(modified and since and modified <= since)
+
+    if not_modified:
+        response = Response(status=304)
+    else:
+        response = Response(
+            stream_with_context(make_body()), content_type="text/calendar; charset=utf-8"
+        )
+        response.headers["Content-Disposition"] = f'inline; filename="{filename}"'
+    response.set_etag(etag)
+    if modified:
+        response.last_modified = modified
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
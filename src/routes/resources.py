@@ -9,15 +9,22 @@ AI Contribution: Cline generated CRUD route structure
 Reviewed by developer on 2025-11-05
 """
 
+import base64
+import binascii
+import json
 from datetime import datetime, date, time, timedelta
-from typing import Optional
+from typing import Any, Optional, Tuple
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
 from werkzeug.datastructures import ImmutableMultiDict
 
 from src.security.rbac import require_admin
 from src.services.resource_service import ResourceService, ResourceServiceError
-from src.repositories.resource_repo import ResourceRepository
+from src.services.facet_service import FacetService
+from src.services.search_service import SearchService
+from src.services.availability_service import AvailabilityService
+from src.models.resource import Resource
+from src.repositories.resource_repo import ResourceRepository, KEYSET_SORTS
 from src.repositories.review_repo import ReviewRepository
 from src.repositories.booking_repo import BookingRepository
 
@@ -25,6 +32,14 @@ from src.repositories.booking_repo import BookingRepository
 # Create resources blueprint
 resources_bp = Blueprint("resources", __name__)
 
+# Longest range the free-slot finder will sweep in one request
+FREE_SLOT_MAX_DAYS = 92
+
+# Availability matrix request limits
+MATRIX_MAX_RESOURCES = 200
+MATRIX_MAX_DAYS = 92
+MATRIX_MAX_HOURLY_DAYS = 14
+
 
 # --------------------------------------------------------------------------- #
 # Helper utilities
@@ -40,6 +55,35 @@ def _parse_date(value: str) -> Optional[date]:
         return None
 
 
+def _encode_cursor(sort: str, key: Tuple[Any, int]) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor."""
+    value, resource_id = key
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "v": value, "id": resource_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by _encode_cursor for the same sort.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort:
+            raise ValueError("Cursor does not match sort")
+        value, resource_id = payload["v"], int(payload["id"])
+        if sort.startswith("created"):
+            value = datetime.fromisoformat(value)
+    except (binascii.Error, KeyError, TypeError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    return value, resource_id
+
+
 def _date_range_to_datetimes(
     start_date: Optional[date], end_date: Optional[date]
 ) -> tuple[Optional[datetime], Optional[datetime]]:
@@ -63,30 +107,19 @@ def _date_range_to_datetimes(
     return start_dt, end_dt
 
 
-def _build_availability_calendar(resource_id: int, days: int = 14) -> list[dict[str, object]]:
+def _build_availability_calendar(resource, days: int = 14) -> list[dict[str, object]]:
     """
     Build a lightweight availability calendar for the right rail.
 
-    Marks the next N days as 'booked' if an approved booking overlaps that date.
+    Marks the next N days as 'closed' when the resource's availability rules have
+    no open hours that day, else 'booked' if an approved booking overlaps that date.
     """
     today = date.today()
-    approved_bookings = BookingRepository.get_by_resource(resource_id, status="approved")
-    calendar = []
-
-    for offset in range(days):
-        day = today + timedelta(days=offset)
-        is_booked = any(
-            booking.start_datetime.date() <= day <= booking.end_datetime.date()
-            for booking in approved_bookings
-        )
-        calendar.append(
-            {
-                "date": day,
-                "status": "booked" if is_booked else "available",
-            }
-        )
-
-    return calendar
+    matrix = AvailabilityService.occupancy_matrix([resource], today, days)
+    return [
+        {"date": today + timedelta(days=offset), "status": status}
+        for offset, status in enumerate(matrix["rows"][0]["status"])
+    ]
 
 
 def _extract_availability_rules(form: ImmutableMultiDict) -> dict:
@@ -168,11 +201,7 @@ def admin_ping():
 
 
 CATEGORY_FILTERS = [
-    {"value": "study_room", "label": "Study Room"},
-    {"value": "equipment", "label": "Equipment"},
-    {"value": "lab", "label": "Lab / Workshop"},
-    {"value": "space", "label": "Event Space"},
-    {"value": "tutoring", "label": "Tutoring / Mentoring"},
+    {"value": value, "label": label} for value, label in Resource.CATEGORY_LABELS.items()
 ]
 
 STATUS_FILTERS = [
@@ -188,11 +217,11 @@ def index():
     List all published resources (public route).
 
     Filters: category, location, search query
-    Pagination: 20 items per page
+    Pagination: 20 items per page (LIMIT/OFFSET + COUNT in SQL)
     """
     # Get query parameters
     search_term = request.args.get("q")
-    page = request.args.get("page", 1, type=int)
+    page = max(request.args.get("page", 1, type=int), 1)
     per_page = 20
 
     # Multi-select filters fall back to legacy single-value params for backward compatibility
@@ -218,9 +247,9 @@ def index():
     date_to = _parse_date(date_to_raw) if date_to_raw else None
     availability_start, availability_end = _date_range_to_datetimes(date_from, date_to)
 
-    sort = request.args.get("sort", "created_desc")
+    sort = request.args.get("sort") or ("relevance" if search_term else "created_desc")
 
-    resources = ResourceRepository.search(
+    results = SearchService.search(
         query_str=search_term,
         status="published",
         categories=selected_categories or None,
@@ -231,24 +260,41 @@ def index():
         availability_start=availability_start,
         availability_end=availability_end,
         sort=sort,
+        page=page,
+        per_page=per_page,
     )
 
-    # Simple pagination (in-memory for now)
-    total = len(resources)
-    start = (page - 1) * per_page
-    end = start + per_page
-    resources_page = resources[start:end]
+    # Facet counts come from the cached one-pass aggregate; selected categories and
+    # locations are left out of the context so every option keeps a useful count
+    facets = FacetService.get_facets(
+        statuses=selected_statuses,
+        context={
+            "query_str": search_term,
+            "capacity_min": capacity_min,
+            "capacity_max": capacity_max,
+        },
+    )
 
     return render_template(
         "resources/list.html",
-        resources=resources_page,
+        resources=results["items"],
+        card_meta=ResourceRepository.get_card_metadata(
+            [resource.resource_id for resource in results["items"]]
+        ),
         search_term=search_term,
-        page=page,
-        total=total,
+        page=results["page"],
+        total=results["total"],
         per_page=per_page,
-        category_filters=CATEGORY_FILTERS,
-        status_filters=STATUS_FILTERS,
-        location_facets=ResourceRepository.get_location_facets(),
+        category_filters=[
+            {**option, "count": facets["categories"].get(option["value"], 0)}
+            for option in CATEGORY_FILTERS
+        ],
+        status_filters=[
+            {**option, "count": facets["statuses"].get(option["value"], 0)}
+            for option in STATUS_FILTERS
+        ],
+        location_facets=facets["locations"],
+        capacity_facets=facets["capacity_buckets"],
         filter_state={
             "categories": selected_categories,
             "locations": selected_locations,
@@ -262,6 +308,73 @@ def index():
     )
 
 
+@resources_bp.route("/api/resources")
+def api_list():
+    """
+    JSON resource listing with keyset (cursor) pagination.
+
+    Query params: q, category (repeatable), location (repeatable), capacity_min,
+    capacity_max, date_from, date_to, sort (created_desc, created_asc, title_asc,
+    title_desc), limit (1-100, default 50), cursor (next_cursor of the previous page)
+    """
+    sort = request.args.get("sort") or "created_desc"
+    if sort not in KEYSET_SORTS:
+        return (
+            jsonify({"error": f"Unsupported sort. Use one of: {', '.join(KEYSET_SORTS)}"}),
+            400,
+        )
+
+    limit = min(max(request.args.get("limit", 50, type=int), 1), 100)
+
+    after = None
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            after = _decode_cursor(cursor, sort)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    allow_status_filter = current_user.is_authenticated and current_user.role in ["staff", "admin"]
+    statuses = (request.args.getlist("status") if allow_status_filter else []) or ["published"]
+
+    date_from = _parse_date(request.args.get("date_from", ""))
+    date_to = _parse_date(request.args.get("date_to", ""))
+    availability_start, availability_end = _date_range_to_datetimes(date_from, date_to)
+
+    # Fetch one extra row to know whether another page exists
+    rows = ResourceRepository.search_keyset(
+        after=after,
+        limit=limit + 1,
+        sort=sort,
+        statuses=statuses,
+        query_str=request.args.get("q") or None,
+        categories=request.args.getlist("category") or None,
+        locations=request.args.getlist("location") or None,
+        capacity_min=request.args.get("capacity_min", type=int),
+        capacity_max=request.args.get("capacity_max", type=int),
+        availability_start=availability_start,
+        availability_end=availability_end,
+    )
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    card_meta = ResourceRepository.get_card_metadata([r.resource_id for r in items])
+
+    return jsonify(
+        {
+            "items": [
+                {**resource.to_dict(), **card_meta.get(resource.resource_id, {})}
+                for resource in items
+            ],
+            "limit": limit,
+            "sort": sort,
+            "has_more": has_more,
+            "next_cursor": _encode_cursor(sort, ResourceRepository.keyset_key(items[-1], sort))
+            if has_more
+            else None,
+        }
+    )
+
+
 @resources_bp.route("/resources/<int:resource_id>")
 def detail(resource_id):
     """
@@ -280,13 +393,8 @@ def detail(resource_id):
 
     include_hidden_reviews = current_user.is_authenticated and current_user.role == "admin"
     reviews = ReviewRepository.get_by_resource(resource_id, include_hidden=include_hidden_reviews)
-    visible_reviews = [r for r in reviews if not r.is_hidden]
-    avg_rating = (
-        round(sum(r.rating for r in visible_reviews) / len(visible_reviews), 1)
-        if visible_reviews
-        else None
-    )
-    review_count = len(visible_reviews)
+    avg_rating = resource.get_average_rating()
+    review_count = resource.get_review_count()
 
     user_review = None
     can_review = False
@@ -300,7 +408,7 @@ def detail(resource_id):
             for booking in completed_bookings
         )
 
-    availability_calendar = _build_availability_calendar(resource_id)
+    availability_calendar = _build_availability_calendar(resource)
     next_available = next(
         (day["date"] for day in availability_calendar if day["status"] == "available"), None
     )
@@ -331,14 +439,8 @@ def availability(resource_id):
     if not resource:
         return jsonify({"error": "Resource not found"}), 404
 
-    # Only expose unpublished resources to owners/admin/staff
-    if not resource.is_published():
-        allowed = False
-        if current_user.is_authenticated:
-            if current_user.user_id == resource.owner_id or current_user.role in ["admin", "staff"]:
-                allowed = True
-        if not allowed:
-            return jsonify({"error": "Resource unavailable"}), 403
+    if not resource.is_visible_to(current_user):
+        return jsonify({"error": "Resource unavailable"}), 403
 
     date_param = request.args.get("date")
     day = _parse_date(date_param) if date_param else date.today()
@@ -346,15 +448,21 @@ def availability(resource_id):
         return jsonify({"error": "Invalid date"}), 400
 
     bookings = BookingRepository.get_for_day(resource_id, day, statuses=["approved"])
-    availability_rules = resource.get_availability_rules()
+    rules = AvailabilityService.get_compiled(resource)
+    day_start = datetime.combine(day, time.min)
 
     return jsonify(
         {
             "resource_id": resource_id,
             "date": day.isoformat(),
-            "requires_approval": availability_rules.get("requires_approval", False)
-            if availability_rules
-            else False,
+            "requires_approval": rules.requires_approval,
+            "max_booking_hours": rules.max_booking_minutes / 60
+            if rules.max_booking_minutes
+            else None,
+            "open_windows": [
+                {"start": start.isoformat(), "end": end.isoformat()}
+                for start, end in rules.open_windows(day_start, day_start + timedelta(days=1))
+            ],
             "bookings": [
                 {
                     "booking_id": booking.booking_id,
@@ -368,6 +476,137 @@ def availability(resource_id):
     )
 
 
+@resources_bp.route("/resources/availability-matrix")
+def availability_matrix():
+    """
+    Return an occupancy grid for many resources over a date window (JSON).
+
+    Query params:
+        ids: Resource IDs, comma-separated and/or repeated
+        start: First day YYYY-MM-DD (default: today)
+        days: Window length (day resolution up to MATRIX_MAX_DAYS, hour up to
+            MATRIX_MAX_HOURLY_DAYS)
+        resolution: "day" (default) or "hour"
+
+    Resources that do not exist or are not visible to the caller are skipped.
+    """
+    try:
+        resource_ids = sorted(
+            {
+                int(part)
+                for value in request.args.getlist("ids")
+                for part in value.split(",")
+                if part.strip()
+            }
+        )
+        days = int(request.args.get("days") or 14)
+    except ValueError:
+        return jsonify({"error": "ids and days must be integers"}), 400
+
+    if not resource_ids:
+        return jsonify({"error": "At least one resource id is required"}), 400
+    if len(resource_ids) > MATRIX_MAX_RESOURCES:
+        return jsonify({"error": f"At most {MATRIX_MAX_RESOURCES} resources per request"}), 400
+
+    resolution = request.args.get("resolution", "day")
+    max_days = MATRIX_MAX_HOURLY_DAYS if resolution == "hour" else MATRIX_MAX_DAYS
+    if not 1 <= days <= max_days:
+        return jsonify({"error": f"days must be between 1 and {max_days}"}), 400
+
+    start_param = request.args.get("start")
+    start_day = _parse_date(start_param) if start_param else date.today()
+    if not start_day:
+        return jsonify({"error": "Invalid start date"}), 400
+
+    resources = [
+        resource
+        for resource in ResourceRepository.get_by_ids(resource_ids)
+        if resource.is_visible_to(current_user)
+    ]
+    try:
+        matrix = AvailabilityService.occupancy_matrix(resources, start_day, days, resolution)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(
+        {
+            **matrix,
+            "start": matrix["start"].isoformat(),
+            "end": matrix["end"].isoformat(),
+            "slots": [slot.isoformat() for slot in matrix["slots"]],
+        }
+    )
+
+
+@resources_bp.route("/resources/<int:resource_id>/free-slots")
+def free_slots(resource_id):
+    """
+    Return merged free intervals for a resource over a date range (JSON).
+
+    Query params:
+        start, end: Inclusive YYYY-MM-DD range (default: today); ``date`` sets both
+        min_duration: Minimum free interval length in minutes
+        granularity: Snap interval edges to this many minutes (e.g. 30)
+
+    Past time is never reported as free.
+    """
+    resource = ResourceRepository.get_by_id(resource_id)
+    if not resource:
+        return jsonify({"error": "Resource not found"}), 404
+
+    if not resource.is_visible_to(current_user):
+        return jsonify({"error": "Resource unavailable"}), 403
+
+    single_day = request.args.get("date")
+    start_param = request.args.get("start") or single_day
+    end_param = request.args.get("end") or single_day or start_param
+    start_day = _parse_date(start_param) if start_param else date.today()
+    end_day = _parse_date(end_param) if end_param else start_day
+    if not start_day or not end_day or end_day < start_day:
+        return jsonify({"error": "Invalid date range"}), 400
+    if (end_day - start_day).days >= FREE_SLOT_MAX_DAYS:
+        return jsonify({"error": f"Date range is limited to {FREE_SLOT_MAX_DAYS} days"}), 400
+
+    try:
+        min_duration = int(request.args.get("min_duration") or 0)
+        granularity = int(request.args.get("granularity") or 0)
+    except ValueError:
+        return jsonify({"error": "min_duration and granularity must be integers"}), 400
+    if min_duration < 0 or not 0 <= granularity <= 24 * 60:
+        return jsonify({"error": "Invalid min_duration or granularity"}), 400
+
+    range_start = datetime.combine(start_day, time.min)
+    range_end = datetime.combine(end_day + timedelta(days=1), time.min)
+    slots = AvailabilityService.find_free_slots(
+        resource,
+        max(range_start, datetime.now()),
+        range_end,
+        min_duration=min_duration or None,
+        granularity=granularity or None,
+    )
+    rules = AvailabilityService.get_compiled(resource)
+
+    return jsonify(
+        {
+            "resource_id": resource_id,
+            "start": start_day.isoformat(),
+            "end": end_day.isoformat(),
+            "requires_approval": rules.requires_approval,
+            "max_booking_hours": rules.max_booking_minutes / 60
+            if rules.max_booking_minutes
+            else None,
+            "free": [
+                {
+                    "start": slot_start.isoformat(),
+                    "end": slot_end.isoformat(),
+                    "minutes": int((slot_end - slot_start).total_seconds() // 60),
+                }
+                for slot_start, slot_end in slots
+            ],
+        }
+    )
+
+
 @resources_bp.route("/resources/create", methods=["GET", "POST"])
 @login_required
 def create():
@@ -600,5 +839,6 @@ def my_resources():
     Shows draft, published, and archived resources.
     """
     resources = ResourceRepository.get_by_owner(current_user.user_id)
+    card_meta = ResourceRepository.get_card_metadata([r.resource_id for r in resources])
 
-    return render_template("resources/my_resources.html", resources=resources)
+    return render_template("resources/my_resources.html", resources=resources, card_meta=card_meta)
@@ -242,24 +242,17 @@ def list_reviews(resource_id):
     if not resource:
         return jsonify({"error": "Resource not found"}), 404
 
-    # Get visible reviews (not hidden)
-    reviews = ReviewRepository.get_by_resource(resource_id, include_hidden=False)
-
-    # Calculate aggregate rating
-    if reviews:
-        avg_rating = sum(r.rating for r in reviews) / len(reviews)
-        review_count = len(reviews)
-    else:
-        avg_rating = None
-        review_count = 0
-
     # If JSON request, return JSON
     if request.accept_mimetypes.best == "application/json":
+        # Get visible reviews (not hidden); aggregate comes from the persisted summary
+        reviews = ReviewRepository.get_by_resource(resource_id, include_hidden=False)
+        summary = ReviewRepository.get_rating_summary(resource_id)
+
         return jsonify(
             {
                 "resource_id": resource_id,
-                "average_rating": round(avg_rating, 1) if avg_rating else None,
-                "review_count": review_count,
+                "average_rating": summary.get_average_rating() if summary else None,
+                "review_count": summary.review_count if summary else 0,
                 "reviews": [
                     {
                         "review_id": r.review_id,
@@ -282,22 +275,20 @@ def get_rating(resource_id):
     """
     Get aggregate rating for a resource (API endpoint).
 
-    Returns JSON with average rating and count.
+    Returns JSON with average rating, count and 1-5 distribution, read from the
+    persisted rating summary (constant time regardless of review volume).
     """
-    reviews = ReviewRepository.get_by_resource(resource_id, include_hidden=False)
-
-    if reviews:
-        avg_rating = sum(r.rating for r in reviews) / len(reviews)
-        review_count = len(reviews)
-    else:
-        avg_rating = None
-        review_count = 0
+    summary = ReviewRepository.get_rating_summary(resource_id)
+    avg_rating = summary.get_average_rating() if summary else None
 
     return jsonify(
         {
             "resource_id": resource_id,
-            "average_rating": round(avg_rating, 1) if avg_rating else None,
-            "review_count": review_count,
+            "average_rating": avg_rating,
+            "review_count": summary.review_count if summary else 0,
+            "distribution": summary.get_rating_distribution()
+            if summary
+            else {rating: 0 for rating in range(1, 6)},
             "top_rated": avg_rating >= 4.5 if avg_rating else False,
         }
     )
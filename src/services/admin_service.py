@@ -8,16 +8,30 @@ AI Contribution: Cline generated admin service structure
 Reviewed and extended by developer on 2025-11-06
 """
 
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left, insort
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, date
-from sqlalchemy import func, or_
+from flask import current_app
+from sqlalchemy import case, func
 from src.app import db
 from src.models.user import User
 from src.models.resource import Resource
 from src.models.booking import Booking
 from src.models.message import Message
 from src.models.review import Review
+from src.models.cache_generation import CacheGeneration
+from src.repositories.analytics_repo import AnalyticsRepository
+from src.repositories.booking_repo import BookingRepository
+from src.repositories.review_repo import ReviewRepository
 from src.repositories.user_repo import UserRepository
+from src.services.booking_service import BookingService
+from src.services.interval_cache_service import IntervalCacheService
+from src.services.search_service import SEARCH_GENERATION
+from src.services.waitlist_service import WaitlistService
+from src.utils.cache import app_cache, clear_app_cache
+
+
+PLATFORM_STATS_CACHE_NAME = "platform_stats"
 
 
 class AdminServiceError(Exception):
@@ -38,10 +52,17 @@ class AdminService:
     """
 
     @staticmethod
-    def get_platform_stats() -> Dict[str, Any]:
+    def get_platform_stats(refresh: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive platform statistics.
 
+        Counts come from one aggregate query per table (conditional SUMs or
+        GROUP BY) and are cached for PLATFORM_STATS_CACHE_TTL seconds, so
+        dashboards left open and refreshed do not recount every table.
+
+        Args:
+            refresh: Recompute and re-cache instead of serving cached counts
+
         Returns:
             Dict containing platform-wide metrics:
             - total_users, active_users, suspended_users
@@ -49,135 +70,80 @@ class AdminService:
             - total_bookings, pending_bookings, completed_bookings
             - total_messages, total_reviews
             - hidden_reviews
+            - generated_at (ISO timestamp of the computation)
 
         Example:
             >>> stats = AdminService.get_platform_stats()
             >>> print(f"Total users: {stats['total_users']}")
         """
+        cache = app_cache(
+            PLATFORM_STATS_CACHE_NAME,
+            maxsize=1,
+            ttl=current_app.config.get("PLATFORM_STATS_CACHE_TTL", 60),
+        )
         try:
-            # User statistics
-            total_users = db.session.query(func.count(User.user_id)).scalar() or 0
-            active_users = (
-                db.session.query(func.count(User.user_id)).filter(User.is_active.is_(True)).scalar()
-                or 0
-            )
-            suspended_users = (
-                db.session.query(func.count(User.user_id))
-                .filter(User.is_active.is_(False))
-                .scalar()
-                or 0
-            )
-
-            # Role distribution
-            admins = (
-                db.session.query(func.count(User.user_id)).filter(User.role == "admin").scalar()
-                or 0
-            )
-            staff = (
-                db.session.query(func.count(User.user_id)).filter(User.role == "staff").scalar()
-                or 0
-            )
-            students = (
-                db.session.query(func.count(User.user_id)).filter(User.role == "student").scalar()
-                or 0
-            )
-
-            # Resource statistics
-            total_resources = db.session.query(func.count(Resource.resource_id)).scalar() or 0
-            published_resources = (
-                db.session.query(func.count(Resource.resource_id))
-                .filter(Resource.status == "published")
-                .scalar()
-                or 0
-            )
-            draft_resources = (
-                db.session.query(func.count(Resource.resource_id))
-                .filter(Resource.status == "draft")
-                .scalar()
-                or 0
-            )
-            archived_resources = (
-                db.session.query(func.count(Resource.resource_id))
-                .filter(Resource.status == "archived")
-                .scalar()
-                or 0
-            )
-
-            # Booking statistics
-            total_bookings = db.session.query(func.count(Booking.booking_id)).scalar() or 0
-            pending_bookings = (
-                db.session.query(func.count(Booking.booking_id))
-                .filter(Booking.status == "pending")
-                .scalar()
-                or 0
-            )
-            approved_bookings = (
-                db.session.query(func.count(Booking.booking_id))
-                .filter(Booking.status == "approved")
-                .scalar()
-                or 0
-            )
-            completed_bookings = (
-                db.session.query(func.count(Booking.booking_id))
-                .filter(Booking.status == "completed")
-                .scalar()
-                or 0
-            )
-            cancelled_bookings = (
-                db.session.query(func.count(Booking.booking_id))
-                .filter(or_(Booking.status == "cancelled", Booking.status == "rejected"))
-                .scalar()
-                or 0
-            )
-
-            # Message statistics
-            total_messages = db.session.query(func.count(Message.message_id)).scalar() or 0
-            unread_messages = (
-                db.session.query(func.count(Message.message_id))
-                .filter(Message.is_read.is_(False))
-                .scalar()
-                or 0
-            )
-
-            # Review statistics
-            total_reviews = db.session.query(func.count(Review.review_id)).scalar() or 0
-            hidden_reviews = (
-                db.session.query(func.count(Review.review_id))
-                .filter(Review.is_hidden.is_(True))
-                .scalar()
-                or 0
-            )
-
-            return {
-                # User stats
-                "total_users": total_users,
-                "active_users": active_users,
-                "suspended_users": suspended_users,
-                "admins": admins,
-                "staff": staff,
-                "students": students,
-                # Resource stats
-                "total_resources": total_resources,
-                "published_resources": published_resources,
-                "draft_resources": draft_resources,
-                "archived_resources": archived_resources,
-                # Booking stats
-                "total_bookings": total_bookings,
-                "pending_bookings": pending_bookings,
-                "approved_bookings": approved_bookings,
-                "completed_bookings": completed_bookings,
-                "cancelled_bookings": cancelled_bookings,
-                # Message stats
-                "total_messages": total_messages,
-                "unread_messages": unread_messages,
-                # Review stats
-                "total_reviews": total_reviews,
-                "hidden_reviews": hidden_reviews,
-            }
-
+            if refresh:
+                cache.set("all", AdminService._compute_platform_stats())
+            return dict(cache.get_or_set("all", AdminService._compute_platform_stats))
         except Exception as e:
             raise AdminServiceError(f"Failed to get platform stats: {e}")
 
+    @staticmethod
+    def invalidate_platform_stats() -> None:
+        """Drop cached platform statistics (next read recomputes them)."""
+        clear_app_cache(PLATFORM_STATS_CACHE_NAME)
+
+    @staticmethod
+    def _compute_platform_stats() -> Dict[str, Any]:
+        users = db.session.query(
+            func.count(User.user_id),
+            _count_where(User.is_active.is_(True)),
+            _count_where(User.is_active.is_(False)),
+            _count_where(User.role == "admin"),
+            _count_where(User.role == "staff"),
+            _count_where(User.role == "student"),
+        ).one()
+        resources = dict(
+            db.session.query(Resource.status, func.count(Resource.resource_id))
+            .group_by(Resource.status)
+            .all()
+        )
+        bookings = BookingRepository.count_all_by_status()
+        messages = db.session.query(
+            func.count(Message.message_id), _count_where(Message.is_read.is_(False))
+        ).one()
+        reviews = db.session.query(
+            func.count(Review.review_id), _count_where(Review.is_hidden.is_(True))
+        ).one()
+
+        return {
+            # User stats
+            "total_users": users[0],
+            "active_users": users[1] or 0,
+            "suspended_users": users[2] or 0,
+            "admins": users[3] or 0,
+            "staff": users[4] or 0,
+            "students": users[5] or 0,
+            # Resource stats
+            "total_resources": sum(resources.values()),
+            "published_resources": resources.get("published", 0),
+            "draft_resources": resources.get("draft", 0),
+            "archived_resources": resources.get("archived", 0),
+            # Booking stats
+            "total_bookings": sum(bookings.values()),
+            "pending_bookings": bookings.get("pending", 0),
+            "approved_bookings": bookings.get("approved", 0),
+            "completed_bookings": bookings.get("completed", 0),
+            "cancelled_bookings": bookings.get("cancelled", 0) + bookings.get("rejected", 0),
+            # Message stats
+            "total_messages": messages[0],
+            "unread_messages": messages[1] or 0,
+            # Review stats
+            "total_reviews": reviews[0],
+            "hidden_reviews": reviews[1] or 0,
+            "generated_at": datetime.utcnow().isoformat(),
+        }
+
     @staticmethod
     def get_recent_activity(limit: int = 20) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -392,6 +358,7 @@ class AdminService:
             user.is_active = False
             user.suspended_at = datetime.utcnow()
             db.session.commit()
+            AdminService.invalidate_platform_stats()
 
             return True
 
@@ -424,6 +391,7 @@ class AdminService:
             user.is_active = True
             user.suspended_at = None
             db.session.commit()
+            AdminService.invalidate_platform_stats()
 
             return True
 
@@ -468,9 +436,14 @@ class AdminService:
             if user_id == admin_id:
                 raise AdminServiceError("Cannot delete your own account")
 
+            # Reviews are not cascaded by the ORM; delete them first so their
+            # ratings leave the resources' summaries
+            ReviewRepository.delete_by_reviewer(user_id)
+
             # Delete user (cascade will handle related records)
             db.session.delete(user)
             db.session.commit()
+            AdminService.invalidate_platform_stats()
 
             return True
 
@@ -522,6 +495,9 @@ class AdminService:
         """
         Get booking trends over specified time period.
 
+        Reads the daily booking rollups (bookings created per day by status),
+        so the cost depends on the number of days, not of bookings.
+
         Args:
             days: Number of days to analyze (default 30)
 
@@ -529,28 +505,13 @@ class AdminService:
             Dict with trend data
         """
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-            # Bookings by status in period
-            trends = (
-                db.session.query(Booking.status, func.count(Booking.booking_id))
-                .filter(Booking.created_at >= cutoff_date)
-                .group_by(Booking.status)
-                .all()
-            )
-
-            # Total bookings in period
-            total_in_period = (
-                db.session.query(func.count(Booking.booking_id))
-                .filter(Booking.created_at >= cutoff_date)
-                .scalar()
-                or 0
-            )
+            cutoff_day = (datetime.utcnow() - timedelta(days=days)).date()
+            by_status = AnalyticsRepository.get_created_by_status(since=cutoff_day)
 
             return {
                 "period_days": days,
-                "total_bookings": total_in_period,
-                "by_status": {status: count for status, count in trends},
+                "total_bookings": sum(by_status.values()),
+                "by_status": by_status,
             }
 
         except Exception as e:
@@ -591,37 +552,94 @@ class AdminService:
     @staticmethod
     def process_booking_approvals(
         booking_ids: List[int], action: str, admin_id: int
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
-        Bulk approve or reject bookings.
-        Returns counts of processed and skipped bookings.
+        Bulk approve or reject pending bookings as one set-based operation.
+
+        Candidates and the approved bookings they could overlap are loaded with
+        one query each, under the write lock of every affected resource.
+        Conflicts inside the batch are resolved earliest-created-wins (ties by
+        booking ID); losers and bookings overlapping an existing approval stay
+        pending. Status changes are applied with a single UPDATE; rejected
+        bookings that held their slot promote the waitlist as deny_booking does.
+
+        Args:
+            booking_ids: Bookings to process
+            action: "approve" or "reject"
+            admin_id: Acting admin
+
+        Returns:
+            Dict with processed, skipped, conflicts and total counts, plus
+            results: one {booking_id, outcome, reason, conflicting_booking_ids}
+            per requested ID, where outcome is "approved", "rejected",
+            "conflict", "skipped" (not pending) or "not_found"
+
+        Raises:
+            AdminServiceError: If the input is invalid or the update fails
         """
         if not booking_ids:
             raise AdminServiceError("No bookings selected")
         if action not in {"approve", "reject"}:
             raise AdminServiceError("Invalid action")
 
+        booking_ids = list(dict.fromkeys(booking_ids))
         try:
-            bookings = Booking.query.filter(Booking.booking_id.in_(booking_ids)).all()
-            processed = 0
-            skipped = 0
-
-            for booking in bookings:
-                if booking.status != "pending":
-                    skipped += 1
-                    continue
-
-                if action == "approve":
-                    booking.approve()
-                else:
-                    booking.reject()
-                processed += 1
-
-            db.session.commit()
-            return {"processed": processed, "skipped": skipped, "total": len(booking_ids)}
+            candidates = BookingRepository.get_by_ids(booking_ids)
+            resource_ids = sorted({booking.resource_id for booking in candidates})
+            with BookingRepository.resource_write_lock(*resource_ids):
+                # Re-read under the lock; another request may have moved them on
+                candidates = BookingRepository.get_by_ids(booking_ids)
+                outcomes = _resolve_approvals(candidates, action)
+                status = "approved" if action == "approve" else "rejected"
+                winners = [bid for bid, outcome in outcomes.items() if outcome[0] == status]
+                freed = []
+                if status == "rejected":
+                    winner_ids = set(winners)
+                    freed = WaitlistService.slot_holders(
+                        b for b in candidates if b.booking_id in winner_ids
+                    )
+                windows = sorted({(b.resource_id, b.start_datetime, b.end_datetime) for b in freed})
+                changed = BookingRepository.bulk_update_status(winners, status)
+                # Rejecting a promoted request frees its slot, as deny_booking does
+                for resource_id, start, end in windows:
+                    WaitlistService.promote_freed(resource_id, start, end)
         except Exception as e:
-            db.session.rollback()
             raise AdminServiceError(f"Failed to update approvals: {e}")
+        if changed:
+            if status == "approved":
+                # Core UPDATE skips mapper events; newly approved bookings change
+                # search availability, so bump by hand
+                CacheGeneration.bump(SEARCH_GENERATION)
+            BookingService.invalidate_statistics()
+            IntervalCacheService.invalidate(resource_ids)
+            AdminService.invalidate_platform_stats()
+
+        results = []
+        for booking_id in booking_ids:
+            outcome, reason, conflicting = outcomes.get(
+                booking_id, ("not_found", "Booking not found", [])
+            )
+            results.append(
+                {
+                    "booking_id": booking_id,
+                    "outcome": outcome,
+                    "reason": reason,
+                    "conflicting_booking_ids": conflicting,
+                }
+            )
+
+        counts = {outcome: 0 for outcome in ("approved", "rejected", "conflict")}
+        for outcome, _, _ in outcomes.values():
+            if outcome in counts:
+                counts[outcome] += 1
+        processed = counts["approved"] + counts["rejected"]
+        return {
+            "processed": processed,
+            "conflicts": counts["conflict"],
+            "skipped": len(booking_ids) - processed - counts["conflict"],
+            "total": len(booking_ids),
+            "results": results,
+        }
 
     @staticmethod
     def get_flagged_reviews(limit: int = 5) -> List[Dict[str, Any]]:
@@ -658,31 +676,13 @@ class AdminService:
 
     @staticmethod
     def get_bookings_per_day(days: int = 14) -> Dict[str, Any]:
-        """Return bookings per day over the provided window."""
+        """Return bookings per day (by start date) over the provided window, from the rollups."""
         try:
             days = max(1, days)
             today = date.today()
             start_day = today - timedelta(days=days - 1)
-            start_dt = datetime.combine(start_day, datetime.min.time())
+            counts_map = AnalyticsRepository.get_daily_counts(start_day, today)
 
-            day_field = func.date(Booking.start_datetime)
-            rows = (
-                db.session.query(day_field.label("day"), func.count(Booking.booking_id))
-                .filter(Booking.start_datetime >= start_dt)
-                .group_by(day_field)
-                .order_by(day_field)
-                .all()
-            )
-
-            counts_map = {}
-            for day_value, count in rows:
-                if isinstance(day_value, str):
-                    parsed_day = datetime.strptime(day_value, "%Y-%m-%d").date()
-                elif isinstance(day_value, datetime):
-                    parsed_day = day_value.date()
-                else:
-                    parsed_day = day_value
-                counts_map[parsed_day] = count
             labels = []
             data = []
             for i in range(days):
@@ -704,23 +704,11 @@ class AdminService:
 
     @staticmethod
     def get_category_popularity(days: Optional[int] = None, limit: int = 6) -> Dict[str, Any]:
-        """Return booking counts grouped by resource category."""
+        """Return approved/completed booking counts per resource category, from the rollups."""
         try:
-            query = (
-                db.session.query(Resource.category, func.count(Booking.booking_id).label("count"))
-                .join(Booking, Booking.resource_id == Resource.resource_id)
-                .filter(Booking.status.in_(["approved", "completed"]))
-            )
-
-            if days:
-                cutoff = datetime.utcnow() - timedelta(days=days)
-                query = query.filter(Booking.created_at >= cutoff)
-
-            rows = (
-                query.group_by(Resource.category)
-                .order_by(func.count(Booking.booking_id).desc())
-                .limit(limit)
-                .all()
+            since = (datetime.utcnow() - timedelta(days=days)).date() if days else None
+            rows = AnalyticsRepository.get_created_by_category(
+                ["approved", "completed"], since=since, limit=limit
             )
 
             if not rows:
@@ -813,7 +801,94 @@ class AdminService:
                 updated += 1
 
             db.session.commit()
+            AdminService.invalidate_platform_stats()
             return {"updated": updated, "skipped": skipped, "total": len(user_ids)}
         except Exception as e:
             db.session.rollback()
             raise AdminServiceError(f"Failed to update users: {e}")
+
+
+def _count_where(condition):
+    """SUM(CASE WHEN condition THEN 1 ELSE 0 END) - a filtered count in a shared scan."""
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _resolve_approvals(
+    candidates: List[Booking], action: str
+) -> Dict[int, Tuple[str, Optional[str], List[int]]]:
+    """
+    Decide the outcome of each candidate booking without writing anything.
+
+    Pending candidates are visited earliest-created first. For approvals, each
+    one is checked against the resource's existing approved bookings (loaded in
+    one range query) and against the candidates already accepted in this batch,
+    which never overlap each other and so stay a sorted, disjoint list.
+
+    Returns:
+        {booking_id: (outcome, reason, conflicting_booking_ids)}
+    """
+    outcomes: Dict[int, Tuple[str, Optional[str], List[int]]] = {}
+    pending = []
+    for booking in candidates:
+        if booking.status == "pending":
+            pending.append(booking)
+        else:
+            outcomes[booking.booking_id] = (
+                "skipped",
+                f"Booking is {booking.status}, not pending",
+                [],
+            )
+
+    if action == "reject" or not pending:
+        for booking in pending:
+            outcomes[booking.booking_id] = ("rejected", None, [])
+        return outcomes
+
+    existing: Dict[int, List[Tuple[datetime, datetime, int]]] = {}
+    for booking_id, resource_id, start, end in BookingRepository.get_intervals_in_range(
+        sorted({booking.resource_id for booking in pending}),
+        min(booking.start_datetime for booking in pending),
+        max(booking.end_datetime for booking in pending),
+        statuses=["approved"],
+        with_ids=True,
+    ):
+        existing.setdefault(resource_id, []).append((start, end, booking_id))
+
+    accepted: Dict[int, List[Tuple[datetime, datetime, int]]] = {}
+    for booking in sorted(pending, key=lambda b: (b.created_at or datetime.min, b.booking_id)):
+        start, end = booking.start_datetime, booking.end_datetime
+        # Existing approvals may overlap each other (legacy data), so scan every
+        # one that starts before this booking ends
+        blockers = existing.get(booking.resource_id, [])
+        upto = bisect_left(blockers, (end,))
+        clashes = [bid for s, e, bid in blockers[:upto] if e > start]
+        if clashes:
+            outcomes[booking.booking_id] = (
+                "conflict",
+                "Conflicts with an existing approved booking",
+                clashes,
+            )
+            continue
+
+        batch = accepted.setdefault(booking.resource_id, [])
+        position = bisect_left(batch, (start,))
+        # The batch is disjoint, so only the predecessor can reach into this
+        # window from the left; every later entry starting before it ends clashes
+        clashes = []
+        if position and batch[position - 1][1] > start:
+            clashes.append(batch[position - 1][2])
+        while position < len(batch) and batch[position][0] < end:
+            clashes.append(batch[position][2])
+            position += 1
+        if clashes:
+            outcomes[booking.booking_id] = (
+                "conflict",
+                "Overlaps an earlier request approved in this batch",
+                clashes,
+            )
+            continue
+
+        insort(batch, (start, end, booking.booking_id))
+        outcomes[booking.booking_id] = ("approved", None, [])
+
+    return outcomes
@@ -268,6 +268,15 @@ class AIConciergeService:
                 status="published",
             )
 
+            # Misspelled building names ("Libary Hall") miss the substring filter;
+            # retry with the location as a typo-tolerant search term
+            if not all_resources and filters.get("location"):
+                all_resources = ResourceRepository.search(
+                    query_str=filters["location"],
+                    category=filters.get("category"),
+                    status="published",
+                )
+
             # Filter by capacity if specified
             if "min_capacity" in filters:
                 all_resources = [
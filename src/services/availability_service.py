@@ -0,0 +1,468 @@
+"""
+Availability Service - Compiled resource availability rules.
+
+Resource.availability_rules is a JSON blob:
+
+    {
+        "days": ["monday", "tuesday"],          # omitted/empty = every day
+        "hours": {"start": "08:00", "end": "18:00"},  # omitted = all day
+        "requires_approval": true,
+        "max_booking_hours": 4
+    }
+
+Each resource's rules are compiled once into a weekly bitmap with one bit per
+minute of the week (Monday 00:00 = bit 0). Compiled rules are cached per
+(resource_id, updated_at), so edits recompile automatically. Checking a booking
+is then a single mask comparison regardless of how the rules were written, and
+open windows come from pre-computed runs of set bits.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flask import current_app
+
+from src.models.resource import Resource
+from src.repositories.booking_repo import BookingRepository
+from src.services.interval_cache_service import IntervalCacheService
+from src.utils.cache import app_cache
+
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+FULL_WEEK = (1 << MINUTES_PER_WEEK) - 1
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_DAY_ALIASES = {day[:3]: index for index, day in enumerate(WEEKDAYS)}
+
+RULES_CACHE_NAME = "availability_rules"
+
+# Occupancy matrix cell sizes in minutes
+MATRIX_RESOLUTIONS = {"day": MINUTES_PER_DAY, "hour": 60}
+
+
+class AvailabilityViolationError(Exception):
+    """Raised when a proposed booking falls outside a resource's availability rules."""
+
+    pass
+
+
+class CompiledRules:
+    """
+    Immutable compiled form of one resource's availability rules.
+
+    Attributes:
+        bitmap: Open minutes of the week as an int bitmask
+        windows: Open runs as (start_minute, end_minute) in week coordinates
+        requires_approval: Whether bookings need owner approval
+        max_booking_minutes: Longest allowed booking, or None
+    """
+
+    __slots__ = ("bitmap", "windows", "requires_approval", "max_booking_minutes")
+
+    def __init__(
+        self,
+        bitmap: int,
+        requires_approval: bool = False,
+        max_booking_minutes: Optional[int] = None,
+    ):
+        self.bitmap = bitmap
+        self.windows = _runs(bitmap)
+        self.requires_approval = requires_approval
+        self.max_booking_minutes = max_booking_minutes
+
+    @property
+    def always_open(self) -> bool:
+        return self.bitmap == FULL_WEEK
+
+    def violation(self, start: datetime, end: datetime) -> Optional[str]:
+        """
+        Return why [start, end) breaks the rules, or None if it is allowed.
+
+        Runs in constant time: one duration check and one bitmap mask test.
+        """
+        duration = _minutes_between(start, end)
+        if duration <= 0:
+            return "Booking must end after it starts"
+        if self.max_booking_minutes and duration > self.max_booking_minutes:
+            hours = self.max_booking_minutes / 60
+            return f"Bookings are limited to {hours:g} hour(s)"
+        if self.always_open:
+            return None
+        if duration > MINUTES_PER_WEEK:
+            return "Booking spans closed hours"
+
+        offset = _week_minute(start)
+        mask = (1 << duration) - 1
+        rotated = ((mask << offset) | (mask >> (MINUTES_PER_WEEK - offset))) & FULL_WEEK
+        if self.bitmap & rotated != rotated:
+            return "Booking falls outside the resource's available hours"
+        return None
+
+    def open_windows(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        Enumerate open intervals intersecting [start, end), clipped to the range.
+
+        Adjacent runs across week boundaries are merged.
+        """
+        if end <= start or not self.windows:
+            return []
+
+        week_start = datetime.combine(start.date() - timedelta(days=start.weekday()), time.min)
+        windows: List[Tuple[datetime, datetime]] = []
+        while week_start < end:
+            for run_start, run_end in self.windows:
+                window_start = max(week_start + timedelta(minutes=run_start), start)
+                window_end = min(week_start + timedelta(minutes=run_end), end)
+                if window_start >= window_end:
+                    continue
+                if windows and windows[-1][1] == window_start:
+                    windows[-1] = (windows[-1][0], window_end)
+                else:
+                    windows.append((window_start, window_end))
+            week_start += timedelta(days=7)
+        return windows
+
+    def is_open_on(self, day: date) -> bool:
+        """Return True if any minute of the given day is open."""
+        day_start = day.weekday() * MINUTES_PER_DAY
+        day_mask = ((1 << MINUTES_PER_DAY) - 1) << day_start
+        return bool(self.bitmap & day_mask)
+
+
+class AvailabilityService:
+    """
+    Service layer for availability rules.
+
+    Handles:
+    - Compiling JSON rules into weekly bitmaps (cached per resource version)
+    - Validating proposed bookings against the rules
+    - Enumerating open windows for availability/calendar views
+    - Finding free intervals (open windows minus approved bookings)
+    - Multi-resource occupancy grids for front-desk views
+    """
+
+    @staticmethod
+    def compile_rules(rules: Optional[Dict[str, Any]]) -> CompiledRules:
+        """
+        Compile a rules dict into a CompiledRules bitmap.
+
+        Unknown day names are ignored; missing or unparsable hours mean all day.
+        An end time at or before the start time runs past midnight.
+        """
+        rules = rules or {}
+        days = _parse_days(rules.get("days")) or list(range(7))
+
+        hours = rules.get("hours") or {}
+        start_minute = _parse_hhmm(hours.get("start")) if isinstance(hours, dict) else None
+        end_minute = _parse_hhmm(hours.get("end")) if isinstance(hours, dict) else None
+        start_minute = 0 if start_minute is None else start_minute
+        end_minute = MINUTES_PER_DAY if end_minute is None else end_minute
+        if end_minute <= start_minute:
+            end_minute += MINUTES_PER_DAY
+        length = end_minute - start_minute
+
+        bitmap = 0
+        daily = (1 << length) - 1
+        for day in days:
+            offset = day * MINUTES_PER_DAY + start_minute
+            bitmap |= (daily << offset) | (daily >> (MINUTES_PER_WEEK - offset))
+        bitmap &= FULL_WEEK
+
+        max_hours = rules.get("max_booking_hours")
+        try:
+            max_minutes = int(float(max_hours) * 60) if max_hours else None
+        except (TypeError, ValueError):
+            max_minutes = None
+
+        return CompiledRules(
+            bitmap,
+            requires_approval=bool(rules.get("requires_approval")),
+            max_booking_minutes=max_minutes,
+        )
+
+    @staticmethod
+    def get_compiled(resource: Resource) -> CompiledRules:
+        """Return the compiled rules for a resource, compiling on first use per version."""
+        if resource.resource_id is None:
+            return AvailabilityService.compile_rules(resource.get_availability_rules())
+
+        cache = app_cache(
+            RULES_CACHE_NAME,
+            maxsize=current_app.config.get("AVAILABILITY_RULES_CACHE_SIZE", 1024),
+            ttl=0,
+        )
+        key = (resource.resource_id, resource.updated_at)
+        return cache.get_or_set(
+            key, lambda: AvailabilityService.compile_rules(resource.get_availability_rules())
+        )
+
+    @staticmethod
+    def validate_booking(resource: Resource, start: datetime, end: datetime) -> None:
+        """
+        Check a proposed booking against the resource's availability rules.
+
+        Raises:
+            AvailabilityViolationError: If the booking is outside the rules
+        """
+        reason = AvailabilityService.get_compiled(resource).violation(start, end)
+        if reason:
+            raise AvailabilityViolationError(reason)
+
+    @staticmethod
+    def open_windows(
+        resource: Resource, start: datetime, end: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """Return the resource's open intervals within [start, end)."""
+        return AvailabilityService.get_compiled(resource).open_windows(start, end)
+
+    @staticmethod
+    def find_free_slots(
+        resource: Resource,
+        start: datetime,
+        end: datetime,
+        min_duration: Optional[int] = None,
+        granularity: Optional[int] = None,
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Return merged free intervals of a resource within [start, end).
+
+        One range query (or the interval cache, when enabled) supplies the
+        approved bookings; they are merged and swept out of the resource's open
+        windows in a single pass.
+
+        Args:
+            resource: Resource to inspect
+            start: Range start
+            end: Range end
+            min_duration: Drop free intervals shorter than this many minutes
+            granularity: Snap interval edges inward to multiples of this many
+                minutes since midnight (e.g. 15 or 30)
+
+        Returns:
+            Sorted, disjoint (start, end) tuples
+        """
+        windows = AvailabilityService.open_windows(resource, start, end)
+        if not windows:
+            return []
+
+        busy = IntervalCacheService.busy_intervals(resource.resource_id, start, end)
+        if busy is None:
+            bookings = BookingRepository.get_in_range(
+                resource.resource_id, start, end, statuses=["approved"]
+            )
+            busy = [(b.start_datetime, b.end_datetime) for b in bookings]
+        busy = _merge(busy)
+        free = _subtract(windows, busy)
+
+        if granularity:
+            free = [
+                (_snap(slot_start, granularity, up=True), _snap(slot_end, granularity, up=False))
+                for slot_start, slot_end in free
+            ]
+        shortest = timedelta(minutes=min_duration or 0)
+        return [
+            (slot_start, slot_end)
+            for slot_start, slot_end in free
+            if slot_end > slot_start and slot_end - slot_start >= shortest
+        ]
+
+    @staticmethod
+    def occupancy_matrix(
+        resources: Sequence[Resource],
+        start_day: date,
+        days: int,
+        resolution: str = "day",
+    ) -> Dict[str, Any]:
+        """
+        Build a per-resource occupancy grid over consecutive days.
+
+        Approved bookings for every resource in the window are fetched with a
+        single query; each booking then touches only the cells it overlaps.
+
+        Args:
+            resources: Resources to include (one grid row each)
+            start_day: First day of the window
+            days: Number of days
+            resolution: "day" or "hour" cells
+
+        Returns:
+            Dict with start, end, resolution, slots (cell start datetimes) and
+            rows. Each row holds the resource_id, title, status per cell
+            ("closed", "booked" or "available"), booked_minutes and
+            open_minutes per cell.
+
+        Raises:
+            ValueError: If resolution is not one of MATRIX_RESOLUTIONS
+        """
+        if resolution not in MATRIX_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        bucket = MATRIX_RESOLUTIONS[resolution]
+        count = days * MINUTES_PER_DAY // bucket
+        origin = datetime.combine(start_day, time.min)
+        window_end = origin + timedelta(days=days)
+
+        busy_by_resource: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        for resource_id, start, end in BookingRepository.get_intervals_in_range(
+            [resource.resource_id for resource in resources],
+            origin,
+            window_end,
+            statuses=["approved"],
+        ):
+            busy_by_resource.setdefault(resource_id, []).append((start, end))
+
+        rows = []
+        for resource in resources:
+            windows = AvailabilityService.open_windows(resource, origin, window_end)
+            open_minutes = _bucket_minutes(windows, origin, bucket, count)
+            # Booked time counts only while the resource is open
+            busy = _merge(busy_by_resource.get(resource.resource_id, []))
+            booked_minutes = _bucket_minutes(_intersect(windows, busy), origin, bucket, count)
+            touched = _bucket_minutes(busy, origin, bucket, count)
+            rows.append(
+                {
+                    "resource_id": resource.resource_id,
+                    "title": resource.title,
+                    "status": [
+                        "closed" if not opened else "booked" if hit else "available"
+                        for opened, hit in zip(open_minutes, touched)
+                    ],
+                    "booked_minutes": booked_minutes,
+                    "open_minutes": open_minutes,
+                }
+            )
+
+        return {
+            "start": start_day,
+            "end": start_day + timedelta(days=days - 1),
+            "resolution": resolution,
+            "slots": [origin + timedelta(minutes=index * bucket) for index in range(count)],
+            "rows": rows,
+        }
+
+
+def _bucket_minutes(
+    intervals: List[Tuple[datetime, datetime]], origin: datetime, bucket: int, count: int
+) -> List[int]:
+    """Spread disjoint intervals over ``count`` buckets of ``bucket`` minutes from origin."""
+    totals = [0] * count
+    for start, end in intervals:
+        start_minute = max(0, int((start - origin).total_seconds() // 60))
+        end_minute = min(count * bucket, int(-(-(end - origin).total_seconds() // 60)))
+        index = start_minute // bucket
+        while index < count and index * bucket < end_minute:
+            low = max(start_minute, index * bucket)
+            high = min(end_minute, (index + 1) * bucket)
+            totals[index] += high - low
+            index += 1
+    return totals
+
+
+def _merge(intervals: List[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    """Sort intervals by start and merge overlapping or touching ones."""
+    merged: List[Tuple[datetime, datetime]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _subtract(
+    windows: List[Tuple[datetime, datetime]], busy: List[Tuple[datetime, datetime]]
+) -> List[Tuple[datetime, datetime]]:
+    """Sweep sorted, disjoint busy intervals out of sorted, disjoint windows."""
+    free: List[Tuple[datetime, datetime]] = []
+    index = 0
+    for window_start, window_end in windows:
+        cursor = window_start
+        # Busy intervals ending before this window can never matter again
+        while index < len(busy) and busy[index][1] <= window_start:
+            index += 1
+        probe = index
+        while probe < len(busy) and busy[probe][0] < window_end:
+            busy_start, busy_end = busy[probe]
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            probe += 1
+        if cursor < window_end:
+            free.append((cursor, window_end))
+    return free
+
+
+def _intersect(
+    windows: List[Tuple[datetime, datetime]], busy: List[Tuple[datetime, datetime]]
+) -> List[Tuple[datetime, datetime]]:
+    """Return the parts of sorted, disjoint busy intervals that fall inside windows."""
+    overlap: List[Tuple[datetime, datetime]] = []
+    index = 0
+    for window_start, window_end in windows:
+        while index < len(busy) and busy[index][1] <= window_start:
+            index += 1
+        probe = index
+        while probe < len(busy) and busy[probe][0] < window_end:
+            overlap.append((max(busy[probe][0], window_start), min(busy[probe][1], window_end)))
+            probe += 1
+    return overlap
+
+
+def _snap(moment: datetime, granularity: int, up: bool) -> datetime:
+    """Round a datetime to a multiple of granularity minutes since midnight."""
+    midnight = datetime.combine(moment.date(), time.min)
+    minutes = (moment - midnight).total_seconds() / 60
+    steps = -(-minutes // granularity) if up else minutes // granularity
+    return midnight + timedelta(minutes=int(steps) * granularity)
+
+
+def _parse_days(days: Any) -> List[int]:
+    if not isinstance(days, (list, tuple)):
+        return []
+    parsed = []
+    for day in days:
+        index = _DAY_ALIASES.get(str(day).strip().lower()[:3])
+        if index is not None and index not in parsed:
+            parsed.append(index)
+    return parsed
+
+
+def _parse_hhmm(value: Any) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        hours, minutes = str(value).split(":")[:2]
+        total = int(hours) * 60 + int(minutes)
+    except ValueError:
+        return None
+    return total if 0 <= total <= MINUTES_PER_DAY else None
+
+
+def _week_minute(moment: datetime) -> int:
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def _minutes_between(start: datetime, end: datetime) -> int:
+    """Whole minutes covered by [start, end), rounding a partial last minute up."""
+    start = start.replace(second=0, microsecond=0)
+    seconds = (end - start).total_seconds()
+    return int(-(-seconds // 60))
+
+
+def _runs(bitmap: int) -> List[Tuple[int, int]]:
+    """Return runs of set bits as (start, end) minute pairs in week coordinates."""
+    runs: List[Tuple[int, int]] = []
+    position = 0
+    remaining = bitmap
+    while remaining:
+        # Skip to the next set bit, then measure the run of ones
+        zeros = (remaining & -remaining).bit_length() - 1
+        position += zeros
+        remaining >>= zeros
+        ones = (~remaining & (remaining + 1)).bit_length() - 1
+        runs.append((position, position + ones))
+        position += ones
+        remaining >>= ones
+    return runs
@@ -0,0 +1,422 @@
+"""
+Booking Import Service - Campus Resource Hub
+Bulk import of bookings from CSV, JSON or JSON Lines files.
+
+Files are parsed as a stream and validated in chunks (one resource query and
+one user query per chunk), so only the compact accepted rows are held in
+memory. Conflicts within the file and with approved bookings already in the
+database are found in one sort-by-(resource, start) sweep, and accepted rows
+are written with bulk_insert_mappings in batches inside a single transaction.
+
+Row fields:
+    resource_id: Resource to book (required)
+    requester_email or requester_id: Booking owner (required)
+    start_datetime, end_datetime: "YYYY-MM-DD HH:MM" or ISO 8601 local time (required)
+    status: "approved" or "pending" (optional, defaults per import)
+"""
+
+import csv
+import json
+from bisect import bisect_left
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from src.models.cache_generation import CacheGeneration
+from src.repositories import BookingRepository, ResourceRepository, UserRepository
+from src.services.availability_service import AvailabilityService
+from src.services.booking_service import BookingService
+from src.services.interval_cache_service import IntervalCacheService
+from src.services.search_service import SEARCH_GENERATION
+
+
+IMPORT_FORMATS = ("csv", "json", "jsonl")
+IMPORT_STATUSES = ("pending", "approved")
+CHUNK_SIZE = 500
+JSON_READ_SIZE = 64 * 1024
+
+_EXTENSIONS = {"csv": "csv", "json": "json", "jsonl": "jsonl", "ndjson": "jsonl"}
+
+
+class BookingImportError(Exception):
+    """Raised when an import file cannot be read at all (bad format or syntax)."""
+
+    pass
+
+
+class ImportRow(NamedTuple):
+    """A validated row awaiting the conflict sweep."""
+
+    line: int
+    resource_id: int
+    requester_id: int
+    start: datetime
+    end: datetime
+    status: str
+
+
+class BookingImportService:
+    """
+    Service for bulk booking imports.
+
+    Handles:
+    - Streaming CSV / JSON array / JSON Lines parsing
+    - Chunked validation against users, resources and availability rules
+    - Intra-file and database conflict detection in one sweep
+    - Batched bulk inserts with a per-row error report
+    """
+
+    @staticmethod
+    def detect_format(filename: str) -> str:
+        """
+        Infer the import format from a filename extension.
+
+        Raises:
+            BookingImportError: If the extension is not supported
+        """
+        extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        if extension not in _EXTENSIONS:
+            raise BookingImportError(
+                f"Unsupported file type '{extension or filename}' (use .csv, .json or .jsonl)"
+            )
+        return _EXTENSIONS[extension]
+
+    @staticmethod
+    def import_stream(
+        stream: TextIO,
+        fmt: str,
+        default_status: str = "approved",
+        dry_run: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Validate and import bookings from a text stream.
+
+        Args:
+            stream: Open text stream positioned at the start of the file
+            fmt: One of IMPORT_FORMATS
+            default_status: Status for rows without one ("approved" or "pending")
+            dry_run: Validate and report without writing anything
+            chunk_size: Rows validated per lookup round-trip and inserted per batch
+
+        Returns:
+            Dict with total, imported, rejected, dry_run and errors (list of
+            {line, errors, row} sorted by line)
+
+        Raises:
+            BookingImportError: If the format is unknown or the file is malformed
+        """
+        if fmt not in IMPORT_FORMATS:
+            raise BookingImportError(f"Unsupported import format: {fmt}")
+        if default_status not in IMPORT_STATUSES:
+            raise BookingImportError(f"Unsupported import status: {default_status}")
+
+        total = 0
+        valid: List[ImportRow] = []
+        errors: List[Dict[str, Any]] = []
+        raw_by_line: Dict[int, Dict[str, Any]] = {}
+
+        for chunk in _chunks(_iter_rows(stream, fmt), chunk_size):
+            total += len(chunk)
+            chunk_valid, chunk_errors = BookingImportService._validate_chunk(chunk, default_status)
+            valid.extend(chunk_valid)
+            errors.extend(chunk_errors)
+            # Keep raw fields only for rows that may still fail the conflict sweep
+            chunk_raw = dict(chunk)
+            raw_by_line.update((row.line, chunk_raw[row.line]) for row in chunk_valid)
+
+        imported = 0
+        if valid:
+            resource_ids = sorted({row.resource_id for row in valid})
+            with BookingRepository.resource_write_lock(*resource_ids):
+                existing = BookingRepository.get_intervals_in_range(
+                    resource_ids,
+                    min(row.start for row in valid),
+                    max(row.end for row in valid),
+                    statuses=["approved"],
+                )
+                accepted, conflicts = _sweep(valid, existing)
+                errors.extend(
+                    {"line": row.line, "errors": [reason], "row": raw_by_line[row.line]}
+                    for row, reason in conflicts
+                )
+
+                if accepted and not dry_run:
+                    imported = BookingRepository.bulk_insert(
+                        [
+                            {
+                                "resource_id": row.resource_id,
+                                "requester_id": row.requester_id,
+                                "start_datetime": row.start,
+                                "end_datetime": row.end,
+                                "status": row.status,
+                            }
+                            for row in accepted
+                        ],
+                        batch_size=chunk_size,
+                    )
+                elif dry_run:
+                    imported = len(accepted)
+            if imported and not dry_run:
+                if any(row.status == "approved" for row in accepted):
+                    # bulk_insert_mappings skips mapper events; bump search caches by hand
+                    CacheGeneration.bump(SEARCH_GENERATION)
+                BookingService.invalidate_statistics()
+                IntervalCacheService.invalidate()
+
+        errors.sort(key=lambda error: error["line"])
+        return {
+            "total": total,
+            "imported": imported,
+            "rejected": len(errors),
+            "dry_run": dry_run,
+            "errors": errors,
+        }
+
+    @staticmethod
+    def write_error_report(errors: Iterable[Dict[str, Any]], stream: TextIO) -> None:
+        """Write rejected rows as CSV (line, errors, then the original fields)."""
+        errors = list(errors)
+        fields: List[str] = []
+        for error in errors:
+            fields.extend(key for key in error["row"] if key not in fields)
+
+        writer = csv.DictWriter(
+            stream, fieldnames=["line", "errors", *fields], extrasaction="ignore"
+        )
+        writer.writeheader()
+        for error in errors:
+            writer.writerow(
+                {**error["row"], "line": error["line"], "errors": "; ".join(error["errors"])}
+            )
+
+    @staticmethod
+    def _validate_chunk(
+        chunk: List[Tuple[int, Dict[str, Any]]], default_status: str
+    ) -> Tuple[List[ImportRow], List[Dict[str, Any]]]:
+        """Validate one chunk with a single resource lookup and a single user lookup."""
+        resource_ids = {_as_int(raw.get("resource_id")) for _, raw in chunk} - {None}
+        resources = {r.resource_id: r for r in ResourceRepository.get_by_ids(list(resource_ids))}
+        users_by_email = UserRepository.get_by_emails(
+            [str(raw.get("requester_email") or "") for _, raw in chunk]
+        )
+        users_by_id = UserRepository.get_by_ids(
+            [
+                user_id
+                for user_id in (_as_int(raw.get("requester_id")) for _, raw in chunk)
+                if user_id is not None
+            ]
+        )
+
+        accepted: List[ImportRow] = []
+        rejected: List[Dict[str, Any]] = []
+        for line, raw in chunk:
+            problems: List[str] = []
+
+            resource = resources.get(_as_int(raw.get("resource_id")))
+            if resource is None:
+                problems.append("Unknown resource_id")
+            elif resource.status == "archived":
+                problems.append("Resource is archived")
+
+            email = str(raw.get("requester_email") or "").strip().lower()
+            requester = users_by_email.get(email) if email else None
+            if requester is None:
+                requester = users_by_id.get(_as_int(raw.get("requester_id")))
+            if requester is None:
+                problems.append("Unknown requester")
+
+            start = _parse_datetime(raw.get("start_datetime"))
+            end = _parse_datetime(raw.get("end_datetime"))
+            if start is None or end is None:
+                problems.append("start_datetime and end_datetime must be YYYY-MM-DD HH:MM")
+            elif end <= start:
+                problems.append("end_datetime must be after start_datetime")
+            elif resource is not None:
+                violation = AvailabilityService.get_compiled(resource).violation(start, end)
+                if violation:
+                    problems.append(violation)
+
+            status = str(raw.get("status") or default_status).strip().lower()
+            if status not in IMPORT_STATUSES:
+                problems.append(f"status must be one of {', '.join(IMPORT_STATUSES)}")
+
+            if problems:
+                rejected.append({"line": line, "errors": problems, "row": raw})
+            else:
+                accepted.append(
+                    ImportRow(line, resource.resource_id, requester.user_id, start, end, status)
+                )
+        return accepted, rejected
+
+
+def _sweep(
+    rows: List[ImportRow], existing: List[Tuple[int, datetime, datetime]]
+) -> Tuple[List[ImportRow], List[Tuple[ImportRow, str]]]:
+    """
+    Split valid rows into accepted rows and (row, reason) conflicts.
+
+    Rows are sorted by (resource, start). Approved rows are swept first: a row
+    is rejected if it overlaps an approved database booking (binary search over
+    a prefix maximum of end times) or the previously accepted approved row of
+    the same file. Pending rows are then checked against both sets of approved
+    intervals, mirroring single-booking conflict rules.
+    """
+    blockers: Dict[int, List[Tuple[datetime, datetime, Optional[int]]]] = {}
+    for resource_id, start, end in existing:
+        blockers.setdefault(resource_id, []).append((start, end, None))
+
+    accepted: List[ImportRow] = []
+    conflicts: List[Tuple[ImportRow, str]] = []
+    ordered = sorted(rows, key=lambda row: (row.resource_id, row.start, row.end, row.line))
+
+    db_index = {rid: _IntervalIndex(items) for rid, items in blockers.items()}
+    last_approved: Dict[int, ImportRow] = {}
+    for row in ordered:
+        if row.status != "approved":
+            continue
+        index = db_index.get(row.resource_id)
+        if index is not None and index.find(row.start, row.end):
+            conflicts.append((row, "Conflicts with an existing approved booking"))
+            continue
+        previous = last_approved.get(row.resource_id)
+        if previous is not None and previous.end > row.start:
+            conflicts.append((row, f"Overlaps approved booking on line {previous.line}"))
+            continue
+        last_approved[row.resource_id] = row
+        accepted.append(row)
+        blockers.setdefault(row.resource_id, []).append((row.start, row.end, row.line))
+
+    all_index = {rid: _IntervalIndex(items) for rid, items in blockers.items()}
+    for row in ordered:
+        if row.status == "approved":
+            continue
+        index = all_index.get(row.resource_id)
+        hit = index.find(row.start, row.end) if index is not None else None
+        if hit is None:
+            accepted.append(row)
+        elif hit[1] is None:
+            conflicts.append((row, "Conflicts with an existing approved booking"))
+        else:
+            conflicts.append((row, f"Overlaps approved booking on line {hit[1]}"))
+
+    return accepted, conflicts
+
+
+class _IntervalIndex:
+    """Sorted intervals with a running maximum end for O(log n) overlap checks."""
+
+    def __init__(self, intervals: List[Tuple[datetime, datetime, Optional[int]]]):
+        intervals = sorted(intervals, key=lambda item: item[0])
+        self.starts = [start for start, _, _ in intervals]
+        self.max_end: List[Tuple[datetime, Optional[int]]] = []
+        for _, end, line in intervals:
+            if not self.max_end or end > self.max_end[-1][0]:
+                self.max_end.append((end, line))
+            else:
+                self.max_end.append(self.max_end[-1])
+
+    def find(self, start: datetime, end: datetime) -> Optional[Tuple[datetime, Optional[int]]]:
+        """
+        Return (end, line) of an interval overlapping [start, end), or None.
+
+        line is the import file line for accepted rows and None for bookings
+        already in the database.
+        """
+        position = bisect_left(self.starts, end)
+        if position == 0:
+            return None
+        latest = self.max_end[position - 1]
+        return latest if latest[0] > start else None
+
+
+def _iter_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line/record number, row dict) pairs without reading the whole file."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for raw in reader:
+            yield reader.line_num, {key.strip(): value for key, value in raw.items() if key}
+    elif fmt == "jsonl":
+        for number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield number, _as_object(_loads(line, number), number)
+    else:
+        for number, item in enumerate(_iter_json_array(stream), start=1):
+            yield number, _as_object(item, number)
+
+
+def _iter_json_array(stream: TextIO) -> Iterator[Any]:
+    """Incrementally decode the items of a top-level JSON array."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    eof = False
+
+    while True:
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position >= len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise BookingImportError("JSON imports must be an array of objects")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise BookingImportError(f"Invalid JSON: {e.msg}") from e
+                break
+            yield item
+
+        buffer = buffer[position:]
+        if eof:
+            raise BookingImportError("Invalid JSON: unterminated array")
+        chunk = stream.read(JSON_READ_SIZE)
+        eof = not chunk
+        buffer += chunk
+
+
+def _loads(text: str, number: int) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise BookingImportError(f"Invalid JSON on line {number}: {e.msg}") from e
+
+
+def _as_object(item: Any, number: int) -> Dict[str, Any]:
+    if not isinstance(item, dict):
+        raise BookingImportError(f"Record {number} is not a JSON object")
+    return item
+
+
+def _chunks(rows: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+    # Bookings are stored as naive local times
+    return parsed if parsed.tzinfo is None else None
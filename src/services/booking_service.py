@@ -8,14 +8,29 @@ Implements conflict detection and status transition enforcement.
 
 from typing import Optional, Dict, List
 from datetime import datetime
-from src.repositories import BookingRepository
-from src.models import Booking
+from flask import current_app
+from src.app import db
+from src.repositories import BookingRepository, JobRunRepository, ResourceRepository
+from src.models import Booking, JobRun
+from src.models.cache_generation import CacheGeneration
+from src.services.availability_service import AvailabilityService
+from src.services.interval_cache_service import IntervalCacheService
+from src.services.search_service import SEARCH_GENERATION
+from src.services.waitlist_service import WaitlistService
+from src.utils.cache import app_cache, clear_app_cache, invalidate_on_commit
+
+
+COMPLETION_JOB = "complete-bookings"
+BOOKING_STATS_CACHE_NAME = "booking_stats"
+BOOKING_STATUSES = ("pending", "approved", "rejected", "cancelled", "completed")
 
 
 class BookingConflictError(Exception):
     """Raised when a booking conflicts with existing approved bookings."""
 
-    pass
+    def __init__(self, message: str, conflicts: Optional[List[Booking]] = None):
+        super().__init__(message)
+        self.conflicts = conflicts or []
 
 
 class BookingStatusError(Exception):
@@ -53,6 +68,11 @@ class BookingService:
         Returns:
             True if conflicts exist, False otherwise
         """
+        cached = IntervalCacheService.has_conflict(
+            resource_id, start_datetime, end_datetime, exclude_booking_id
+        )
+        if cached is not None:
+            return cached
         return BookingRepository.has_conflict(
             resource_id, start_datetime, end_datetime, exclude_booking_id
         )
@@ -78,9 +98,16 @@ class BookingService:
         start_datetime: datetime,
         end_datetime: datetime,
         check_conflicts: bool = True,
+        enforce_rules: bool = True,
+        status: str = "pending",
     ) -> Booking:
         """
-        Create a new booking with conflict detection.
+        Create a new booking with availability-rule and conflict checks.
+
+        The conflict check and the insert run under the resource's write lock, so
+        concurrent requests for the same slot cannot both succeed. When the
+        interval cache is enabled, requests it already shows as conflicting
+        are refused before taking the lock.
 
         Args:
             resource_id: Resource to book
@@ -88,11 +115,14 @@ class BookingService:
             start_datetime: Start time
             end_datetime: End time
             check_conflicts: Whether to check for conflicts (default True)
+            enforce_rules: Whether to enforce the resource's availability rules (default True)
+            status: Initial status (default "pending")
 
         Returns:
             Created Booking instance
 
         Raises:
+            AvailabilityViolationError: If the window is outside the resource's rules
             BookingConflictError: If booking conflicts with approved bookings
             ValueError: If end_datetime is not after start_datetime
         """
@@ -100,23 +130,49 @@ class BookingService:
         if end_datetime <= start_datetime:
             raise ValueError("end_datetime must be after start_datetime")
 
-        # Check for conflicts if requested
-        if check_conflicts:
+        # Check the compiled availability rules (days, hours, max duration)
+        if enforce_rules:
+            resource = ResourceRepository.get_by_id(resource_id)
+            if resource is not None:
+                AvailabilityService.validate_booking(resource, start_datetime, end_datetime)
+
+        if not check_conflicts:
+            return BookingRepository.create(
+                resource_id=resource_id,
+                requester_id=requester_id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                status=status,
+            )
+
+        # Hot resources: reject known conflicts without the lock or the range
+        # query. The cached rows are re-read by primary key, so a stale cache
+        # can only fall through to the full check, never refuse a free slot.
+        cached_ids = IntervalCacheService.conflicting_ids(resource_id, start_datetime, end_datetime)
+        if cached_ids:
+            confirmed = [
+                booking
+                for booking in BookingRepository.get_by_ids(cached_ids)
+                if booking.status == "approved"
+                and booking.resource_id == resource_id
+                and booking.overlaps_with(start_datetime, end_datetime)
+            ]
+            if confirmed:
+                _raise_conflict(confirmed)
+
+        # Check and insert as one serialized unit for this resource
+        with BookingRepository.resource_write_lock(resource_id):
             conflicts = BookingRepository.find_conflicts(resource_id, start_datetime, end_datetime)
             if conflicts:
-                conflict_times = [f"{c.start_datetime} to {c.end_datetime}" for c in conflicts]
-                raise BookingConflictError(
-                    f"Booking conflicts with existing approved bookings: {', '.join(conflict_times)}"
-                )
-
-        # Create booking with pending status
-        return BookingRepository.create(
-            resource_id=resource_id,
-            requester_id=requester_id,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            status="pending",
-        )
+                _raise_conflict(conflicts)
+
+            return BookingRepository.create(
+                resource_id=resource_id,
+                requester_id=requester_id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                status=status,
+            )
 
     @staticmethod
     def approve_booking(booking_id: int, check_conflicts: bool = True) -> Booking:
@@ -142,8 +198,14 @@ class BookingService:
         if not booking.can_be_approved():
             raise BookingStatusError(f"Cannot approve booking with status: {booking.status}")
 
-        # Check if approving would create a conflict
-        if check_conflicts:
+        if not check_conflicts:
+            return BookingRepository.approve(booking_id)
+
+        # Re-check status and conflicts under the resource's write lock
+        with BookingRepository.resource_write_lock(booking.resource_id):
+            if not booking.can_be_approved():
+                raise BookingStatusError(f"Cannot approve booking with status: {booking.status}")
+
             conflicts = BookingRepository.find_conflicts(
                 booking.resource_id,
                 booking.start_datetime,
@@ -152,16 +214,21 @@ class BookingService:
             )
             if conflicts:
                 raise BookingConflictError(
-                    f"Approving this booking would conflict with {len(conflicts)} existing booking(s)"
+                    f"Approving this booking would conflict with {len(conflicts)} existing booking(s)",
+                    conflicts,
                 )
 
-        return BookingRepository.approve(booking_id)
+            return BookingRepository.approve(booking_id)
 
     @staticmethod
     def deny_booking(booking_id: int) -> Booking:
         """
         Deny/reject a pending booking.
 
+        Pending requests do not hold their slot, so nothing is promoted unless
+        the booking itself came from the waitlist; then the next waitlisted
+        requests for its window are promoted in the same transaction.
+
         Args:
             booking_id: Booking ID to deny
 
@@ -179,13 +246,26 @@ class BookingService:
         if not booking.can_be_approved():
             raise BookingStatusError(f"Cannot reject booking with status: {booking.status}")
 
-        return BookingRepository.reject(booking_id)
+        # Reject and promote waitlisted requests as one locked transaction
+        with BookingRepository.resource_write_lock(booking.resource_id):
+            if not booking.can_be_approved():
+                raise BookingStatusError(f"Cannot reject booking with status: {booking.status}")
+            freed = WaitlistService.slot_holders([booking])
+            booking.reject()
+            if freed:
+                WaitlistService.promote_freed(
+                    booking.resource_id, booking.start_datetime, booking.end_datetime
+                )
+        return booking
 
     @staticmethod
     def cancel_booking(booking_id: int) -> Booking:
         """
         Cancel a booking (pending or approved only).
 
+        If the booking held its slot (approved, or pending from the waitlist),
+        waitlisted requests overlapping it are promoted in the same transaction.
+
         Args:
             booking_id: Booking ID to cancel
 
@@ -203,7 +283,17 @@ class BookingService:
         if not booking.can_be_cancelled():
             raise BookingStatusError(f"Cannot cancel booking with status: {booking.status}")
 
-        return BookingRepository.cancel(booking_id)
+        # Cancel and promote waitlisted requests as one locked transaction
+        with BookingRepository.resource_write_lock(booking.resource_id):
+            if not booking.can_be_cancelled():
+                raise BookingStatusError(f"Cannot cancel booking with status: {booking.status}")
+            freed = WaitlistService.slot_holders([booking])
+            booking.cancel()
+            if freed:
+                WaitlistService.promote_freed(
+                    booking.resource_id, booking.start_datetime, booking.end_datetime
+                )
+        return booking
 
     @staticmethod
     def complete_booking(booking_id: int) -> Booking:
@@ -231,6 +321,51 @@ class BookingService:
 
         return BookingRepository.complete(booking_id)
 
+    @staticmethod
+    def complete_finished_bookings(now: Optional[datetime] = None, chunk_size: int = 500) -> JobRun:
+        """
+        Mark every approved booking that has ended as completed.
+
+        Works through the backlog in chunked set-based UPDATEs, committing each
+        chunk so a large backlog never holds one long write lock. Safe to run
+        concurrently or repeatedly: each UPDATE re-checks the approved status.
+
+        Args:
+            now: Cutoff for end_datetime (defaults to the current time)
+            chunk_size: Maximum rows changed per UPDATE/commit
+
+        Returns:
+            JobRun recording the number of bookings completed
+        """
+        # Imported here: admin_service imports this module
+        from src.services.admin_service import AdminService
+
+        cutoff = now or datetime.now()
+        run = JobRunRepository.start(COMPLETION_JOB)
+        completed = 0
+        try:
+            while True:
+                changed = BookingRepository.complete_finished_chunk(cutoff, chunk_size)
+                if not changed:
+                    break
+                db.session.commit()
+                # Core UPDATEs skip mapper events; bump search caches by hand
+                CacheGeneration.bump(SEARCH_GENERATION)
+                BookingService.invalidate_statistics()
+                IntervalCacheService.invalidate()
+                completed += changed
+                if changed < chunk_size:
+                    break
+        except Exception as e:
+            db.session.rollback()
+            JobRunRepository.finish(run, completed, error=str(e))
+            raise
+        finally:
+            if completed:
+                # Platform stats count bookings by status; committed chunks change them
+                AdminService.invalidate_platform_stats()
+        return JobRunRepository.finish(run, completed)
+
     @staticmethod
     def get_booking(booking_id: int) -> Optional[Booking]:
         """Get booking by ID."""
@@ -261,14 +396,41 @@ class BookingService:
         """
         Get booking statistics.
 
+        Counts come from one GROUP BY query and are cached for
+        BOOKING_STATS_CACHE_TTL seconds. The cache is cleared on any committed
+        booking write in this process (see invalidate_statistics for bulk
+        writes that bypass the ORM).
+
         Returns:
-            Dict with counts by status
+            Dict with total and a count for every booking status
         """
-        return {
-            "total": BookingRepository.count(),
-            "pending": BookingRepository.count_by_status("pending"),
-            "approved": BookingRepository.count_by_status("approved"),
-            "rejected": BookingRepository.count_by_status("rejected"),
-            "cancelled": BookingRepository.count_by_status("cancelled"),
-            "completed": BookingRepository.count_by_status("completed"),
-        }
+        cache = app_cache(
+            BOOKING_STATS_CACHE_NAME,
+            maxsize=1,
+            ttl=current_app.config.get("BOOKING_STATS_CACHE_TTL", 30),
+        )
+        return dict(cache.get_or_set("all", BookingService._compute_statistics))
+
+    @staticmethod
+    def invalidate_statistics() -> None:
+        """Drop cached booking statistics (call after commits of Core/bulk booking writes)."""
+        clear_app_cache(BOOKING_STATS_CACHE_NAME)
+
+    @staticmethod
+    def _compute_statistics() -> Dict[str, int]:
+        by_status = BookingRepository.count_all_by_status()
+        stats = {"total": sum(by_status.values())}
+        stats.update({status: by_status.get(status, 0) for status in BOOKING_STATUSES})
+        return stats
+
+
+def _raise_conflict(conflicts: List[Booking]) -> None:
+    conflicts = sorted(conflicts, key=lambda booking: booking.start_datetime)
+    conflict_times = [f"{c.start_datetime} to {c.end_datetime}" for c in conflicts]
+    raise BookingConflictError(
+        f"Booking conflicts with existing approved bookings: {', '.join(conflict_times)}",
+        conflicts,
+    )
+
+
+invalidate_on_commit(Booking, BookingService.invalidate_statistics, key=BOOKING_STATS_CACHE_NAME)
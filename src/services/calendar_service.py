@@ -0,0 +1,221 @@
+"""
+Calendar Service - iCalendar (.ics) feeds for resources and users.
+
+Calendar clients poll feeds frequently, so every feed request first computes a
+fingerprint (max updated_at and row count of the feed's bookings, one aggregate
+query). Unchanged feeds are answered 304 from that alone; changed feeds are
+streamed event by event from a windowed query instead of being built in memory.
+
+Booking times are stored as local wall-clock times and are written as floating
+DATE-TIMEs; DTSTAMP/LAST-MODIFIED use the UTC updated_at timestamps.
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+
+from src.app import db
+from src.models import User
+from src.repositories import BookingRepository, UserRepository
+
+RESOURCE_FEED_STATUSES = ("approved", "completed")
+USER_FEED_STATUSES = ("pending", "approved", "completed")
+
+_FEED_TOKEN_SALT = "calendar-feed"
+_EVENT_STATUS = {"pending": "TENTATIVE", "approved": "CONFIRMED", "completed": "CONFIRMED"}
+
+
+class CalendarService:
+    """
+    Service for iCalendar feeds.
+
+    Handles:
+    - Feed windows and cheap change fingerprints (ETag / Last-Modified)
+    - Streaming RFC 5545 serialization
+    - Signed, revocable per-user feed tokens (calendar clients cannot log in)
+    """
+
+    @staticmethod
+    def feed_window(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+        """
+        Return the (start, end) window a feed covers.
+
+        Days come from CALENDAR_FEED_PAST_DAYS and CALENDAR_FEED_FUTURE_DAYS;
+        the window starts at midnight so it only moves once a day.
+        """
+        today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        past = current_app.config.get("CALENDAR_FEED_PAST_DAYS", 30)
+        future = current_app.config.get("CALENDAR_FEED_FUTURE_DAYS", 180)
+        return today - timedelta(days=past), today + timedelta(days=future + 1)
+
+    @staticmethod
+    def fingerprint(
+        scope: str,
+        window: Tuple[datetime, datetime],
+        statuses: Sequence[str],
+        resource_id: Optional[int] = None,
+        requester_id: Optional[int] = None,
+        extra_modified: Optional[datetime] = None,
+    ) -> Tuple[str, Optional[datetime]]:
+        """
+        Compute the ETag and Last-Modified of a feed without loading its events.
+
+        Args:
+            scope: Feed identity (e.g. "resource:5"), part of the ETag
+            window: Feed window from feed_window()
+            statuses: Booking statuses included in the feed
+            resource_id, requester_id: Feed filter
+            extra_modified: Another timestamp the feed depends on (e.g. the
+                resource's updated_at, since its title is in every event)
+
+        Returns:
+            (etag, last_modified) - last_modified is None for an empty feed
+            with no extra timestamp
+        """
+        max_updated, count, resources_updated = BookingRepository.get_feed_fingerprint(
+            window[0], window[1], statuses, resource_id=resource_id, requester_id=requester_id
+        )
+        stamps = [
+            stamp for stamp in (max_updated, resources_updated, extra_modified) if stamp is not None
+        ]
+        last_modified = max(stamps) if stamps else None
+        key = (
+            f"{scope}|{window[0].isoformat()}|{max_updated}|{count}|{resources_updated}"
+            f"|{extra_modified}"
+        )
+        return hashlib.sha1(key.encode()).hexdigest(), last_modified
+
+    @staticmethod
+    def iter_feed(
+        name: str,
+        window: Tuple[datetime, datetime],
+        statuses: Sequence[str],
+        host: str,
+        resource_id: Optional[int] = None,
+        requester_id: Optional[int] = None,
+        public: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yield an iCalendar document in pieces (header, one chunk per event, footer).
+
+        Args:
+            name: Calendar display name (X-WR-CALNAME)
+            window: Feed window from feed_window()
+            statuses: Booking statuses to include
+            host: Domain used in event UIDs
+            resource_id, requester_id: Feed filter
+            public: Omit requester details and booking status (resource feeds)
+        """
+        yield _lines(
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:-//{current_app.config.get('APP_NAME', 'Campus Resource Hub')}//Bookings//EN",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{_escape(name)}",
+        )
+        for booking, resource in BookingRepository.iter_feed(
+            window[0], window[1], statuses, resource_id=resource_id, requester_id=requester_id
+        ):
+            summary = f"{resource.title} (booked)" if public else resource.title
+            properties = [
+                "BEGIN:VEVENT",
+                f"UID:booking-{booking.booking_id}@{host}",
+                f"DTSTAMP:{_utc(booking.updated_at)}",
+                f"LAST-MODIFIED:{_utc(booking.updated_at)}",
+                f"DTSTART:{_local(booking.start_datetime)}",
+                f"DTEND:{_local(booking.end_datetime)}",
+                f"SUMMARY:{_escape(summary)}",
+            ]
+            if resource.location:
+                properties.append(f"LOCATION:{_escape(resource.location)}")
+            if not public:
+                properties.append(f"STATUS:{_EVENT_STATUS.get(booking.status, 'CONFIRMED')}")
+                properties.append(f"DESCRIPTION:{_escape(f'Booking status: {booking.status}')}")
+            properties.append("END:VEVENT")
+            yield _lines(*properties)
+        yield _lines("END:VCALENDAR")
+
+    @staticmethod
+    def feed_token(user: User) -> str:
+        """Return the signed token identifying a user's feed (valid until rotated)."""
+        return _serializer().dumps([user.user_id, user.calendar_feed_nonce or ""])
+
+    @staticmethod
+    def rotate_feed_token(user_id: int) -> Optional[str]:
+        """
+        Revoke a user's feed URLs by rotating their nonce.
+
+        Returns:
+            The new feed token, or None if the user does not exist
+        """
+        user = UserRepository.get_by_id(user_id)
+        if user is None:
+            return None
+        user.rotate_calendar_feed_nonce()
+        db.session.commit()
+        return CalendarService.feed_token(user)
+
+    @staticmethod
+    def user_from_token(token: str) -> Optional[User]:
+        """Return the user a feed token was issued for, or None if it is invalid or revoked."""
+        try:
+            value = _serializer().loads(token)
+        except BadSignature:
+            return None
+        if not (isinstance(value, list) and len(value) == 2 and isinstance(value[0], int)):
+            return None
+        user = UserRepository.get_by_id(value[0])
+        if user is None or value[1] != (user.calendar_feed_nonce or ""):
+            return None
+        return user
+
+
+def _serializer() -> URLSafeSerializer:
+    return URLSafeSerializer(current_app.config["SECRET_KEY"], salt=_FEED_TOKEN_SALT)
+
+
+def _escape(text: str) -> str:
+    """Escape TEXT values per RFC 5545 section 3.3.11."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line into 75-octet pieces without splitting UTF-8 sequences."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    pieces: List[str] = []
+    current: List[str] = []
+    size = 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        # Continuation lines start with a space, which counts toward the limit
+        if size + width > (75 if not pieces else 74):
+            pieces.append("".join(current))
+            current, size = [], 0
+        current.append(char)
+        size += width
+    pieces.append("".join(current))
+    return "\r\n ".join(pieces)
+
+
+def _lines(*lines: str) -> str:
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+def _utc(moment: Optional[datetime]) -> str:
+    return (moment or datetime.utcnow()).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _local(moment: datetime) -> str:
+    return moment.strftime("%Y%m%dT%H%M%S")
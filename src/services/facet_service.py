@@ -0,0 +1,148 @@
+"""
+Facet Service - Filter drawer counts for the resource catalogue.
+
+Computes location, category, status and capacity-bucket counts from a single
+GROUP BY query and caches the result per filter context. Any committed insert,
+update or delete of a Resource clears the cache.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flask import current_app
+
+from src.models.resource import Resource
+from src.repositories.resource_repo import ResourceRepository
+from src.utils.cache import app_cache, clear_app_cache, invalidate_on_commit
+
+
+FACET_CACHE_NAME = "resource_facets"
+
+# (value, label, min, max) - max None means open-ended
+CAPACITY_BUCKETS: Tuple[Tuple[str, str, int, Optional[int]], ...] = (
+    ("1-4", "1-4 people", 1, 4),
+    ("5-10", "5-10 people", 5, 10),
+    ("11-30", "11-30 people", 11, 30),
+    ("31-100", "31-100 people", 31, 100),
+    ("100+", "100+ people", 101, None),
+)
+
+# Filter keys that may narrow the facet counts (see ResourceRepository._apply_filters)
+CONTEXT_KEYS = ("query_str", "categories", "locations", "capacity_min", "capacity_max")
+
+
+class FacetService:
+    """
+    Service layer for catalogue facet counts.
+
+    Handles:
+    - One-pass aggregation of location, category, status and capacity counts
+    - Optional filter context (search term, capacity range, ...)
+    - Per-app cache invalidated on resource writes
+    """
+
+    @staticmethod
+    def get_facets(
+        statuses: Optional[Sequence[str]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return facet counts, computing them only on a cache miss.
+
+        Location, category and capacity counts cover resources in ``statuses``;
+        status counts cover every status so staff can see what each option adds.
+
+        Args:
+            statuses: Statuses counted by the non-status facets (default: published)
+            context: Optional filter context, keys from CONTEXT_KEYS
+
+        Returns:
+            Dict with locations (list of {label, count}), categories and statuses
+            (dicts of value -> count), capacity_buckets (list) and total
+        """
+        statuses = tuple(sorted(set(statuses or ["published"])))
+        context = FacetService._normalize_context(context)
+        cache = app_cache(
+            FACET_CACHE_NAME,
+            maxsize=current_app.config.get("FACET_CACHE_SIZE", 128),
+            ttl=current_app.config.get("FACET_CACHE_TTL", 300),
+        )
+        key = (statuses, tuple(sorted(context.items())))
+        return cache.get_or_set(key, lambda: FacetService._compute(statuses, context))
+
+    @staticmethod
+    def capacity_bucket(capacity: Optional[int]) -> Optional[str]:
+        """Return the bucket value for a capacity, or None when unset."""
+        if not capacity or capacity < 1:
+            return None
+        for value, _label, low, high in CAPACITY_BUCKETS:
+            if capacity >= low and (high is None or capacity <= high):
+                return value
+        return None
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached facet counts for the current app."""
+        clear_app_cache(FACET_CACHE_NAME)
+
+    @staticmethod
+    def _normalize_context(context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Keep supported, non-empty keys and make values hashable and order-free."""
+        normalized: Dict[str, Any] = {}
+        for key in CONTEXT_KEYS:
+            value = (context or {}).get(key)
+            if value in (None, "", [], ()):
+                continue
+            if key == "query_str":
+                value = " ".join(str(value).lower().split())
+                if not value:
+                    continue
+            elif isinstance(value, (list, tuple, set)):
+                value = tuple(sorted({str(v) for v in value if v}))
+                if not value:
+                    continue
+            normalized[key] = value
+        return normalized
+
+    @staticmethod
+    def _compute(statuses: Tuple[str, ...], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold the grouped rows into every facet in one pass."""
+        locations: Dict[str, int] = {}
+        categories: Dict[str, int] = {}
+        status_counts: Dict[str, int] = {}
+        buckets: Dict[str, int] = {value: 0 for value, *_ in CAPACITY_BUCKETS}
+        total = 0
+
+        for location, category, status, capacity, count in ResourceRepository.get_facet_rows(
+            **context
+        ):
+            status_counts[status] = status_counts.get(status, 0) + count
+            if status not in statuses:
+                continue
+
+            total += count
+            categories[category] = categories.get(category, 0) + count
+            if location:
+                locations[location] = locations.get(location, 0) + count
+            bucket = FacetService.capacity_bucket(capacity)
+            if bucket:
+                buckets[bucket] += count
+
+        location_facets: List[Dict[str, Any]] = [
+            {"label": label, "count": count}
+            for label, count in sorted(locations.items(), key=lambda item: (-item[1], item[0]))
+        ]
+        capacity_facets = [
+            {"value": value, "label": label, "min": low, "max": high, "count": buckets[value]}
+            for value, label, low, high in CAPACITY_BUCKETS
+        ]
+
+        return {
+            "locations": location_facets,
+            "categories": categories,
+            "statuses": status_counts,
+            "capacity_buckets": capacity_facets,
+            "total": total,
+        }
+
+
+invalidate_on_commit(Resource, FacetService.clear_cache, key=FACET_CACHE_NAME)
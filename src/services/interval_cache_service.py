@@ -0,0 +1,197 @@
+"""
+Interval Cache Service - Campus Resource Hub
+Per-process interval trees of each hot resource's approved bookings.
+
+A few resources receive most booking attempts. With
+BOOKING_INTERVAL_CACHE_ENABLED set, a resource's approved bookings in a
+forward window (today to BOOKING_INTERVAL_CACHE_DAYS ahead) are loaded on
+first use into an IntervalTree, so conflict pre-checks and free-slot searches
+in that window are answered in O(log n) without SQL.
+
+The cache is advisory. create_booking and approve_booking still run the
+conflict query inside the resource's write transaction. Committed Booking
+writes in this process drop the affected resources' trees; writes made by
+other processes are picked up after BOOKING_INTERVAL_CACHE_TTL seconds.
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from src.models import Booking
+from src.repositories.booking_repo import BookingRepository
+from src.utils.cache import app_cache, clear_app_cache
+from src.utils.interval_tree import IntervalTree
+
+
+INTERVAL_CACHE_NAME = "booking_intervals"
+
+_DIRTY_KEY = "interval_cache:dirty_resources"
+
+
+class CachedIntervals(NamedTuple):
+    """Approved bookings of one resource within [window_start, window_end)."""
+
+    window_start: datetime
+    window_end: datetime
+    tree: IntervalTree
+
+
+class IntervalCacheService:
+    """
+    Service for the approved-bookings interval cache.
+
+    Every query returns None when the cache cannot answer it (cache disabled,
+    or the window reaches outside the cached range); callers then fall back
+    to the database.
+    """
+
+    @staticmethod
+    def enabled() -> bool:
+        """Return True if the interval cache is switched on for this app."""
+        return bool(current_app.config.get("BOOKING_INTERVAL_CACHE_ENABLED", False))
+
+    @staticmethod
+    def lookup(
+        resource_id: int, start: datetime, end: datetime, now: Optional[datetime] = None
+    ) -> Optional[IntervalTree]:
+        """
+        Return the resource's interval tree if it covers [start, end).
+
+        Loads the tree with one range query on a miss.
+
+        Args:
+            resource_id: Resource to look up
+            start: Query window start
+            end: Query window end
+            now: Current local time (defaults to datetime.now())
+        """
+        if not IntervalCacheService.enabled():
+            return None
+
+        window_start, window_end = _forward_window(now)
+        if start < window_start or end > window_end:
+            return None
+
+        cache = app_cache(
+            INTERVAL_CACHE_NAME,
+            maxsize=current_app.config.get("BOOKING_INTERVAL_CACHE_SIZE", 256),
+            ttl=current_app.config.get("BOOKING_INTERVAL_CACHE_TTL", 60),
+        )
+        cached = cache.get(resource_id)
+        if cached is None or cached.window_start > start or cached.window_end < end:
+            cached = CachedIntervals(
+                window_start, window_end, _load_tree(resource_id, window_start, window_end)
+            )
+            cache.set(resource_id, cached)
+        return cached.tree
+
+    @staticmethod
+    def has_conflict(
+        resource_id: int,
+        start: datetime,
+        end: datetime,
+        exclude_booking_id: Optional[int] = None,
+    ) -> Optional[bool]:
+        """
+        Check [start, end) against the cached approved bookings.
+
+        Returns:
+            True/False, or None if the cache cannot answer
+        """
+        tree = IntervalCacheService.lookup(resource_id, start, end)
+        if tree is None:
+            return None
+        if exclude_booking_id is None:
+            return tree.has_overlap(start, end)
+        return any(
+            booking_id != exclude_booking_id for _, _, booking_id in tree.overlaps(start, end)
+        )
+
+    @staticmethod
+    def conflicting_ids(resource_id: int, start: datetime, end: datetime) -> Optional[List[int]]:
+        """Return IDs of cached approved bookings overlapping [start, end), or None."""
+        tree = IntervalCacheService.lookup(resource_id, start, end)
+        if tree is None:
+            return None
+        return [booking_id for _, _, booking_id in tree.overlaps(start, end)]
+
+    @staticmethod
+    def busy_intervals(
+        resource_id: int, start: datetime, end: datetime
+    ) -> Optional[List[Tuple[datetime, datetime]]]:
+        """Return (start, end) of cached approved bookings overlapping the window, or None."""
+        tree = IntervalCacheService.lookup(resource_id, start, end)
+        if tree is None:
+            return None
+        return [(slot_start, slot_end) for slot_start, slot_end, _ in tree.overlaps(start, end)]
+
+    @staticmethod
+    def invalidate(resource_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Drop cached trees (call after commits of Core/bulk booking writes).
+
+        Args:
+            resource_ids: Resources to drop; None clears every tree
+        """
+        if resource_ids is None:
+            clear_app_cache(INTERVAL_CACHE_NAME)
+            return
+        if not has_app_context():
+            return
+        cache = current_app.extensions.get("caches", {}).get(INTERVAL_CACHE_NAME)
+        if cache is not None:
+            for resource_id in resource_ids:
+                cache.invalidate(resource_id)
+
+
+def _forward_window(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Cached range: from midnight today to BOOKING_INTERVAL_CACHE_DAYS ahead."""
+    today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    days = current_app.config.get("BOOKING_INTERVAL_CACHE_DAYS", 60)
+    return today, today + timedelta(days=days + 1)
+
+
+def _load_tree(resource_id: int, start: datetime, end: datetime) -> IntervalTree:
+    rows = BookingRepository.get_intervals_in_range(
+        [resource_id], start, end, statuses=["approved"], with_ids=True
+    )
+    return IntervalTree(
+        (slot_start, slot_end, booking_id) for booking_id, _, slot_start, slot_end in rows
+    )
+
+
+# Commit-time invalidation, per resource (see utils.cache.invalidate_on_commit)
+
+
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    dirty = session.info.setdefault(_DIRTY_KEY, set())
+    dirty.add(target.resource_id)
+    # A booking moved to another resource leaves the old resource's tree stale too
+    dirty.update(
+        resource_id
+        for resource_id in inspect(target).attrs.resource_id.history.deleted
+        if resource_id is not None
+    )
+
+
+def _after_commit(session):
+    dirty = session.info.pop(_DIRTY_KEY, None)
+    if dirty:
+        IntervalCacheService.invalidate(dirty)
+
+
+def _after_soft_rollback(session, previous_transaction):
+    session.info.pop(_DIRTY_KEY, None)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Booking, _event_name, _mark_dirty)
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_soft_rollback", _after_soft_rollback)
@@ -0,0 +1,265 @@
+"""
+Recurring Booking Service - Campus Resource Hub
+Expands RRULE-like daily/weekly patterns into bookings.
+
+A series is checked and created as one unit: every occurrence is compared with
+the resource's approved bookings from a single range query (both lists sorted,
+then merged in one pass), and the accepted occurrences are inserted in one
+transaction under the resource's write lock.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.models import Booking
+from src.repositories import BookingRepository, ResourceRepository
+from src.services.availability_service import WEEKDAYS, AvailabilityService
+
+
+MAX_OCCURRENCES = 366
+
+Window = Tuple[datetime, datetime]
+
+
+class RecurrenceError(Exception):
+    """Raised when a recurrence pattern is invalid."""
+
+    pass
+
+
+class RecurringBookingService:
+    """
+    Service for recurring booking series.
+
+    Handles:
+    - Expanding daily/weekly patterns bounded by an end date or a count
+    - Set-based conflict detection for all occurrences at once
+    - Bulk creation of the accepted occurrences with a per-occurrence report
+    """
+
+    @staticmethod
+    def expand(
+        start_datetime: datetime,
+        end_datetime: datetime,
+        frequency: str = "weekly",
+        interval: int = 1,
+        weekdays: Optional[Iterable[Any]] = None,
+        until: Optional[date] = None,
+        count: Optional[int] = None,
+    ) -> List[Window]:
+        """
+        Expand a pattern into (start, end) occurrences in chronological order.
+
+        Args:
+            start_datetime: Start of the first occurrence
+            end_datetime: End of the first occurrence
+            frequency: "daily" or "weekly"
+            interval: Repeat every N days/weeks
+            weekdays: Weekly only - weekday numbers (Monday = 0) or names;
+                defaults to the first occurrence's weekday
+            until: Last date an occurrence may start on (inclusive)
+            count: Maximum number of occurrences
+
+        Returns:
+            List of (start, end) tuples
+
+        Raises:
+            RecurrenceError: If the pattern is invalid, unbounded, too long,
+                or its occurrences would overlap each other
+        """
+        if end_datetime <= start_datetime:
+            raise RecurrenceError("Occurrence end must be after its start")
+        if frequency not in ("daily", "weekly"):
+            raise RecurrenceError(f"Unsupported frequency: {frequency}")
+        if interval < 1:
+            raise RecurrenceError("Interval must be at least 1")
+        if until is None and not count:
+            raise RecurrenceError("A series needs an end date or an occurrence count")
+        if count is not None and count < 1:
+            raise RecurrenceError("Count must be at least 1")
+        if until is not None and until < start_datetime.date():
+            raise RecurrenceError("End date is before the first occurrence")
+
+        duration = end_datetime - start_datetime
+        days = RecurringBookingService.normalize_weekdays(weekdays)
+        occurrences: List[Window] = []
+
+        for start in _candidate_starts(start_datetime, frequency, interval, days):
+            if until is not None and start.date() > until:
+                break
+            if count is not None and len(occurrences) >= count:
+                break
+            if len(occurrences) >= MAX_OCCURRENCES:
+                raise RecurrenceError(f"A series is limited to {MAX_OCCURRENCES} occurrences")
+            if occurrences and start < occurrences[-1][1]:
+                raise RecurrenceError("Occurrences would overlap each other")
+            occurrences.append((start, start + duration))
+
+        return occurrences
+
+    @staticmethod
+    def normalize_weekdays(weekdays: Optional[Iterable[Any]]) -> List[int]:
+        """
+        Convert weekday numbers or names (e.g. "tue", "Tuesday", 1) to sorted ints.
+
+        Raises:
+            RecurrenceError: If a weekday is not recognized
+        """
+        normalized = set()
+        for day in weekdays or []:
+            text = str(day).strip().lower()
+            if not text:
+                continue
+            if text.isdigit() and int(text) < 7:
+                normalized.add(int(text))
+                continue
+            matches = [index for index, name in enumerate(WEEKDAYS) if name.startswith(text[:3])]
+            if len(text) < 3 or not matches:
+                raise RecurrenceError(f"Unknown weekday: {day}")
+            normalized.add(matches[0])
+        return sorted(normalized)
+
+    @staticmethod
+    def create_series(
+        resource_id: int,
+        requester_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        frequency: str = "weekly",
+        interval: int = 1,
+        weekdays: Optional[Iterable[Any]] = None,
+        until: Optional[date] = None,
+        count: Optional[int] = None,
+        status: str = "pending",
+        enforce_rules: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Create a recurring series, skipping occurrences that cannot be booked.
+
+        Args:
+            resource_id: Resource to book
+            requester_id: User making the bookings
+            start_datetime: Start of the first occurrence
+            end_datetime: End of the first occurrence
+            frequency, interval, weekdays, until, count: See expand()
+            status: Status for created occurrences (default "pending")
+            enforce_rules: Whether to check the resource's availability rules
+
+        Returns:
+            Dict with series_id (None if nothing was created), requested
+            (occurrence count), created (list of {booking_id, start, end}) and
+            conflicts (list of {start, end, reason, conflicting_booking_ids})
+
+        Raises:
+            RecurrenceError: If the pattern is invalid
+            ValueError: If the resource does not exist
+        """
+        resource = ResourceRepository.get_by_id(resource_id)
+        if resource is None:
+            raise ValueError(f"Resource {resource_id} not found")
+
+        days = RecurringBookingService.normalize_weekdays(weekdays)
+        if frequency == "weekly" and not days:
+            days = [start_datetime.weekday()]
+        elif frequency != "weekly":
+            days = []
+        occurrences = RecurringBookingService.expand(
+            start_datetime, end_datetime, frequency, interval, days, until, count
+        )
+        rules = AvailabilityService.get_compiled(resource) if enforce_rules else None
+
+        created: List[Dict[str, Any]] = []
+        conflicts: List[Dict[str, Any]] = []
+        series_id = None
+
+        with BookingRepository.resource_write_lock(resource_id):
+            existing = BookingRepository.get_in_range(
+                resource_id, occurrences[0][0], occurrences[-1][1], statuses=["approved"]
+            )
+            clashes = _sort_merge_overlaps(occurrences, existing)
+
+            accepted: List[Window] = []
+            for index, (start, end) in enumerate(occurrences):
+                reason = rules.violation(start, end) if rules else None
+                if clashes[index]:
+                    reason = reason or "Conflicts with an approved booking"
+                if reason:
+                    conflicts.append(
+                        {
+                            "start": start,
+                            "end": end,
+                            "reason": reason,
+                            "conflicting_booking_ids": [b.booking_id for b in clashes[index]],
+                        }
+                    )
+                else:
+                    accepted.append((start, end))
+
+            if accepted:
+                series = BookingRepository.create_series(
+                    resource_id=resource_id,
+                    requester_id=requester_id,
+                    start_datetime=start_datetime,
+                    end_datetime=end_datetime,
+                    frequency=frequency,
+                    interval=interval,
+                    weekdays=",".join(str(day) for day in days) or None,
+                    until=until,
+                    count=count,
+                )
+                series_id = series.series_id
+                bookings = BookingRepository.create_many(
+                    resource_id, requester_id, accepted, status=status, series_id=series_id
+                )
+                created = [
+                    {"booking_id": b.booking_id, "start": b.start_datetime, "end": b.end_datetime}
+                    for b in bookings
+                ]
+
+        return {
+            "series_id": series_id,
+            "requested": len(occurrences),
+            "created": created,
+            "conflicts": conflicts,
+        }
+
+
+def _candidate_starts(
+    first: datetime, frequency: str, interval: int, weekdays: Sequence[int]
+) -> Iterator[datetime]:
+    """Yield occurrence starts from the first one onwards, without bound."""
+    if frequency == "daily":
+        step = timedelta(days=interval)
+        start = first
+        while True:
+            yield start
+            start += step
+
+    days = weekdays or [first.weekday()]
+    week_start = first - timedelta(days=first.weekday())
+    while True:
+        for day in days:
+            start = week_start + timedelta(days=day)
+            if start >= first:
+                yield start
+        week_start += timedelta(weeks=interval)
+
+
+def _sort_merge_overlaps(occurrences: List[Window], existing: List[Booking]) -> List[List[Booking]]:
+    """
+    Return, per occurrence, the existing bookings it overlaps.
+
+    Both lists are sorted by start. Bookings that end before an occurrence
+    starts cannot overlap any later occurrence, so the scan never moves back.
+    """
+    clashes: List[List[Booking]] = [[] for _ in occurrences]
+    first = 0
+    for index, (start, end) in enumerate(occurrences):
+        while first < len(existing) and existing[first].end_datetime <= start:
+            first += 1
+        probe = first
+        while probe < len(existing) and existing[probe].start_datetime < end:
+            if existing[probe].end_datetime > start:
+                clashes[index].append(existing[probe])
+            probe += 1
+    return clashes
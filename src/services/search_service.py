@@ -0,0 +1,172 @@
+"""
+Search Service - Cached catalogue search.
+
+Wraps ResourceRepository.search with a bounded LRU + TTL result cache. Keys are
+the normalized filter set plus the current "search" generation, a database
+counter bumped after every commit that changes what a search can return:
+searchable resource columns, ratings, or the set of approved bookings (the
+availability filter). Such a write therefore invalidates cached pages in every
+worker, and entries from older generations simply age out of the LRU. Other
+booking writes (pending requests, waitlist promotions) only shift the
+"popular" ordering and are picked up within SEARCH_CACHE_TTL.
+
+Only resource IDs and page totals are cached; resources are re-loaded by primary
+key so callers always receive session-bound ORM objects.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from flask import current_app
+from sqlalchemy import inspect
+
+from src.models import Booking, Resource, Review
+from src.models.cache_generation import CacheGeneration, bump_generation_on_write
+from src.repositories.resource_repo import ResourceRepository
+from src.utils.cache import app_cache
+from src.utils.sql import stored_values
+
+
+SEARCH_CACHE_NAME = "search_results"
+SEARCH_GENERATION = "search"
+
+# Multi-valued filters whose order does not matter
+_SET_FILTERS = ("categories", "locations", "statuses")
+
+# Columns that search filters, matches or orders on
+_SEARCHABLE_RESOURCE_COLUMNS = (
+    "title",
+    "description",
+    "category",
+    "location",
+    "capacity",
+    "status",
+)
+_RATED_REVIEW_COLUMNS = ("resource_id", "rating", "is_hidden")
+_BOOKING_WINDOW_COLUMNS = ("resource_id", "start_datetime", "end_datetime", "status")
+
+
+class SearchService:
+    """
+    Service layer for cached resource search.
+
+    Handles:
+    - Filter normalization into a stable cache key
+    - Generation-versioned result caching
+    - Cache hit/miss metrics
+    """
+
+    @staticmethod
+    def search(page: int = 1, per_page: int = 20, **filters: Any) -> Dict[str, Any]:
+        """
+        Return one page of search results, served from cache when possible.
+
+        Args:
+            page: Page number (1-based)
+            per_page: Page size
+            **filters: Any keyword accepted by ResourceRepository.search_page
+
+        Returns:
+            Dict shaped like ResourceRepository.search_page()
+        """
+        key = (
+            CacheGeneration.current(SEARCH_GENERATION),
+            SearchService.normalize_filters(filters),
+            page,
+            per_page,
+        )
+        cache = SearchService._cache()
+        cached = cache.get(key)
+
+        if cached is None:
+            results = ResourceRepository.search_page(page=page, per_page=per_page, **filters)
+            cache.set(
+                key,
+                {
+                    **{k: v for k, v in results.items() if k != "items"},
+                    "ids": [resource.resource_id for resource in results["items"]],
+                },
+            )
+            return results
+
+        by_id = {
+            resource.resource_id: resource
+            for resource in Resource.query.filter(Resource.resource_id.in_(cached["ids"]))
+        }
+        items = [by_id[resource_id] for resource_id in cached["ids"] if resource_id in by_id]
+        return {**{k: v for k, v in cached.items() if k != "ids"}, "items": items}
+
+    @staticmethod
+    def normalize_filters(filters: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Build a hashable, order-independent key from search filters.
+
+        Empty values are dropped, the query string is case- and whitespace-folded,
+        multi-valued filters are sorted and datetimes are rendered as ISO strings.
+        """
+        normalized = []
+        for name, value in filters.items():
+            if value is None or value == "" or value == [] or value == ():
+                continue
+            if name == "query_str":
+                value = " ".join(str(value).lower().split())
+                if not value:
+                    continue
+            elif name in _SET_FILTERS and isinstance(value, (list, tuple, set)):
+                value = tuple(sorted({str(v) for v in value if v}))
+                if not value:
+                    continue
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, (list, set)):
+                value = tuple(value)
+            normalized.append((name, value))
+        return tuple(sorted(normalized))
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """Return hit/miss counters of the search cache for this worker."""
+        stats = SearchService._cache().stats()
+        stats["generation"] = CacheGeneration.current(SEARCH_GENERATION)
+        return stats
+
+    @staticmethod
+    def _cache():
+        return app_cache(
+            SEARCH_CACHE_NAME,
+            maxsize=current_app.config.get("SEARCH_CACHE_SIZE", 512),
+            ttl=current_app.config.get("SEARCH_CACHE_TTL", 120),
+        )
+
+
+def _changed(target, names) -> bool:
+    state = inspect(target)
+    return any(state.attrs[name].history.has_changes() for name in names)
+
+
+def _resource_affects_search(connection, resource, operation) -> bool:
+    return operation != "update" or _changed(resource, _SEARCHABLE_RESOURCE_COLUMNS)
+
+
+def _review_affects_search(connection, review, operation) -> bool:
+    return operation != "update" or _changed(review, _RATED_REVIEW_COLUMNS)
+
+
+def _booking_affects_search(connection, booking, operation) -> bool:
+    """Only approved bookings block a resource in the availability filter."""
+    if operation != "update":
+        return booking.status == "approved"
+    if not _changed(booking, _BOOKING_WINDOW_COLUMNS):
+        return False
+    was_approved = stored_values(connection, booking, ["status"])["status"] == "approved"
+    return was_approved or booking.status == "approved"
+
+
+bump_generation_on_write(
+    SEARCH_GENERATION,
+    {
+        Resource: _resource_affects_search,
+        Review: _review_affects_search,
+        Booking: _booking_affects_search,
+    },
+)
@@ -0,0 +1,190 @@
+"""
+Waitlist Service - Campus Resource Hub
+Queues requests for booked slots and promotes them when a slot is freed.
+
+Instead of clients polling availability and resubmitting, a user joins the
+waitlist for a (resource, window). Freeing a held slot calls promote_freed()
+inside the same locked transaction, which looks up only the waiting entries
+overlapping the freed window (indexed range query) and turns the oldest ones
+that now fit into bookings.
+
+A slot is held by an approved booking, or by a pending booking promoted from
+the waitlist (resources requiring approval) until it is decided. Other
+pending requests hold nothing, so rejecting or cancelling them promotes no one.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from src.models import Booking, WaitlistEntry
+from src.repositories import BookingRepository, ResourceRepository, WaitlistRepository
+from src.services.availability_service import AvailabilityService
+
+
+class WaitlistError(Exception):
+    """Raised when a waitlist request is invalid."""
+
+    pass
+
+
+class WaitlistService:
+    """
+    Service for the booking waitlist.
+
+    Handles:
+    - Joining and leaving the queue for a booked slot
+    - First-come first-served promotion when an overlapping booking is freed
+    """
+
+    @staticmethod
+    def join(
+        resource_id: int,
+        requester_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> WaitlistEntry:
+        """
+        Queue a request for a window that is currently booked.
+
+        Args:
+            resource_id: Resource to wait for
+            requester_id: User joining the waitlist
+            start_datetime: Requested start
+            end_datetime: Requested end
+
+        Returns:
+            Created WaitlistEntry
+
+        Raises:
+            WaitlistError: If the window is invalid, already free, or the user
+                is already waiting for an overlapping window
+            AvailabilityViolationError: If the window is outside the resource's rules
+        """
+        if end_datetime <= start_datetime:
+            raise WaitlistError("End time must be after start time")
+        if start_datetime < datetime.now():
+            raise WaitlistError("Cannot join the waitlist for a time in the past")
+
+        resource = ResourceRepository.get_by_id(resource_id)
+        if not resource or resource.status != "published":
+            raise WaitlistError("Resource not available for booking")
+        AvailabilityService.validate_booking(resource, start_datetime, end_datetime)
+
+        # Check and queue under the lock so a concurrent cancellation either
+        # runs first (slot free, book directly) or sees this entry
+        with BookingRepository.resource_write_lock(resource_id):
+            if not BookingRepository.find_conflicts(resource_id, start_datetime, end_datetime):
+                raise WaitlistError("This time slot is available - book it directly")
+            if WaitlistRepository.find_for_requester(
+                requester_id, resource_id, start_datetime, end_datetime
+            ):
+                raise WaitlistError("You are already on the waitlist for this time")
+            return WaitlistRepository.create(
+                resource_id, requester_id, start_datetime, end_datetime
+            )
+
+    @staticmethod
+    def leave(entry_id: int, requester_id: int) -> WaitlistEntry:
+        """
+        Withdraw a waiting entry.
+
+        Raises:
+            WaitlistError: If the entry is not the user's or no longer waiting
+            ValueError: If the entry does not exist
+        """
+        entry = WaitlistRepository.get_by_id(entry_id)
+        if entry is None:
+            raise ValueError(f"Waitlist entry {entry_id} not found")
+        if entry.requester_id != requester_id:
+            raise WaitlistError("You can only leave your own waitlist entries")
+
+        with BookingRepository.resource_write_lock(entry.resource_id):
+            if entry.status != "waiting":
+                raise WaitlistError(f"Entry is already {entry.status}")
+            WaitlistRepository.update_status(entry, "cancelled")
+        return entry
+
+    @staticmethod
+    def slot_holders(bookings: Iterable[Booking]) -> List[Booking]:
+        """
+        Return the bookings that hold their slot (call before changing their status).
+
+        Approved bookings always do; pending ones only if they were promoted
+        from the waitlist.
+        """
+        bookings = list(bookings)
+        promoted = WaitlistRepository.get_promoted_booking_ids(
+            [booking.booking_id for booking in bookings if booking.status == "pending"]
+        )
+        return [
+            booking
+            for booking in bookings
+            if booking.status == "approved" or booking.booking_id in promoted
+        ]
+
+    @staticmethod
+    def promote_freed(
+        resource_id: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        now: Optional[datetime] = None,
+    ) -> List[Booking]:
+        """
+        Promote waiting entries that fit a freed window on a resource.
+
+        Must run inside the caller's resource_write_lock so the freeing write and
+        the promotions commit together. Entries overlapping the window are
+        visited oldest first; each is promoted unless it still overlaps a held
+        slot (an approved booking or a pending promoted one) or an entry
+        promoted earlier in this call. Entries whose window has already started
+        are expired. Does not commit.
+
+        Promoted bookings are approved, or pending when the resource requires
+        approval (matching the single-booking flow).
+
+        Returns:
+            Bookings created for promoted entries
+        """
+        candidates = WaitlistRepository.find_waiting_overlapping(
+            resource_id, start_datetime, end_datetime
+        )
+        if not candidates:
+            return []
+
+        now = now or datetime.now()
+        resource = ResourceRepository.get_by_id(resource_id)
+        status = "pending" if resource is not None and resource.requires_approval() else "approved"
+
+        window_start = min(entry.start_datetime for entry in candidates)
+        window_end = max(entry.end_datetime for entry in candidates)
+        blockers: List[Tuple[datetime, datetime]] = [
+            (booking.start_datetime, booking.end_datetime)
+            for booking in BookingRepository.get_in_range(
+                resource_id, window_start, window_end, statuses=["approved"]
+            )
+        ]
+        blockers.extend(
+            WaitlistRepository.get_promoted_pending_windows(resource_id, window_start, window_end)
+        )
+
+        promoted: List[Booking] = []
+        for entry in candidates:
+            if entry.start_datetime < now:
+                WaitlistRepository.update_status(entry, "expired")
+                continue
+            if any(
+                start < entry.end_datetime and end > entry.start_datetime for start, end in blockers
+            ):
+                continue
+
+            (booking,) = BookingRepository.create_many(
+                resource_id,
+                entry.requester_id,
+                [(entry.start_datetime, entry.end_datetime)],
+                status=status,
+            )
+            WaitlistRepository.update_status(entry, "promoted", booking.booking_id)
+            blockers.append((entry.start_datetime, entry.end_datetime))
+            promoted.append(booking)
+
+        return promoted
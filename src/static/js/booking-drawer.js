@@ -33,6 +33,7 @@ class BookingDrawer {
 
     this.currentResource = null;
     this.bookings = [];
+    this.freeIntervals = null;
     this.requiresApproval = false;
     this.selectedRange = null;
     this.slotButtons = [];
@@ -53,6 +54,7 @@ class BookingDrawer {
           title: trigger.dataset.resourceTitle,
           bookingUrl: trigger.dataset.bookingUrl,
           availabilityUrl: trigger.dataset.availabilityUrl,
+          freeSlotsUrl: trigger.dataset.freeSlotsUrl,
         });
       }
     });
@@ -167,22 +169,25 @@ class BookingDrawer {
 
     this.setSlotGridBusy(true);
     try {
-      const url = new URL(this.hiddenAvailabilityUrl.value, window.location.origin);
+      // Prefer the server-side free-slot finder; fall back to raw bookings
+      const freeSlotsUrl = this.currentResource.freeSlotsUrl;
+      const url = new URL(freeSlotsUrl || this.hiddenAvailabilityUrl.value, window.location.origin);
       url.searchParams.set('date', dateValue);
+      if (freeSlotsUrl) url.searchParams.set('granularity', String(SLOT_INCREMENT_MINUTES));
       const response = await fetch(url);
       const payload = await response.json();
       if (!response.ok) {
         throw new Error(payload.error || 'Unable to load availability.');
       }
-      this.bookings = payload.bookings.map((booking) => ({
-        start: new Date(booking.start),
-        end: new Date(booking.end),
-      }));
+      const toInterval = (item) => ({ start: new Date(item.start), end: new Date(item.end) });
+      this.freeIntervals = freeSlotsUrl ? payload.free.map(toInterval) : null;
+      this.bookings = freeSlotsUrl ? [] : payload.bookings.map(toInterval);
       this.requiresApproval = Boolean(payload.requires_approval);
       this.renderAvailability(dateValue);
       this.updateMessage();
     } catch (error) {
       this.bookings = [];
+      this.freeIntervals = null;
       this.showMessage('error', error.message || 'Failed to load availability.');
       this.disableAllSlots(true);
     } finally {
@@ -196,7 +201,9 @@ class BookingDrawer {
       const minutes = Number(button.dataset.minutes);
       const slotStart = this.combineDate(dateObj, minutes);
       const slotEnd = this.combineDate(dateObj, minutes + SLOT_INCREMENT_MINUTES);
-      const hasConflict = this.bookings.some((booking) => slotStart < booking.end && slotEnd > booking.start);
+      const hasConflict = this.freeIntervals
+        ? !this.freeIntervals.some((free) => slotStart >= free.start && slotEnd <= free.end)
+        : this.bookings.some((booking) => slotStart < booking.end && slotEnd > booking.start);
       button.disabled = hasConflict;
       button.setAttribute('aria-disabled', hasConflict ? 'true' : 'false');
       button.classList.toggle('is-blocked', hasConflict);
@@ -358,6 +365,7 @@ class BookingDrawer {
 
   resetFormState() {
     this.bookings = [];
+    this.freeIntervals = null;
     this.requiresApproval = false;
     this.clearSelection();
     this.clearMessage();
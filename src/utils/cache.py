@@ -0,0 +1,161 @@
+"""
+In-Process Caching Helpers
+Bounded LRU + TTL cache and commit-time invalidation hooks for derived data
+(facet counts, aggregates) that should not be recomputed on every request.
+
+Caches live in ``app.extensions`` so each Flask app (and each worker process)
+keeps its own copy. Invalidation only reaches the process that committed the
+write, so every cache also carries a TTL.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    Tracks hit/miss counters so callers can expose cache effectiveness.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = 300.0):
+        """
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl: Default entry lifetime in seconds (None or 0 disables expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (monotonic expiry time or None, value)
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default when missing/expired."""
+        with self._lock:
+            if key in self._data:
+                expires_at, value = self._data[key]
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(
+        self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None
+    ) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl=ttl)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def app_cache(name: str, maxsize: int = 128, ttl: Optional[float] = 300.0) -> TTLCache:
+    """
+    Return the named TTLCache for the current app, creating it on first use.
+
+    Args:
+        name: Cache name (stored under ``app.extensions["caches"][name]``)
+        maxsize: Entry limit used when the cache is created
+        ttl: Default TTL in seconds used when the cache is created
+    """
+    caches = current_app.extensions.setdefault("caches", {})
+    cache = caches.get(name)
+    if cache is None:
+        cache = caches.setdefault(name, TTLCache(maxsize=maxsize, ttl=ttl))
+    return cache
+
+
+def clear_app_cache(name: str) -> None:
+    """Clear the named cache of the current app, if it exists."""
+    if not has_app_context():
+        return
+    cache = current_app.extensions.get("caches", {}).get(name)
+    if cache is not None:
+        cache.clear()
+
+
+def invalidate_on_commit(model: Any, callback: Callable[[], None], key: str) -> None:
+    """
+    Run callback after any transaction that inserted, updated or deleted a model row.
+
+    Mapper events flag the owning session; the callback fires from the session's
+    after_commit hook so readers never repopulate a cache from uncommitted state.
+    Rolled-back transactions discard the flag.
+
+    Args:
+        model: ORM model class to watch
+        callback: Invalidation function (e.g. ``lambda: clear_app_cache("facets")``)
+        key: Unique name for the flag stored in ``session.info``
+    """
+    flag = f"invalidate:{key}"
+
+    def _mark_dirty(mapper, connection, target):
+        session = object_session(target)
+        if session is not None:
+            session.info[flag] = True
+
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, event_name, _mark_dirty)
+
+    def _after_commit(session):
+        if session.info.pop(flag, False):
+            callback()
+
+    def _after_soft_rollback(session, previous_transaction):
+        session.info.pop(flag, None)
+
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_soft_rollback", _after_soft_rollback)
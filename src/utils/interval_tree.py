@@ -0,0 +1,75 @@
+"""
+Static Interval Tree
+Immutable augmented interval tree over half-open [start, end) intervals.
+
+The tree is stored implicitly in arrays sorted by start: the node for a slice
+is its middle element and ``_max_end`` holds the largest end in that node's
+subtree, so subtrees that end before a query window are skipped. A prefix
+maximum of the ends answers "does anything overlap?" with one bisection.
+
+Building is O(n log n); overlap tests are O(log n) and listing k overlaps is
+O(log n + k). Trees are rebuilt rather than updated when the data changes.
+"""
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Iterable, List, Tuple
+
+Interval = Tuple[Any, Any, Any]
+
+
+class IntervalTree:
+    """Overlap queries over (start, end, payload) intervals."""
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """
+        Args:
+            intervals: (start, end, payload) tuples; start/end may be any
+                mutually comparable values (e.g. datetimes)
+        """
+        items = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self._starts = [item[0] for item in items]
+        self._ends = [item[1] for item in items]
+        self._payloads = [item[2] for item in items]
+        self._prefix_max_end = list(accumulate(self._ends, max))
+        self._max_end = list(self._ends)
+        self._augment(0, len(items))
+
+    def has_overlap(self, start: Any, end: Any) -> bool:
+        """Return True if any interval overlaps [start, end)."""
+        # Intervals before this index start before the window ends
+        candidates = bisect_left(self._starts, end)
+        return candidates > 0 and self._prefix_max_end[candidates - 1] > start
+
+    def overlaps(self, start: Any, end: Any) -> List[Interval]:
+        """Return the (start, end, payload) intervals overlapping [start, end), by start."""
+        found: List[Interval] = []
+        self._collect(0, len(self._starts), start, end, found)
+        return found
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _augment(self, lo: int, hi: int) -> Any:
+        """Fill _max_end for the subtree over [lo, hi) and return its maximum."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        best = self._ends[mid]
+        for child in (self._augment(lo, mid), self._augment(mid + 1, hi)):
+            if child is not None and child > best:
+                best = child
+        self._max_end[mid] = best
+        return best
+
+    def _collect(self, lo: int, hi: int, start: Any, end: Any, found: List[Interval]) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] <= start:
+            return
+        self._collect(lo, mid, start, end, found)
+        # Everything right of a node that starts at/after the window end does too
+        if self._starts[mid] < end:
+            if self._ends[mid] > start:
+                found.append((self._starts[mid], self._ends[mid], self._payloads[mid]))
+            self._collect(mid + 1, hi, start, end, found)
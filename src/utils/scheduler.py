@@ -0,0 +1,75 @@
+"""
+In-Process Periodic Jobs
+Runs maintenance jobs on a fixed interval in a daemon thread per app.
+
+Intended for single-host deployments that have no external scheduler. Jobs must
+be idempotent: with several worker processes each one runs its own scheduler,
+and cron can still invoke the same job through its CLI command.
+"""
+from __future__ import annotations
+import threading
+from typing import Callable, Dict
+
+from flask import Flask
+
+
+class PeriodicJob:
+    """Call a function inside an app context every ``interval`` seconds until stopped."""
+
+    def __init__(self, app: Flask, name: str, interval: float, func: Callable[[], object]):
+        """
+        Args:
+            app: Flask app whose context the job runs in
+            name: Job name (used for the thread name and logging)
+            interval: Seconds between the end of one run and the start of the next
+            func: Job body; exceptions are logged and do not stop the schedule
+        """
+        self.app = app
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name=f"job-{name}", daemon=True)
+
+    def start(self) -> "PeriodicJob":
+        """Start the background thread."""
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the thread to exit and wait for the current run to finish."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def run_once(self) -> None:
+        """Run the job body once in a fresh app context, logging failures."""
+        from src.app import db
+
+        with self.app.app_context():
+            try:
+                self.func()
+            except Exception:
+                self.app.logger.exception("Periodic job %s failed", self.name)
+            finally:
+                db.session.remove()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.run_once()
+
+
+def schedule_job(app: Flask, name: str, interval: float, func: Callable[[], object]) -> PeriodicJob:
+    """
+    Start a periodic job for an app, replacing any job already scheduled under name.
+
+    Running jobs are kept in ``app.extensions["jobs"]``.
+
+    Returns:
+        The started PeriodicJob
+    """
+    jobs: Dict[str, PeriodicJob] = app.extensions.setdefault("jobs", {})
+    if name in jobs:
+        jobs[name].stop()
+    jobs[name] = PeriodicJob(app, name, interval, func).start()
+    return jobs[name]
@@ -0,0 +1,130 @@
+"""
+SQL Helpers
+Portable single-statement upserts for counters and lookup tables that several
+requests may create at the same time, and pre-flush column values for mapper
+event hooks.
+
+SQLite (3.24+) and PostgreSQL use ``INSERT ... ON CONFLICT``, so two writers
+inserting the same key never fail with IntegrityError. Other dialects fall
+back to UPDATE-then-INSERT.
+"""
+from typing import Any, Dict, Mapping, Sequence
+
+from sqlalchemy import Table, inspect, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+_ON_CONFLICT_DIALECTS = {"sqlite": sqlite, "postgresql": postgresql}
+
+
+def upsert(
+    connection: Any,
+    table: Table,
+    values: Mapping[str, Any],
+    key_columns: Sequence[str],
+    set_: Mapping[str, Any],
+) -> None:
+    """
+    Insert a row, or update the existing row with the same key.
+
+    Args:
+        connection: Connection (or session) to execute on
+        table: Target table
+        values: Column values of the row to insert
+        key_columns: Columns of the primary key or unique constraint
+        set_: Column values/expressions applied to an existing row, e.g.
+            ``{"count": table.c.count + 1}``
+    """
+    dialect = _ON_CONFLICT_DIALECTS.get(_dialect_name(connection))
+    if dialect is not None:
+        statement = dialect.insert(table).values(**values)
+        connection.execute(
+            statement.on_conflict_do_update(index_elements=list(key_columns), set_=dict(set_))
+        )
+        return
+
+    result = connection.execute(
+        update(table).where(*_key_clause(table, values, key_columns)).values(**set_)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(**values))
+
+
+def insert_ignore(
+    connection: Any,
+    table: Table,
+    rows: Sequence[Mapping[str, Any]],
+    key_columns: Sequence[str],
+) -> None:
+    """
+    Insert rows, skipping any whose key already exists.
+
+    Args:
+        connection: Connection (or session) to execute on
+        table: Target table
+        rows: Column values of the rows to insert
+        key_columns: Columns of the primary key or unique constraint
+    """
+    if not rows:
+        return
+    dialect = _ON_CONFLICT_DIALECTS.get(_dialect_name(connection))
+    if dialect is not None:
+        connection.execute(
+            dialect.insert(table).on_conflict_do_nothing(index_elements=list(key_columns)),
+            list(rows),
+        )
+        return
+
+    for row in rows:
+        exists = connection.execute(
+            select(*[table.c[name] for name in key_columns]).where(
+                *_key_clause(table, row, key_columns)
+            )
+        ).first()
+        if exists is None:
+            connection.execute(insert(table).values(**row))
+
+
+def stored_values(connection: Any, target: Any, names: Sequence[str]) -> Dict[str, Any]:
+    """
+    Return the values of target's column attributes as stored before this flush.
+
+    Uses attribute history; attributes that were changed without their old
+    value ever being loaded (e.g. after expire_all) are read from the row with
+    one SELECT. Call from before_update, while the row still holds them.
+
+    Args:
+        connection: Connection passed to the mapper event
+        target: Persistent ORM instance being flushed
+        names: Column attribute names
+    """
+    state = inspect(target)
+    values: Dict[str, Any] = {}
+    missing = []
+    for name in names:
+        history = state.attrs[name].history
+        if history.deleted:
+            values[name] = history.deleted[0]
+        elif history.unchanged:
+            values[name] = history.unchanged[0]
+        else:
+            missing.append(name)
+
+    if missing:
+        mapper = state.mapper
+        row = connection.execute(
+            select(*[mapper.attrs[name].columns[0] for name in missing]).where(
+                *[column == value for column, value in zip(mapper.primary_key, state.identity)]
+            )
+        ).first()
+        values.update(zip(missing, row if row is not None else [None] * len(missing)))
+    return values
+
+
+def _dialect_name(connection: Any) -> str:
+    bind = connection.get_bind() if hasattr(connection, "get_bind") else connection
+    return bind.dialect.name
+
+
+def _key_clause(table: Table, values: Mapping[str, Any], key_columns: Sequence[str]) -> list:
+    return [table.c[name] == values[name] for name in key_columns]
@@ -0,0 +1,158 @@
+"""
+Concurrency Stress Tests for Booking Creation - Campus Resource Hub
+
+Hammers one resource from many threads to prove that the conflict check and
+the insert run as one serialized unit per resource (no double booking).
+
+The shared test app uses an in-memory database bound to a single connection,
+so these tests build their own app on a temporary database file where every
+thread gets its own connection.
+"""
+
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.app import create_app, db
+from src.config import TestingConfig
+from src.models import Booking
+from src.repositories.booking_repo import BookingRepository
+from src.repositories.resource_repo import ResourceRepository
+from src.repositories.user_repo import UserRepository
+from src.services.booking_service import (
+    BookingConflictError,
+    BookingService,
+    BookingStatusError,
+)
+
+THREADS = 12
+ATTEMPTS_PER_THREAD = 4
+
+
+@pytest.fixture
+def file_app(monkeypatch):
+    """App bound to a temporary SQLite file with one requester and one resource."""
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{db_path}")
+    app = create_app("testing")
+
+    with app.app_context():
+        db.create_all()
+        owner = UserRepository.create(
+            name="Owner", email="owner@race.local", password="Race123!", role="staff"
+        )
+        requester = UserRepository.create(
+            name="Requester", email="requester@race.local", password="Race123!", role="student"
+        )
+        resource = ResourceRepository.create(
+            owner_id=owner.user_id,
+            title="Contended Room",
+            category="study_room",
+            location="Library",
+            capacity=4,
+            status="published",
+        )
+        app.config["RACE_IDS"] = (resource.resource_id, requester.user_id)
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+    os.close(db_fd)
+    os.unlink(db_path)
+
+
+def _hammer(app, work):
+    """Run work(thread_index) in THREADS threads released at the same instant."""
+    barrier = threading.Barrier(THREADS)
+    outcomes, errors = [], []
+
+    def runner(index):
+        with app.app_context():
+            barrier.wait()
+            try:
+                for _ in range(ATTEMPTS_PER_THREAD):
+                    outcomes.append(work(index))
+            except Exception as e:  # pragma: no cover - surfaced by the assertion below
+                errors.append(e)
+            finally:
+                db.session.remove()
+
+    threads = [threading.Thread(target=runner, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    assert not errors, errors
+    return outcomes
+
+
+class TestConcurrentBooking:
+    """Stress tests for race-free booking creation and approval."""
+
+    def test_parallel_creates_never_double_book(self, file_app):
+        """Test many threads requesting the same slot yield exactly one approved booking."""
+        resource_id, requester_id = file_app.config["RACE_IDS"]
+        start = (datetime.now() + timedelta(days=3)).replace(
+            hour=10, minute=0, second=0, microsecond=0
+        )
+
+        def attempt(index):
+            # Half the threads overlap the slot partially rather than exactly
+            offset = timedelta(minutes=30 * (index % 2))
+            try:
+                BookingService.create_booking(
+                    resource_id,
+                    requester_id,
+                    start + offset,
+                    start + offset + timedelta(hours=1),
+                    status="approved",
+                )
+                return "created"
+            except BookingConflictError:
+                return "conflict"
+
+        outcomes = _hammer(file_app, attempt)
+
+        assert outcomes.count("created") == 1
+        assert outcomes.count("conflict") == THREADS * ATTEMPTS_PER_THREAD - 1
+        with file_app.app_context():
+            assert Booking.query.filter_by(resource_id=resource_id, status="approved").count() == 1
+
+    def test_parallel_approvals_never_double_book(self, file_app):
+        """Test approving overlapping pending requests concurrently approves only one."""
+        resource_id, requester_id = file_app.config["RACE_IDS"]
+        start = (datetime.now() + timedelta(days=4)).replace(
+            hour=14, minute=0, second=0, microsecond=0
+        )
+
+        with file_app.app_context():
+            pending_ids = [
+                BookingService.create_booking(
+                    resource_id, requester_id, start, start + timedelta(hours=1)
+                ).booking_id
+                for _ in range(THREADS)
+            ]
+
+        def attempt(index):
+            try:
+                BookingService.approve_booking(pending_ids[index])
+                return "approved"
+            except (BookingConflictError, BookingStatusError):
+                return "refused"
+
+        outcomes = _hammer(file_app, attempt)
+
+        assert outcomes.count("approved") == 1
+        with file_app.app_context():
+            approved = [
+                booking
+                for booking in BookingRepository.get_by_resource(resource_id)
+                if booking.status == "approved"
+            ]
+            assert len(approved) == 1
@@ -312,6 +312,13 @@ class TestBookingFlow:
             assert response.status_code == 200
             assert b"My Bookings" in response.data
 
+            # Each tab is served on its own and paginates
+            past = client.get("/bookings/my-bookings?tab=past&page=5")
+            assert past.status_code == 200
+            assert b'aria-current="page"' in past.data
+            assert self.resource.title.encode() in past.data
+            assert client.get("/bookings/my-bookings?tab=bogus").status_code == 200
+
     def test_booking_detail_view(self, client, app):
         """Test viewing booking details"""
         with app.app_context():
@@ -336,3 +343,363 @@ class TestBookingFlow:
             assert response.status_code == 200
             assert b"Booking Details" in response.data
             assert self.resource.title.encode() in response.data
+
+    def test_complete_bookings_command_completes_finished_bookings(self, app, runner):
+        """Test the sweep command completes ended approved bookings only."""
+        with app.app_context():
+            end = (datetime.now() - timedelta(days=1)).replace(second=0, microsecond=0)
+            finished = BookingRepository.create(
+                self.resource.resource_id,
+                self.student.user_id,
+                end - timedelta(hours=2),
+                end,
+                status="approved",
+            )
+            upcoming = BookingRepository.create(
+                self.resource.resource_id,
+                self.student.user_id,
+                end + timedelta(days=30),
+                end + timedelta(days=30, hours=2),
+                status="approved",
+            )
+            finished_id, upcoming_id = finished.booking_id, upcoming.booking_id
+
+        result = runner.invoke(args=["complete-bookings"])
+
+        assert result.exit_code == 0, result.output
+        assert "Completed" in result.output
+        with app.app_context():
+            assert BookingRepository.get_by_id(finished_id).status == "completed"
+            assert BookingRepository.get_by_id(upcoming_id).status == "approved"
+
+    def test_bulk_approval_route_reports_conflicts(self, client, app):
+        """Test bulk approval approves one of two overlapping requests."""
+        with app.app_context():
+            start = (datetime.now() + timedelta(days=40)).replace(
+                hour=10, minute=0, second=0, microsecond=0
+            )
+            ids = [
+                BookingRepository.create(
+                    self.resource.resource_id,
+                    self.student.user_id,
+                    start,
+                    start + timedelta(hours=1),
+                ).booking_id
+                for _ in range(2)
+            ]
+
+        _login(client, self.admin_creds["email"], self.admin_creds["password"])
+        before = client.get("/admin/bookings/stats").get_json()
+        response = client.post(
+            "/admin/approvals/bulk",
+            data={"booking_ids": ids, "action": "approve"},
+            headers={"X-Requested-With": "XMLHttpRequest"},
+        )
+
+        payload = response.get_json()
+        assert response.status_code == 200
+        assert (payload["processed"], payload["conflicts"]) == (1, 1)
+        assert [r["outcome"] for r in payload["results"]] == ["approved", "conflict"]
+        # The bulk UPDATE bypasses the ORM but still invalidates cached stats
+        after = client.get("/admin/bookings/stats").get_json()
+        assert after["approved"] == before["approved"] + 1
+        assert after["pending"] == before["pending"] - 1
+        with app.app_context():
+            assert [BookingRepository.get_by_id(i).status for i in ids] == ["approved", "pending"]
+
+    def test_waitlist_promoted_when_booking_cancelled(self, client, app):
+        """Test a waitlisted student is booked when the blocking booking is cancelled."""
+        with app.app_context():
+            start = (datetime.now() + timedelta(days=45)).replace(
+                hour=10, minute=0, second=0, microsecond=0
+            )
+            blocker = BookingRepository.create(
+                self.resource.resource_id,
+                self.staff.user_id,
+                start,
+                start + timedelta(hours=2),
+                status="approved",
+            )
+            blocker_id = blocker.booking_id
+
+        _login(client, self.student_creds["email"], self.student_creds["password"])
+        joined = client.post(
+            "/bookings/waitlist",
+            json={
+                "resource_id": self.resource.resource_id,
+                "start_date": start.strftime("%Y-%m-%d"),
+                "start_time": "11:00",
+                "end_time": "12:00",
+            },
+        )
+        assert joined.status_code == 201
+        assert [e["entry_id"] for e in client.get("/bookings/waitlist").get_json()["entries"]] == [
+            joined.get_json()["entry_id"]
+        ]
+        client.post("/auth/logout")
+
+        _login(client, self.admin_creds["email"], self.admin_creds["password"])
+        client.post(f"/bookings/{blocker_id}/cancel")
+        client.post("/auth/logout")
+
+        _login(client, self.student_creds["email"], self.student_creds["password"])
+        assert client.get("/bookings/waitlist").get_json()["entries"] == []
+        with app.app_context():
+            booked = [
+                b
+                for b in BookingRepository.get_by_requester(self.student.user_id)
+                if b.start_datetime == start + timedelta(hours=1)
+            ]
+            assert [b.status for b in booked] == ["approved"]
+
+
+class TestAvailabilityRules:
+    """Integration tests for availability-rule enforcement at booking time."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app, demo_seed):
+        """Restrict the seeded resource to weekday office hours."""
+        with app.app_context():
+            self.student_creds = demo_seed["student"]
+            self.student = _require_user(self.student_creds["email"])
+            resource = ResourceRepository.get_by_id(demo_seed["resource_ids"][0])
+            ResourceRepository.update(
+                resource,
+                availability_rules={
+                    "days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+                    "hours": {"start": "09:00", "end": "17:00"},
+                    "max_booking_hours": 3,
+                },
+            )
+            self.resource_id = resource.resource_id
+            yield
+
+    @staticmethod
+    def _next_weekday(weekday: int) -> datetime:
+        day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        while day.weekday() != weekday:
+            day += timedelta(days=1)
+        return day
+
+    def test_service_rejects_out_of_hours_booking(self, app):
+        """Test BookingService.create_booking enforces days, hours and max length."""
+        from src.services.booking_service import BookingService
+        from src.services.availability_service import AvailabilityViolationError
+
+        with app.app_context():
+            tuesday = self._next_weekday(1)
+            saturday = self._next_weekday(5)
+
+            booking = BookingService.create_booking(
+                self.resource_id,
+                self.student.user_id,
+                tuesday.replace(hour=10),
+                tuesday.replace(hour=12),
+            )
+            assert booking.booking_id
+
+            for start, end in [
+                (tuesday.replace(hour=16), tuesday.replace(hour=18)),
+                (saturday.replace(hour=10), saturday.replace(hour=11)),
+                (tuesday.replace(hour=9), tuesday.replace(hour=13)),
+            ]:
+                with pytest.raises(AvailabilityViolationError):
+                    BookingService.create_booking(
+                        self.resource_id, self.student.user_id, start, end
+                    )
+
+    def test_route_rejects_out_of_hours_booking(self, client, app):
+        """Test the booking form refuses windows outside the resource's hours."""
+        with app.app_context():
+            _login(client, self.student_creds["email"], self.student_creds["password"])
+            saturday = self._next_weekday(5)
+
+            response = client.post(
+                "/bookings",
+                data={
+                    "resource_id": self.resource_id,
+                    "start_date": saturday.strftime("%Y-%m-%d"),
+                    "start_time": "10:00",
+                    "end_date": saturday.strftime("%Y-%m-%d"),
+                    "end_time": "11:00",
+                },
+                follow_redirects=True,
+            )
+
+            assert b"outside the resource" in response.data
+            assert not [
+                b
+                for b in BookingRepository.get_by_requester(self.student.user_id)
+                if b.start_datetime == saturday.replace(hour=10)
+            ]
+
+    def test_availability_endpoint_lists_open_windows(self, client, app):
+        """Test the availability JSON includes the day's open windows."""
+        wednesday = self._next_weekday(2)
+        sunday = self._next_weekday(6)
+
+        payload = client.get(
+            f"/resources/{self.resource_id}/availability?date={wednesday:%Y-%m-%d}"
+        ).get_json()
+        assert payload["open_windows"] == [
+            {
+                "start": wednesday.replace(hour=9).isoformat(),
+                "end": wednesday.replace(hour=17).isoformat(),
+            }
+        ]
+        assert payload["max_booking_hours"] == 3
+
+        closed = client.get(
+            f"/resources/{self.resource_id}/availability?date={sunday:%Y-%m-%d}"
+        ).get_json()
+        assert closed["open_windows"] == []
+
+    def test_free_slots_subtract_bookings_from_open_hours(self, client, app):
+        """Test the free-slot finder merges bookings and honours hours and filters."""
+        from src.services.booking_service import BookingService
+
+        # Two weeks out keeps the seeded demo booking (~2 days ahead) out of range
+        tuesday = self._next_weekday(1) + timedelta(days=14)
+        with app.app_context():
+            for start_hour, end_hour in [(10, 11), (10, 12), (14, 15)]:
+                booking = BookingService.create_booking(
+                    self.resource_id,
+                    self.student.user_id,
+                    tuesday.replace(hour=start_hour, minute=15),
+                    tuesday.replace(hour=end_hour),
+                    check_conflicts=False,
+                )
+                BookingRepository.update_status(booking.booking_id, "approved")
+
+        url = f"/resources/{self.resource_id}/free-slots?date={tuesday:%Y-%m-%d}"
+        payload = client.get(url).get_json()
+        assert [(slot["start"], slot["end"]) for slot in payload["free"]] == [
+            (tuesday.replace(hour=9).isoformat(), tuesday.replace(hour=10, minute=15).isoformat()),
+            (tuesday.replace(hour=12).isoformat(), tuesday.replace(hour=14, minute=15).isoformat()),
+            (tuesday.replace(hour=15).isoformat(), tuesday.replace(hour=17).isoformat()),
+        ]
+        assert payload["max_booking_hours"] == 3
+
+        snapped = client.get(f"{url}&granularity=30&min_duration=90").get_json()
+        assert [(slot["start"], slot["minutes"]) for slot in snapped["free"]] == [
+            (tuesday.replace(hour=12).isoformat(), 120),
+            (tuesday.replace(hour=15).isoformat(), 120),
+        ]
+
+    def test_free_slots_range_and_validation(self, client):
+        """Test multi-day ranges skip closed days and bad input is rejected."""
+        saturday = self._next_weekday(5) + timedelta(days=14)
+        monday = saturday + timedelta(days=2)
+
+        payload = client.get(
+            f"/resources/{self.resource_id}/free-slots"
+            f"?start={saturday:%Y-%m-%d}&end={monday:%Y-%m-%d}"
+        ).get_json()
+        assert payload["free"] == [
+            {
+                "start": monday.replace(hour=9).isoformat(),
+                "end": monday.replace(hour=17).isoformat(),
+                "minutes": 480,
+            }
+        ]
+
+        base = f"/resources/{self.resource_id}/free-slots"
+        assert (
+            client.get(f"{base}?start={monday:%Y-%m-%d}&end={saturday:%Y-%m-%d}").status_code == 400
+        )
+        assert client.get(f"{base}?start=2030-01-01&end=2031-01-01").status_code == 400
+        assert client.get(f"{base}?granularity=abc").status_code == 400
+        assert client.get("/resources/999999/free-slots").status_code == 404
+
+    def test_availability_matrix_grid(self, client, app, demo_seed):
+        """Test the matrix endpoint returns per-day and per-hour grids for many resources."""
+        from src.services.booking_service import BookingService
+
+        monday = self._next_weekday(0) + timedelta(days=14)
+        tuesday = monday + timedelta(days=1)
+        other_id = demo_seed["resource_ids"][1]
+        with app.app_context():
+            booking = BookingService.create_booking(
+                self.resource_id,
+                self.student.user_id,
+                tuesday.replace(hour=10, minute=30),
+                tuesday.replace(hour=12),
+            )
+            BookingRepository.update_status(booking.booking_id, "approved")
+
+        payload = client.get(
+            f"/resources/availability-matrix?ids={self.resource_id},{other_id}"
+            f"&start={monday:%Y-%m-%d}&days=7"
+        ).get_json()
+        assert len(payload["slots"]) == 7
+        row = next(r for r in payload["rows"] if r["resource_id"] == self.resource_id)
+        assert row["status"][:2] == ["available", "booked"]
+        assert row["status"][5:] == ["closed", "closed"]
+        assert row["booked_minutes"][1] == 90
+        assert row["open_minutes"][1] == 480
+        assert {r["resource_id"] for r in payload["rows"]} == {self.resource_id, other_id}
+
+        hourly = client.get(
+            f"/resources/availability-matrix?ids={self.resource_id}"
+            f"&start={tuesday:%Y-%m-%d}&days=1&resolution=hour"
+        ).get_json()
+        cells = hourly["rows"][0]
+        assert len(hourly["slots"]) == 24
+        assert cells["status"][8:13] == ["closed", "available", "booked", "booked", "available"]
+        assert cells["booked_minutes"][10:12] == [30, 60]
+
+        base = "/resources/availability-matrix"
+        assert client.get(base).status_code == 400
+        assert client.get(f"{base}?ids={self.resource_id}&resolution=week").status_code == 400
+        assert (
+            client.get(f"{base}?ids={self.resource_id}&resolution=hour&days=30").status_code == 400
+        )
+
+    def test_recurring_series_endpoint(self, client, app, demo_seed):
+        """Test staff create a weekly series; closed-day occurrences are reported."""
+        tuesday = self._next_weekday(1) + timedelta(days=14)
+        staff = demo_seed["staff"]
+        _login(client, staff["email"], staff["password"])
+
+        response = client.post(
+            "/bookings/series",
+            json={
+                "resource_id": self.resource_id,
+                "start_date": f"{tuesday:%Y-%m-%d}",
+                "start_time": "13:00",
+                "end_time": "14:00",
+                "weekdays": ["tue", "sat"],
+                "count": 4,
+            },
+        )
+
+        assert response.status_code == 201
+        payload = response.get_json()
+        assert payload["requested"] == 4
+        assert [item["start"] for item in payload["created"]] == [
+            tuesday.replace(hour=13).isoformat(),
+            (tuesday + timedelta(days=7)).replace(hour=13).isoformat(),
+        ]
+        assert [item["reason"] for item in payload["conflicts"]] == [
+            "Booking falls outside the resource's available hours"
+        ] * 2
+
+        with app.app_context():
+            created = BookingRepository.get_by_id(payload["created"][0]["booking_id"])
+            assert created.status == "approved"
+            assert created.series_id == payload["series_id"]
+
+    def test_recurring_series_requires_staff(self, client):
+        """Test students cannot create recurring series."""
+        _login(client, self.student_creds["email"], self.student_creds["password"])
+
+        response = client.post(
+            "/bookings/series",
+            json={"resource_id": self.resource_id, "start_date": "2030-01-08", "count": 2},
+        )
+
+        assert response.status_code in (302, 403)
+        with client.application.app_context():
+            assert not [
+                b for b in BookingRepository.get_by_requester(self.student.user_id) if b.series_id
+            ]
@@ -0,0 +1,160 @@
+"""
+Integration Tests for Bulk Booking Import - Campus Resource Hub
+Tests the import-bookings CLI command and the admin upload endpoint.
+"""
+
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import Booking
+from src.models.cache_generation import CacheGeneration
+from src.repositories.user_repo import UserRepository
+
+
+def _login(client, email: str, password: str):
+    client.post("/auth/login", data={"email": email, "password": password}, follow_redirects=True)
+
+
+class TestBookingImport:
+    """Integration tests for streaming booking imports."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app, demo_seed):
+        """Build a small import file around the seeded resources and users."""
+        self.demo = demo_seed
+        self.resource_id, self.other_id = demo_seed["resource_ids"][:2]
+        self.day = (datetime.now() + timedelta(days=30)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        student = demo_seed["student"]["email"]
+
+        def at(hour):
+            return (self.day + timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M")
+
+        self.rows = [
+            {
+                "resource_id": self.resource_id,
+                "requester_email": student,
+                "start_datetime": at(9),
+                "end_datetime": at(10),
+            },
+            {
+                "resource_id": self.resource_id,
+                "requester_email": student,
+                "start_datetime": at(9),
+                "end_datetime": at(11),
+            },  # overlaps the first row
+            {
+                "resource_id": self.other_id,
+                "requester_email": student,
+                "start_datetime": at(9),
+                "end_datetime": at(10),
+                "status": "pending",
+            },
+            {
+                "resource_id": 999999,
+                "requester_email": student,
+                "start_datetime": at(9),
+                "end_datetime": at(10),
+            },
+            {
+                "resource_id": self.resource_id,
+                "requester_email": "nobody@example.com",
+                "start_datetime": at(12),
+                "end_datetime": at(11),
+            },
+        ]
+
+    def _csv(self) -> str:
+        fields = ["resource_id", "requester_email", "start_datetime", "end_datetime", "status"]
+        lines = [",".join(fields)]
+        for row in self.rows:
+            lines.append(",".join(str(row.get(field, "")) for field in fields))
+        return "\n".join(lines) + "\n"
+
+    def test_cli_imports_valid_rows_and_reports_rejects(self, app, runner, tmp_path):
+        """Test the CLI bulk-inserts accepted rows and writes an error report."""
+        source = tmp_path / "term.csv"
+        source.write_text(self._csv())
+        report = tmp_path / "errors.csv"
+
+        with app.app_context():
+            generation = CacheGeneration.current("search")
+            before = Booking.query.count()
+
+        result = runner.invoke(args=["import-bookings", str(source), "--errors-out", str(report)])
+
+        assert result.exit_code == 0, result.output
+        assert "2 of 5 booking(s) imported; 3 rejected." in result.output
+        errors = report.read_text().splitlines()
+        assert errors[0].startswith("line,errors,")
+        assert errors[1].startswith("3,Overlaps approved booking on line 2")
+        assert "Unknown resource_id" in errors[2]
+        assert "Unknown requester" in errors[3] and "end_datetime must be after" in errors[3]
+
+        with app.app_context():
+            assert Booking.query.count() == before + 2
+            assert CacheGeneration.current("search") == generation + 1
+            pending = Booking.query.filter_by(resource_id=self.other_id, status="pending").one()
+            assert (
+                pending.requester_id
+                == UserRepository.get_by_email(self.demo["student"]["email"]).user_id
+            )
+
+    def test_cli_dry_run_writes_nothing(self, app, runner, tmp_path):
+        """Test --dry-run validates the file without inserting."""
+        source = tmp_path / "term.jsonl"
+        source.write_text("\n".join(json.dumps(row) for row in self.rows))
+
+        with app.app_context():
+            before = Booking.query.count()
+        result = runner.invoke(args=["import-bookings", str(source), "--dry-run"])
+
+        assert "2 of 5 booking(s) would be imported" in result.output
+        with app.app_context():
+            assert Booking.query.count() == before
+
+    def test_admin_upload_rejects_database_conflicts(self, app, client):
+        """Test the admin endpoint imports JSON and reports conflicts with stored bookings."""
+        admin = self.demo["admin"]
+        _login(client, admin["email"], admin["password"])
+        payload = json.dumps(self.rows[:1]).encode()
+
+        first = client.post(
+            "/admin/bookings/import",
+            data={"file": (io.BytesIO(payload), "term.json")},
+            content_type="multipart/form-data",
+        ).get_json()
+        second = client.post(
+            "/admin/bookings/import",
+            data={"file": (io.BytesIO(payload), "term.json")},
+            content_type="multipart/form-data",
+        ).get_json()
+
+        assert (first["imported"], first["rejected"]) == (1, 0)
+        assert (second["imported"], second["rejected"]) == (0, 1)
+        assert second["errors"][0]["errors"] == ["Conflicts with an existing approved booking"]
+
+    def test_admin_upload_requires_admin_and_valid_file(self, client):
+        """Test non-admins are refused and unsupported files are rejected."""
+        student = self.demo["student"]
+        _login(client, student["email"], student["password"])
+        refused = client.post(
+            "/admin/bookings/import",
+            data={"file": (io.BytesIO(b"[]"), "term.json")},
+            content_type="multipart/form-data",
+        )
+        assert refused.status_code in (302, 403)
+        client.post("/auth/logout", follow_redirects=True)
+
+        admin = self.demo["admin"]
+        _login(client, admin["email"], admin["password"])
+        bad = client.post(
+            "/admin/bookings/import",
+            data={"file": (io.BytesIO(b"x"), "term.xlsx")},
+            content_type="multipart/form-data",
+        )
+        assert bad.status_code == 400
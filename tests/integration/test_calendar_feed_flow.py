@@ -0,0 +1,82 @@
+"""
+Integration Tests for iCalendar Feeds - Campus Resource Hub
+Tests the resource and user .ics endpoints and their conditional GET handling.
+"""
+
+from src.app import db
+from src.models import Booking, Resource
+
+
+def _login(client, email: str, password: str):
+    client.post("/auth/login", data={"email": email, "password": password}, follow_redirects=True)
+
+
+class TestCalendarFeeds:
+    """Integration tests for calendar subscription feeds."""
+
+    def test_resource_feed_supports_conditional_get(self, app, client, demo_seed):
+        """Test a resource feed streams events, answers 304 when unchanged and changes its ETag."""
+        resource_id = demo_seed["resource_ids"][0]
+        url = f"/calendar/resources/{resource_id}.ics"
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.mimetype == "text/calendar"
+        body = response.get_data(as_text=True)
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert f"UID:booking-{demo_seed['booking_id']}@" in body
+        assert "student@smoke.local" not in body
+        etag = response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.get_data() == b""
+        by_date = client.get(url, headers={"If-Modified-Since": response.headers["Last-Modified"]})
+        assert by_date.status_code == 304
+
+        with app.app_context():
+            booking = db.session.get(Booking, demo_seed["booking_id"])
+            booking.status = "cancelled"
+            db.session.commit()
+
+        changed = client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert "BEGIN:VEVENT" not in changed.get_data(as_text=True)
+
+    def test_unpublished_resource_feed_is_hidden(self, app, client, demo_seed):
+        """Test feeds of unpublished resources are only served to owners and staff."""
+        resource_id = demo_seed["resource_ids"][0]
+        with app.app_context():
+            db.session.get(Resource, resource_id).status = "draft"
+            db.session.commit()
+
+        assert client.get(f"/calendar/resources/{resource_id}.ics").status_code == 404
+        _login(client, demo_seed["staff"]["email"], demo_seed["staff"]["password"])
+        assert client.get(f"/calendar/resources/{resource_id}.ics").status_code == 200
+
+    def test_user_feed_is_reached_through_signed_url(self, client, demo_seed):
+        """Test the feed URL works without a session and bad tokens are rejected."""
+        _login(client, demo_seed["student"]["email"], demo_seed["student"]["password"])
+        url = client.get("/calendar/feed-url").get_json()["url"]
+        client.post("/auth/logout")
+
+        response = client.get(url)
+        assert response.status_code == 200
+        body = response.get_data(as_text=True)
+        assert "STATUS:CONFIRMED" in body
+        assert "X-WR-CALNAME:Student Smoke - Bookings" in body
+        assert client.get("/calendar/users/not-a-token.ics").status_code == 404
+
+    def test_rotating_the_feed_url_revokes_the_old_one(self, client, demo_seed):
+        """Test a leaked feed URL stops working once the user rotates it."""
+        _login(client, demo_seed["student"]["email"], demo_seed["student"]["password"])
+        old_url = client.get("/calendar/feed-url").get_json()["url"]
+
+        new_url = client.post("/calendar/feed-url/rotate").get_json()["url"]
+
+        assert new_url != old_url
+        assert client.get("/calendar/feed-url").get_json()["url"] == new_url
+        assert client.get(old_url).status_code == 404
+        assert client.get(new_url).status_code == 200
@@ -422,3 +422,91 @@ class TestReviewFlow:
 
             # Hidden content should not be visible
             assert b"Hidden inappropriate content" not in response.data
+
+
+class TestRatingSummary:
+    """Persisted rating summary stays in step with review writes."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app, demo_seed):
+        with app.app_context():
+            self.resource_id = demo_seed["resource_ids"][0]
+            self.admin_id = _require_user(demo_seed["admin"]["email"]).user_id
+            self.reviewer_ids = [
+                UserRepository.create(
+                    name=f"Rater {i}",
+                    email=f"rater{i}@test.com",
+                    password="password123",
+                    role="student",
+                ).user_id
+                for i in range(3)
+            ]
+            yield
+
+    def _summary(self):
+        summary = ReviewRepository.get_rating_summary(self.resource_id)
+        return (summary.review_count, summary.rating_sum, summary.get_rating_distribution())
+
+    def test_summary_tracks_review_lifecycle(self, app):
+        with app.app_context():
+            first, second, third = [
+                ReviewRepository.create(self.resource_id, reviewer_id, rating=rating)
+                for reviewer_id, rating in zip(self.reviewer_ids, [5, 4, 3])
+            ]
+            assert ReviewRepository.get_average_rating(self.resource_id) == 4.0
+            assert self._summary() == (3, 12, {1: 0, 2: 0, 3: 1, 4: 1, 5: 1})
+
+            ReviewRepository.update(third.review_id, rating=1)
+            assert self._summary() == (3, 10, {1: 1, 2: 0, 3: 0, 4: 1, 5: 1})
+
+            ReviewRepository.hide(first.review_id, self.admin_id, "spam")
+            assert self._summary() == (2, 5, {1: 1, 2: 0, 3: 0, 4: 1, 5: 0})
+
+            ReviewRepository.unhide(first.review_id)
+            assert self._summary()[:2] == (3, 10)
+
+            ReviewRepository.delete(second.review_id)
+            assert self._summary() == (2, 6, {1: 1, 2: 0, 3: 0, 4: 0, 5: 1})
+            assert ReviewRepository.count_by_resource(self.resource_id) == 2
+
+    def test_rating_endpoint_reads_summary(self, client, app):
+        with app.app_context():
+            ReviewRepository.create(self.resource_id, self.reviewer_ids[0], rating=5)
+            ReviewRepository.create(self.resource_id, self.reviewer_ids[1], rating=4)
+
+            data = client.get(f"/resources/{self.resource_id}/rating").get_json()
+
+            assert data["average_rating"] == 4.5
+            assert data["review_count"] == 2
+            assert data["distribution"]["5"] == 1
+            assert data["top_rated"] is True
+
+    def test_rebuild_matches_incremental_state(self, app, runner):
+        with app.app_context():
+            review = ReviewRepository.create(self.resource_id, self.reviewer_ids[0], rating=2)
+            ReviewRepository.create(self.resource_id, self.reviewer_ids[1], rating=4)
+            ReviewRepository.hide(review.review_id, self.admin_id, "off-topic")
+            expected = self._summary()
+
+            result = runner.invoke(args=["rebuild-rating-summaries"])
+
+            assert "1 resource" in result.output
+            assert self._summary() == expected
+
+    def test_deleting_a_reviewer_removes_their_ratings(self, app):
+        from src.models import Review
+        from src.services.admin_service import AdminService
+
+        with app.app_context():
+            ReviewRepository.create(self.resource_id, self.reviewer_ids[0], rating=5)
+            ReviewRepository.create(self.resource_id, self.reviewer_ids[1], rating=1)
+            hidden = ReviewRepository.create(self.resource_id, self.reviewer_ids[2], rating=4)
+            ReviewRepository.hide(hidden.review_id, self.admin_id, "spam")
+
+            AdminService.delete_user(self.reviewer_ids[0], self.admin_id)
+            AdminService.delete_user(self.reviewer_ids[2], self.admin_id)
+
+            assert Review.query.count() == 1
+            assert self._summary() == (1, 1, {1: 1, 2: 0, 3: 0, 4: 0, 5: 0})
+            ReviewRepository.rebuild_rating_summaries()
+            assert self._summary() == (1, 1, {1: 1, 2: 0, 3: 0, 4: 0, 5: 0})
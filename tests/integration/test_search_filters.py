@@ -278,6 +278,33 @@ class TestPagination:
             content = response.data.decode("utf-8")
             assert "Resource" in content
 
+    def test_paginated_search_returns_page_and_total(self, app):
+        """Test that search_page loads one page and counts the full result set."""
+        with app.app_context():
+            user = UserRepository.create(
+                name="Page Owner",
+                email="pages@test.com",
+                password="Pages123",
+                role="staff",
+            )
+            for i in range(25):
+                ResourceRepository.create(
+                    owner_id=user.user_id,
+                    title=f"Paged Resource {i}",
+                    category="equipment",
+                    status="published",
+                )
+
+            first = ResourceRepository.search_page(page=1, per_page=20)
+            second = ResourceRepository.search_page(page=2, per_page=20)
+
+            assert first["total"] == 25
+            assert first["pages"] == 2
+            assert len(first["items"]) == 20
+            assert len(second["items"]) == 5
+            first_ids = {r.resource_id for r in first["items"]}
+            assert first_ids.isdisjoint(r.resource_id for r in second["items"])
+
     def test_empty_page_doesnt_crash(self, client, app, test_resources):
         """Test that requesting a page beyond results doesn't crash."""
         with app.app_context():
@@ -309,3 +336,603 @@ class TestSearchEdgeCases:
             long_query = "a" * 500
             response = client.get(f"/resources?q={long_query}")
             assert response.status_code == 200
+
+
+class TestFullTextIndex:
+    """Test the FTS5-backed keyword search in ResourceRepository.search."""
+
+    def test_index_is_created_with_schema(self, app, test_resources):
+        """Test that db.create_all builds the full-text index on SQLite."""
+        with app.app_context():
+            assert ResourceRepository.fts_enabled() is True
+
+    def test_prefix_match(self, app, test_resources):
+        """Test that partial words match as prefixes."""
+        with app.app_context():
+            results = ResourceRepository.search(query_str="projec")
+            assert [r.title for r in results] == ["Study Room Beta"]
+
+    def test_title_matches_rank_first(self, app, demo_seed, test_resources):
+        """Test bm25 ranking favours title matches over description matches."""
+        with app.app_context():
+            owner_id = UserRepository.get_by_email(demo_seed["staff"]["email"]).user_id
+            ResourceRepository.create(
+                owner_id=owner_id,
+                title="Quiet Corner",
+                category="study_room",
+                description="Near the printer station",
+                status="published",
+            )
+            ResourceRepository.create(
+                owner_id=owner_id,
+                title="Printer Station",
+                category="equipment",
+                description="Color laser printer",
+                status="published",
+            )
+
+            results = ResourceRepository.search(query_str="printer")
+            titles = [r.title for r in results]
+            assert titles[0] == "Printer Station"
+            assert "Quiet Corner" in titles
+
+    def test_index_follows_updates(self, app, test_resources):
+        """Test that edits to title are reflected in the index."""
+        with app.app_context():
+            resource = Resource.query.filter_by(title="Study Room Alpha").first()
+            ResourceRepository.update(resource, title="Renamed Seminar Room")
+
+            assert ResourceRepository.search(query_str="seminar")[0].title == (
+                "Renamed Seminar Room"
+            )
+            titles = [r.title for r in ResourceRepository.search(query_str="alpha")]
+            assert "Study Room Alpha" not in titles
+
+    def test_index_follows_deletes(self, app, test_resources):
+        """Test that deleted resources disappear from the index."""
+        with app.app_context():
+            resource = Resource.query.filter_by(title="MacBook Pro 2023").first()
+            ResourceRepository.delete(resource.resource_id)
+
+            assert ResourceRepository.search(query_str="macbook") == []
+
+    def test_punctuation_only_query_falls_back(self, app, test_resources):
+        """Test that queries without words do not reach the MATCH parser."""
+        with app.app_context():
+            assert ResourceRepository.search(query_str="%&*<>") == []
+
+    def test_mid_word_substring_falls_back_to_ilike(self, app, test_resources):
+        """Test a query no word starts with still finds substrings."""
+        with app.app_context():
+            assert [r.title for r in ResourceRepository.search(query_str="book")] == [
+                "MacBook Pro 2023"
+            ]
+
+    def test_index_lookup_is_cached_per_engine(self, app, test_resources):
+        """Test fts_enabled queries sqlite_master once, not on every search."""
+        from sqlalchemy import event
+        from src.models import db
+
+        with app.app_context():
+            ResourceRepository.search(query_str="study")
+            statements = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", capture)
+            try:
+                ResourceRepository.search(query_str="printer")
+            finally:
+                event.remove(db.engine, "before_cursor_execute", capture)
+
+            assert statements
+            assert not [sql for sql in statements if "sqlite_master" in sql]
+
+
+class TestDerivedSorts:
+    """Test rating and popularity sorts executed in SQL."""
+
+    def _setup(self):
+        from datetime import datetime, timedelta
+        from src.models import db, Booking
+        from src.repositories.review_repo import ReviewRepository
+
+        owner = UserRepository.create(
+            name="Sort Owner", email="sort-owner@test.com", password="Sort123", role="staff"
+        )
+        reviewers = [
+            UserRepository.create(
+                name=f"Reviewer {i}", email=f"rev{i}@test.com", password="Rev123", role="student"
+            )
+            for i in range(2)
+        ]
+        low, high, unrated = [
+            ResourceRepository.create(
+                owner_id=owner.user_id, title=title, category="lab", status="published"
+            )
+            for title in ("Low Rated Lab", "High Rated Lab", "Unrated Lab")
+        ]
+
+        ReviewRepository.create(low.resource_id, reviewers[0].user_id, rating=2)
+        ReviewRepository.create(high.resource_id, reviewers[0].user_id, rating=5)
+        ReviewRepository.create(high.resource_id, reviewers[1].user_id, rating=4)
+        start = datetime(2030, 1, 1, 9, 0)
+        for i in range(3):
+            db.session.add(
+                Booking(
+                    resource_id=unrated.resource_id,
+                    requester_id=reviewers[0].user_id,
+                    start_datetime=start + timedelta(days=i),
+                    end_datetime=start + timedelta(days=i, hours=1),
+                )
+            )
+        db.session.add(
+            Booking(
+                resource_id=low.resource_id,
+                requester_id=reviewers[0].user_id,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=1),
+            )
+        )
+        db.session.commit()
+
+    def test_rating_sort_with_pagination(self, app):
+        """Test highest rated resources come first and paginate correctly."""
+        with app.app_context():
+            self._setup()
+
+            first = ResourceRepository.search_page(sort="rating_desc", per_page=2)
+            second = ResourceRepository.search_page(sort="rating_desc", page=2, per_page=2)
+
+            assert [r.title for r in first["items"]] == ["High Rated Lab", "Low Rated Lab"]
+            assert [r.title for r in second["items"]] == ["Unrated Lab"]
+            assert first["total"] == 3
+
+    def test_popular_sort(self, app):
+        """Test most-booked resources come first."""
+        with app.app_context():
+            self._setup()
+
+            titles = [r.title for r in ResourceRepository.search(sort="popular")]
+            assert titles[:2] == ["Unrated Lab", "Low Rated Lab"]
+
+    def test_card_metadata_bulk_load(self, app):
+        """Test card metadata is loaded for a whole page in two queries."""
+        from sqlalchemy import event
+        from src.models import db
+
+        with app.app_context():
+            self._setup()
+            resources = ResourceRepository.search(sort="title_asc")
+            by_title = {r.title: r.resource_id for r in resources}
+
+            statements = []
+            engine = db.engine
+            listener = lambda *args: statements.append(args[2])  # noqa: E731
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                meta = ResourceRepository.get_card_metadata(list(by_title.values()))
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+
+            assert len(statements) == 2
+            high = meta[by_title["High Rated Lab"]]
+            assert high["average_rating"] == 4.5
+            assert high["review_count"] == 2
+            assert high["owner_name"] == "Sort Owner"
+            assert meta[by_title["Low Rated Lab"]]["booking_count"] == 1
+            unrated = meta[by_title["Unrated Lab"]]
+            assert unrated["average_rating"] is None
+            assert unrated["booking_count"] == 3
+            assert ResourceRepository.get_card_metadata([]) == {}
+
+    def test_listing_renders_bulk_loaded_ratings(self, client, app):
+        """Test the listing page shows ratings from the bulk loader."""
+        with app.app_context():
+            self._setup()
+
+        response = client.get("/resources?sort=rating_desc")
+        assert response.status_code == 200
+        assert b"Rating 4.5 out of 5" in response.data
+
+
+class TestFacets:
+    """Test cached facet counts for the filter drawer."""
+
+    def test_counts_all_facets_in_one_pass(self, app, test_resources):
+        """Test location, category, status and capacity counts."""
+        from src.services.facet_service import FacetService
+
+        with app.app_context():
+            facets = FacetService.get_facets()
+            expected_total = Resource.query.filter_by(status="published").count()
+
+            assert facets["total"] == expected_total
+            assert sum(facets["categories"].values()) == expected_total
+            assert facets["statuses"]["published"] == expected_total
+            locations = {f["label"]: f["count"] for f in facets["locations"]}
+            for location, count in locations.items():
+                assert (
+                    count == Resource.query.filter_by(status="published", location=location).count()
+                )
+            bucketed = sum(b["count"] for b in facets["capacity_buckets"])
+            assert (
+                bucketed
+                == Resource.query.filter(
+                    Resource.status == "published", Resource.capacity >= 1
+                ).count()
+            )
+
+    def test_filter_context_narrows_counts(self, app, test_resources):
+        """Test counts within a search/capacity context."""
+        from src.services.facet_service import FacetService
+
+        with app.app_context():
+            facets = FacetService.get_facets(context={"capacity_min": 10})
+            expected = Resource.query.filter(
+                Resource.status == "published", Resource.capacity >= 10
+            ).count()
+            assert facets["total"] == expected
+            assert facets["total"] < FacetService.get_facets()["total"]
+
+    def test_cache_hit_and_invalidation_on_write(self, app, demo_seed, test_resources):
+        """Test repeated lookups are served from cache until a resource is written."""
+        from sqlalchemy import event
+        from src.models import db
+        from src.services.facet_service import FacetService
+
+        with app.app_context():
+            before = FacetService.get_facets()
+
+            statements = []
+            listener = lambda *args: statements.append(args[2])  # noqa: E731
+            event.listen(db.engine, "before_cursor_execute", listener)
+            try:
+                assert FacetService.get_facets() is before
+            finally:
+                event.remove(db.engine, "before_cursor_execute", listener)
+            assert statements == []
+
+            owner = UserRepository.get_by_email(demo_seed["staff"]["email"])
+            ResourceRepository.create(
+                owner_id=owner.user_id,
+                title="Facet Studio",
+                category="space",
+                location="Facet Hall",
+                capacity=12,
+                status="published",
+            )
+
+            after = FacetService.get_facets()
+            assert after["total"] == before["total"] + 1
+            assert {"label": "Facet Hall", "count": 1} in after["locations"]
+
+    def test_listing_shows_category_counts(self, client, app, test_resources):
+        """Test the filter drawer renders facet counts."""
+        response = client.get("/resources")
+        assert response.status_code == 200
+        assert b'class="filter-option__count"' in response.data
+        assert b"data-capacity-buckets" in response.data
+
+
+class TestKeysetApi:
+    """Test the cursor-paginated JSON listing."""
+
+    def _walk(self, client, **params):
+        """Follow next_cursor until the last page, returning all titles."""
+        titles, cursor = [], None
+        for _ in range(50):
+            query = dict(params, limit=2)
+            if cursor:
+                query["cursor"] = cursor
+            payload = client.get("/api/resources", query_string=query).get_json()
+            assert len(payload["items"]) <= 2
+            titles.extend(item["title"] for item in payload["items"])
+            cursor = payload["next_cursor"]
+            if not payload["has_more"]:
+                assert cursor is None
+                return titles
+        raise AssertionError("cursor walk did not terminate")
+
+    def test_walk_matches_full_listing_with_tied_timestamps(self, client, app, test_resources):
+        """Test every published resource is returned once, ties broken by id."""
+        from datetime import datetime
+        from src.models import db
+
+        with app.app_context():
+            # Force identical created_at values so the resource_id tie-breaker matters
+            for resource in Resource.query.all():
+                resource.created_at = datetime(2025, 1, 1, 12, 0)
+            db.session.commit()
+            expected = [
+                r.title
+                for r in Resource.query.filter_by(status="published")
+                .order_by(Resource.resource_id.desc())
+                .all()
+            ]
+
+        assert self._walk(client) == expected
+
+    def test_title_sort_and_filters(self, client, app, test_resources):
+        """Test title ordering combined with category and capacity filters."""
+        with app.app_context():
+            expected = sorted(
+                r.title
+                for r in Resource.query.filter(
+                    Resource.status == "published",
+                    Resource.category == "study_room",
+                    Resource.capacity >= 2,
+                ).all()
+            )
+
+        titles = self._walk(client, sort="title_asc", category="study_room", capacity_min=2)
+        assert titles == expected
+
+    def test_items_include_card_metadata(self, client, test_resources):
+        """Test each item carries owner and rating metadata."""
+        item = client.get("/api/resources?limit=1").get_json()["items"][0]
+        assert item["owner_name"]
+        assert "average_rating" in item
+        assert "booking_count" in item
+
+    def test_rejects_bad_cursor_and_sort(self, client, test_resources):
+        """Test malformed cursors, mismatched cursors and offset-only sorts."""
+        assert client.get("/api/resources?cursor=not-a-cursor").status_code == 400
+        assert client.get("/api/resources?sort=rating_desc").status_code == 400
+
+        cursor = client.get("/api/resources?limit=1").get_json()["next_cursor"]
+        response = client.get(f"/api/resources?sort=title_asc&cursor={cursor}")
+        assert response.status_code == 400
+
+
+class TestFuzzySearch:
+    """Test the trigram index for misspelled queries."""
+
+    def test_trigrams_are_padded(self):
+        """Test trigram extraction matches the pg_trgm padding scheme."""
+        from src.models.resource import term_trigrams
+
+        assert term_trigrams("lab") == ["  l", " la", "lab", "ab "]
+
+    def test_misspelled_queries_match(self, app, test_resources):
+        """Test typos in titles and locations still find resources."""
+        with app.app_context():
+            libary = [r.title for r in ResourceRepository.search(query_str="libary")]
+            confrence = [r.title for r in ResourceRepository.search(query_str="confrence")]
+
+            assert "Study Room Alpha" in libary
+            assert "Study Room Beta" in libary
+            assert confrence == ["Conference Room A"]
+
+    def test_exact_matches_rank_before_fuzzy(self, app, test_resources):
+        """Test FTS hits come first and fuzzy-only rows follow."""
+        with app.app_context():
+            owner = Resource.query.first().owner_id
+            ResourceRepository.create(
+                owner_id=owner, title="Printing Station", category="equipment", status="published"
+            )
+            ResourceRepository.create(
+                owner_id=owner, title="Printer Cart", category="equipment", status="published"
+            )
+
+            titles = [r.title for r in ResourceRepository.search(query_str="printer")]
+            assert titles.index("Printer Cart") < titles.index("Printing Station")
+
+    def test_fuzzy_pass_only_runs_below_a_page_of_matches(self, app, test_resources):
+        """Test trigram lookups are skipped once exact matches fill the page."""
+        from sqlalchemy import event
+        from src.models import db
+
+        with app.app_context():
+            statements = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", capture)
+            try:
+                full = ResourceRepository.search_page(query_str="study", per_page=2)
+                skipped = [sql for sql in statements if "term_trigrams" in sql]
+                statements.clear()
+                ResourceRepository.search_page(query_str="study", per_page=20)
+                sparse = [sql for sql in statements if "term_trigrams" in sql]
+            finally:
+                event.remove(db.engine, "before_cursor_execute", capture)
+
+            assert full["total"] == 2
+            assert skipped == []
+            assert sparse
+
+    def test_trigram_inserts_ignore_existing_rows(self, app):
+        """Test concurrent saves adding the same new term cannot collide."""
+        from src.models import db, TermTrigram
+        from src.models.resource import term_trigrams
+        from src.utils.sql import insert_ignore
+
+        with app.app_context():
+            rows = [{"trigram": gram, "term": "zeppelin"} for gram in term_trigrams("zeppelin")]
+            insert_ignore(db.session, TermTrigram.__table__, rows[:3], ["trigram", "term"])
+            insert_ignore(db.session, TermTrigram.__table__, rows, ["trigram", "term"])
+            db.session.commit()
+
+            assert TermTrigram.query.filter_by(term="zeppelin").count() == len(rows)
+
+    def test_category_labels_are_indexed(self, app, test_resources):
+        """Test misspelled category labels match."""
+        with app.app_context():
+            hits = ResourceRepository.fuzzy_search("workshp")
+            lab = Resource.query.filter_by(title="3D Printer Lab").first()
+            assert lab.resource_id in hits
+
+    def test_index_follows_repository_writes(self, app, test_resources):
+        """Test updates and deletes through the repository keep postings current."""
+        from src.models import ResourceTerm
+
+        with app.app_context():
+            resource = Resource.query.filter_by(title="MacBook Pro 2023").first()
+            ResourceRepository.update(resource, title="Chromebook Cart")
+
+            assert resource.resource_id in ResourceRepository.fuzzy_search("chromebok")
+            assert resource.resource_id not in ResourceRepository.fuzzy_search("macbok")
+
+            resource_id = resource.resource_id
+            ResourceRepository.delete(resource_id)
+            assert ResourceTerm.query.filter_by(resource_id=resource_id).count() == 0
+
+    def test_rebuild_and_lookup_uses_index(self, app, test_resources):
+        """Test rebuilding repopulates postings and lookups seek the indexes."""
+        from src.models import db, ResourceTerm, TermTrigram
+
+        with app.app_context():
+            ResourceTerm.query.delete()
+            TermTrigram.query.delete()
+            db.session.commit()
+            assert ResourceRepository.fuzzy_search("libary") == {}
+
+            assert ResourceRepository.rebuild_trigram_index() > 0
+            assert ResourceRepository.fuzzy_search("libary")
+
+            def plan(sql):
+                return " ".join(str(row[-1]) for row in db.session.execute(db.text(sql)))
+
+            assert "SEARCH term_trigrams USING" in plan(
+                "EXPLAIN QUERY PLAN SELECT term, COUNT(trigram) FROM term_trigrams "
+                "WHERE trigram IN ('  l', ' li', 'lib') GROUP BY term"
+            )
+            assert "SEARCH resource_terms USING" in plan(
+                "EXPLAIN QUERY PLAN SELECT resource_id FROM resource_terms "
+                "WHERE term = 'library' LIMIT 50"
+            )
+
+    def test_concierge_falls_back_to_fuzzy_location(self, app, test_resources):
+        """Test the concierge retries a misspelled building name."""
+        from src.services.ai_concierge_service import AIConciergeService
+
+        with app.app_context():
+            ResourceRepository.create(
+                owner_id=Resource.query.first().owner_id,
+                title="Wells Reading Room",
+                category="study_room",
+                location="Wells Library",
+                status="published",
+            )
+            result = AIConciergeService._search_resources(
+                {
+                    "category": None,
+                    "capacity": None,
+                    "location": "Wels Libary",
+                    "keywords": [],
+                    "date": None,
+                    "time": None,
+                    "original_query": "find a room in Wels Libary",
+                }
+            )
+            assert "Wells Reading Room" in str(result)
+
+
+class TestSearchCache:
+    """Test the generation-versioned search-result cache."""
+
+    def test_normalized_filters_share_a_key(self, app):
+        """Test equivalent filter sets produce the same cache key."""
+        from src.services.search_service import SearchService
+
+        first = SearchService.normalize_filters(
+            {"query_str": "  Study ROOM ", "categories": ["lab", "study_room"], "location": None}
+        )
+        second = SearchService.normalize_filters(
+            {"categories": ["study_room", "lab"], "query_str": "study room", "capacity_min": ""}
+        )
+        assert first == second
+
+    def test_hits_until_a_write_bumps_the_generation(self, app, demo_seed, test_resources):
+        """Test repeated searches hit the cache and resource/booking writes invalidate it."""
+        from datetime import datetime, timedelta
+        from src.models import db, Booking, CacheGeneration
+        from src.services.search_service import SearchService
+
+        with app.app_context():
+            first = SearchService.search(query_str="study", per_page=10)
+            second = SearchService.search(query_str="STUDY ", per_page=10)
+            stats = SearchService.cache_stats()
+
+            assert [r.title for r in second["items"]] == [r.title for r in first["items"]]
+            assert second["total"] == first["total"]
+            assert stats["hits"] == 1
+            assert stats["misses"] == 1
+
+            generation = CacheGeneration.current("search")
+            owner = UserRepository.get_by_email(demo_seed["staff"]["email"])
+            ResourceRepository.create(
+                owner_id=owner.user_id, title="Study Pod", category="study_room", status="published"
+            )
+            assert CacheGeneration.current("search") == generation + 1
+
+            third = SearchService.search(query_str="study", per_page=10)
+            assert "Study Pod" in [r.title for r in third["items"]]
+            assert third["total"] == first["total"] + 1
+
+            # A pending request does not change what a search can return
+            generation = CacheGeneration.current("search")
+            start = datetime(2031, 1, 1, 9, 0)
+            booking = Booking(
+                resource_id=third["items"][0].resource_id,
+                requester_id=owner.user_id,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=1),
+            )
+            db.session.add(booking)
+            db.session.commit()
+            assert CacheGeneration.current("search") == generation
+
+            # Approving it does (availability filter), even with the old status expired
+            db.session.expire_all()
+            booking.status = "approved"
+            db.session.commit()
+            assert CacheGeneration.current("search") == generation + 1
+
+            # Columns search never reads leave cached pages alone
+            booking.resource.images = '["pod.jpg"]'
+            db.session.commit()
+            assert CacheGeneration.current("search") == generation + 1
+
+    def test_rolled_back_write_keeps_generation(self, app, demo_seed):
+        """Test the bump only happens once the write commits."""
+        from src.models import db, Resource as ResourceModel, CacheGeneration
+
+        with app.app_context():
+            generation = CacheGeneration.current("search")
+            owner = UserRepository.get_by_email(demo_seed["staff"]["email"])
+            db.session.add(ResourceModel(owner_id=owner.user_id, title="Ghost", category="lab"))
+            db.session.flush()
+            db.session.rollback()
+
+            assert CacheGeneration.current("search") == generation
+
+    def test_bump_upserts_the_counter_row(self, app):
+        """Test the first bump creates the row and later bumps increment it."""
+        from src.models import CacheGeneration
+
+        with app.app_context():
+            assert CacheGeneration.current("facets") == 0
+            CacheGeneration.bump("facets")
+            CacheGeneration.bump("facets")
+            assert CacheGeneration.current("facets") == 2
+
+    def test_admin_cache_stats_endpoint(self, client, app, demo_seed):
+        """Test admins can read cache metrics."""
+        client.post(
+            "/auth/login",
+            data={
+                "email": demo_seed["admin"]["email"],
+                "password": demo_seed["admin"]["password"],
+            },
+            follow_redirects=True,
+        )
+        client.get("/resources")
+        client.get("/resources")
+
+        payload = client.get("/admin/cache-stats").get_json()
+        assert payload["search"]["hits"] >= 1
+        assert "resource_facets" in payload["caches"]
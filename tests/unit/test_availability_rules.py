@@ -0,0 +1,123 @@
+"""
+Unit Tests for the Availability Rules Engine - Campus Resource Hub
+Tests compilation of availability_rules JSON into weekly bitmaps.
+"""
+
+from datetime import datetime
+
+from src.services.availability_service import (
+    AvailabilityService,
+    _bucket_minutes,
+    _intersect,
+    _merge,
+    _snap,
+    _subtract,
+)
+
+# 2030-01-07 is a Monday
+MONDAY = datetime(2030, 1, 7)
+
+
+def _at(day_offset: int, hour: int, minute: int = 0, second: int = 0) -> datetime:
+    return MONDAY.replace(day=MONDAY.day + day_offset, hour=hour, minute=minute, second=second)
+
+
+class TestCompiledRules:
+    """Test rule compilation and booking validation."""
+
+    def test_empty_rules_are_always_open(self):
+        """Test resources without rules accept any window."""
+        rules = AvailabilityService.compile_rules({})
+
+        assert rules.always_open
+        assert rules.violation(_at(6, 23), _at(7, 1)) is None
+
+    def test_days_and_hours(self):
+        """Test bookings must fall on allowed days within allowed hours."""
+        rules = AvailabilityService.compile_rules(
+            {"days": ["monday", "wednesday"], "hours": {"start": "08:00", "end": "18:00"}}
+        )
+
+        assert rules.violation(_at(0, 8), _at(0, 18)) is None
+        assert rules.violation(_at(2, 9, 30), _at(2, 10, 15)) is None
+        assert rules.violation(_at(0, 7, 59), _at(0, 9)) is not None
+        assert rules.violation(_at(0, 17), _at(0, 18, 1)) is not None
+        assert rules.violation(_at(1, 9), _at(1, 10)) is not None
+
+    def test_max_booking_hours(self):
+        """Test the max duration rule."""
+        rules = AvailabilityService.compile_rules({"max_booking_hours": 2})
+
+        assert rules.violation(_at(0, 9), _at(0, 11)) is None
+        assert "limited" in rules.violation(_at(0, 9), _at(0, 11, 30))
+
+    def test_overnight_hours_wrap_into_next_day_and_week(self):
+        """Test an end time before the start time runs past midnight, even on Sunday."""
+        rules = AvailabilityService.compile_rules(
+            {"days": ["sun"], "hours": {"start": "22:00", "end": "02:00"}}
+        )
+
+        assert rules.violation(_at(6, 23), _at(7, 1)) is None
+        assert rules.violation(_at(0, 1), _at(0, 2)) is None
+        assert rules.violation(_at(0, 1), _at(0, 3)) is not None
+
+    def test_open_windows_clip_and_merge(self):
+        """Test open windows are enumerated, clipped to the range and merged."""
+        rules = AvailabilityService.compile_rules(
+            {"days": ["monday", "tuesday"], "hours": {"start": "09:00", "end": "17:00"}}
+        )
+
+        windows = rules.open_windows(_at(0, 12), _at(2, 0))
+        assert windows == [(_at(0, 12), _at(0, 17)), (_at(1, 9), _at(1, 17))]
+
+        all_day = AvailabilityService.compile_rules({"days": ["sat", "sun", "mon"]})
+        assert all_day.open_windows(_at(5, 0), _at(8, 0)) == [(_at(5, 0), _at(8, 0))]
+
+    def test_is_open_on(self):
+        """Test per-day open check used by the calendar."""
+        rules = AvailabilityService.compile_rules({"days": ["friday"]})
+
+        assert rules.is_open_on(_at(4, 0).date())
+        assert not rules.is_open_on(_at(3, 0).date())
+
+
+class TestFreeIntervalSweep:
+    """Test the merge/subtract/snap helpers behind the free-slot finder."""
+
+    def test_merge_sorts_and_coalesces(self):
+        """Test overlapping and touching busy intervals merge into one."""
+        busy = [
+            (_at(0, 13), _at(0, 14)),
+            (_at(0, 9), _at(0, 10)),
+            (_at(0, 9, 30), _at(0, 11)),
+            (_at(0, 11), _at(0, 12)),
+        ]
+
+        assert _merge(busy) == [(_at(0, 9), _at(0, 12)), (_at(0, 13), _at(0, 14))]
+
+    def test_subtract_busy_from_windows(self):
+        """Test busy intervals are swept out of every open window they touch."""
+        windows = [(_at(0, 9), _at(0, 17)), (_at(1, 9), _at(1, 17))]
+        busy = [(_at(0, 8), _at(0, 10)), (_at(0, 12), _at(0, 13)), (_at(0, 16), _at(1, 10))]
+
+        assert _subtract(windows, busy) == [
+            (_at(0, 10), _at(0, 12)),
+            (_at(0, 13), _at(0, 16)),
+            (_at(1, 10), _at(1, 17)),
+        ]
+
+    def test_snap_rounds_inward(self):
+        """Test starts round up and ends round down to the granularity."""
+        assert _snap(_at(0, 9, 10), 30, up=True) == _at(0, 9, 30)
+        assert _snap(_at(0, 9, 30), 30, up=True) == _at(0, 9, 30)
+        assert _snap(_at(0, 9, 50), 30, up=False) == _at(0, 9, 30)
+        assert _snap(_at(0, 9, 0, 30), 15, up=True) == _at(0, 9, 15)
+
+    def test_bucket_minutes_and_intersect(self):
+        """Test intervals are spread over fixed-size cells and clipped to windows."""
+        windows = [(_at(0, 9), _at(0, 17))]
+        busy = [(_at(0, 8), _at(0, 10, 30)), (_at(0, 16), _at(1, 1))]
+
+        assert _intersect(windows, busy) == [(_at(0, 9), _at(0, 10, 30)), (_at(0, 16), _at(0, 17))]
+        assert _bucket_minutes(busy, _at(0, 0), 24 * 60, 2) == [150 + 480, 60]
+        assert _bucket_minutes(busy, _at(0, 0), 60, 24)[8:11] == [60, 60, 30]
@@ -0,0 +1,149 @@
+"""
+Unit Tests for Booking Auto-Completion - Campus Resource Hub
+Tests the chunked completion sweep in BookingService and the periodic job runner.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.app import db
+from src.models import Booking, JobRun, Resource, User
+from src.models.cache_generation import CacheGeneration
+from src.repositories import BookingRepository, JobRunRepository
+from src.services.admin_service import AdminService
+from src.services.booking_service import COMPLETION_JOB, BookingService
+from src.utils.scheduler import PeriodicJob, schedule_job
+
+NOW = datetime(2030, 3, 4, 12, 0)
+
+
+@pytest.fixture
+def bookings(app):
+    """Create a resource with finished, running, future and pending bookings."""
+    with app.app_context():
+        user = User(
+            name="Lab Staff", email="staff@example.com", password="TestPassword123", role="staff"
+        )
+        db.session.add(user)
+        db.session.commit()
+        resource = Resource(
+            owner_id=user.user_id,
+            title="Chemistry Lab",
+            category="lab",
+            location="Science Hall",
+            capacity=20,
+            status="published",
+        )
+        db.session.add(resource)
+        db.session.commit()
+
+        def add(hours_from_now, status="approved"):
+            end = NOW + timedelta(hours=hours_from_now)
+            booking = Booking(
+                resource_id=resource.resource_id,
+                requester_id=user.user_id,
+                start_datetime=end - timedelta(hours=1),
+                end_datetime=end,
+                status=status,
+            )
+            db.session.add(booking)
+            return booking
+
+        finished = [add(-hours) for hours in (1, 2, 3, 4, 0)]
+        running = add(1)
+        pending = add(-5, status="pending")
+        db.session.commit()
+        yield {
+            "finished": [b.booking_id for b in finished],
+            "running": running.booking_id,
+            "pending": pending.booking_id,
+        }
+
+
+class TestCompleteFinishedBookings:
+    """Test the set-based completion sweep."""
+
+    def test_completes_only_finished_approved_bookings_in_chunks(self, app, bookings):
+        """Test every ended approved booking is completed across several chunks."""
+        with app.app_context():
+            generation = CacheGeneration.current("search")
+
+            run = BookingService.complete_finished_bookings(now=NOW, chunk_size=2)
+
+            assert run.rows_affected == 5
+            assert run.status == "succeeded"
+            assert run.finished_at is not None
+            # Three non-empty chunks (2 + 2 + 1), each invalidating search caches
+            assert CacheGeneration.current("search") == generation + 3
+            statuses = {b.booking_id: b.status for b in Booking.query.all()}
+            assert all(statuses[i] == "completed" for i in bookings["finished"])
+            assert statuses[bookings["running"]] == "approved"
+            assert statuses[bookings["pending"]] == "pending"
+
+    def test_repeat_runs_are_recorded_and_change_nothing(self, app, bookings):
+        """Test a second sweep completes nothing and both runs are logged."""
+        with app.app_context():
+            BookingService.complete_finished_bookings(now=NOW)
+            second = BookingService.complete_finished_bookings(now=NOW)
+
+            assert second.rows_affected == 0
+            assert [r.rows_affected for r in JobRunRepository.get_recent(COMPLETION_JOB)] == [0, 5]
+            assert JobRunRepository.get_latest(COMPLETION_JOB).run_id == second.run_id
+
+    def test_sweep_refreshes_cached_platform_stats(self, app, bookings):
+        """Test completed bookings show up in platform stats without waiting for the TTL."""
+        with app.app_context():
+            assert AdminService.get_platform_stats()["approved_bookings"] == 6
+
+            BookingService.complete_finished_bookings(now=NOW)
+
+            assert AdminService.get_platform_stats()["approved_bookings"] == 1
+
+    def test_failure_is_recorded(self, app, bookings, monkeypatch):
+        """Test a failing sweep records the error and re-raises."""
+
+        def explode(cutoff, limit):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(BookingRepository, "complete_finished_chunk", staticmethod(explode))
+        with app.app_context():
+            with pytest.raises(RuntimeError):
+                BookingService.complete_finished_bookings(now=NOW)
+
+            run = JobRun.query.one()
+            assert run.status == "failed"
+            assert run.error == "database unavailable"
+
+
+class TestPeriodicJob:
+    """Test the in-process scheduler."""
+
+    def test_runs_repeatedly_until_stopped_and_survives_errors(self, app):
+        """Test the job keeps its schedule after a failing run."""
+        calls = []
+        done = threading.Event()
+
+        def work():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("first run fails")
+            if len(calls) >= 3:
+                done.set()
+
+        job = schedule_job(app, "test-job", 0.01, work)
+        try:
+            assert done.wait(5)
+        finally:
+            job.stop()
+
+        assert app.extensions["jobs"]["test-job"] is job
+        assert len(calls) >= 3
+
+    def test_run_once_uses_app_context(self, app):
+        """Test run_once can touch the database outside any request."""
+        seen = []
+        PeriodicJob(app, "probe", 60, lambda: seen.append(JobRun.query.count())).run_once()
+
+        assert seen == [0]
@@ -0,0 +1,123 @@
+"""
+Unit Tests for the Booking Import Pipeline - Campus Resource Hub
+Tests streaming parsers and the conflict sweep in services/booking_import_service.py.
+"""
+
+import io
+from datetime import datetime
+
+import pytest
+
+from src.services import booking_import_service
+from src.services.booking_import_service import (
+    BookingImportError,
+    BookingImportService,
+    ImportRow,
+    _iter_rows,
+    _sweep,
+)
+
+BASE = datetime(2030, 1, 8, 9, 0)
+
+
+def _row(line, start_hour, end_hour, status="approved", resource_id=1):
+    return ImportRow(
+        line,
+        resource_id,
+        7,
+        BASE.replace(hour=start_hour),
+        BASE.replace(hour=end_hour),
+        status,
+    )
+
+
+class TestParsers:
+    """Test streaming CSV / JSON / JSON Lines parsing."""
+
+    def test_json_array_is_decoded_incrementally(self, monkeypatch):
+        """Test array items split across read boundaries are decoded one by one."""
+        monkeypatch.setattr(booking_import_service, "JSON_READ_SIZE", 7)
+        text = '[ {"resource_id": 1, "note": "a, b"},\n {"resource_id": 2} ]'
+
+        rows = list(_iter_rows(io.StringIO(text), "json"))
+
+        assert rows == [(1, {"resource_id": 1, "note": "a, b"}), (2, {"resource_id": 2})]
+
+    @pytest.mark.parametrize(
+        "text", ['{"resource_id": 1}', '[{"resource_id": 1}', "[1, 2]", '[{"resource_id": }]']
+    )
+    def test_malformed_json_is_rejected(self, text):
+        """Test non-arrays, unterminated arrays and non-object items raise."""
+        with pytest.raises(BookingImportError):
+            list(_iter_rows(io.StringIO(text), "json"))
+
+    def test_csv_and_jsonl_report_line_numbers(self):
+        """Test rows carry their source line for the error report."""
+        csv_rows = list(
+            _iter_rows(io.StringIO("resource_id,status\n1,approved\n2,pending\n"), "csv")
+        )
+        jsonl_rows = list(
+            _iter_rows(io.StringIO('{"resource_id": 1}\n\n{"resource_id": 2}\n'), "jsonl")
+        )
+
+        assert [line for line, _ in csv_rows] == [2, 3]
+        assert csv_rows[1][1] == {"resource_id": "2", "status": "pending"}
+        assert [line for line, _ in jsonl_rows] == [1, 3]
+
+    def test_detect_format(self):
+        """Test formats are inferred from extensions."""
+        assert BookingImportService.detect_format("term.CSV") == "csv"
+        assert BookingImportService.detect_format("term.ndjson") == "jsonl"
+        with pytest.raises(BookingImportError):
+            BookingImportService.detect_format("term.xlsx")
+
+
+class TestSweep:
+    """Test the sort-by-(resource, start) conflict sweep."""
+
+    def test_intra_file_and_database_conflicts(self):
+        """Test overlapping rows lose to earlier-starting rows and to existing bookings."""
+        rows = [
+            _row(2, 10, 12),
+            _row(3, 11, 13),  # overlaps line 2
+            _row(4, 12, 13),  # touches line 2 only
+            _row(5, 15, 16),  # overlaps the database booking
+            _row(6, 11, 12, resource_id=2),  # other resource
+        ]
+        existing = [(1, BASE.replace(hour=14), BASE.replace(hour=15, minute=30))]
+
+        accepted, conflicts = _sweep(rows, existing)
+
+        assert sorted(row.line for row in accepted) == [2, 4, 6]
+        assert [(row.line, reason) for row, reason in conflicts] == [
+            (3, "Overlaps approved booking on line 2"),
+            (5, "Conflicts with an existing approved booking"),
+        ]
+
+    def test_long_database_booking_is_found_behind_short_ones(self):
+        """Test the running maximum catches a long booking that starts earliest."""
+        existing = [
+            (1, BASE.replace(hour=6), BASE.replace(hour=20)),
+            (1, BASE.replace(hour=7), BASE.replace(hour=8)),
+        ]
+
+        accepted, conflicts = _sweep([_row(2, 16, 17)], existing)
+
+        assert accepted == []
+        assert len(conflicts) == 1
+
+    def test_pending_rows_only_blocked_by_approved(self):
+        """Test pending rows never block each other but are blocked by approved rows."""
+        rows = [
+            _row(2, 10, 11, status="pending"),
+            _row(3, 10, 11, status="pending"),
+            _row(4, 12, 14, status="pending"),
+            _row(5, 13, 15),
+        ]
+
+        accepted, conflicts = _sweep(rows, [])
+
+        assert sorted(row.line for row in accepted) == [2, 3, 5]
+        assert [(row.line, reason) for row, reason in conflicts] == [
+            (4, "Overlaps approved booking on line 5")
+        ]
@@ -13,8 +13,13 @@ Overlap condition: (new.start < existing.end) AND (new.end > existing.start)
 Per .clinerules: TDD approach with edge cases and unhappy paths.
 """
 
+from contextlib import contextmanager
 from datetime import datetime
+
+from sqlalchemy import event
+
 from src.models import db, User, Resource, Booking
+from src.repositories.booking_repo import BookingRepository
 
 
 class TestBookingOverlapDetection:
@@ -409,3 +414,60 @@ class TestBookingConflictDetectionIntegration:
                 Booking.query.filter_by(resource_id=resource.resource_id, status="approved").count()
                 == 3
             )
+
+
+@contextmanager
+def _captured_selects():
+    """Collect (statement, parameters) of SELECTs run on the session's engine."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def _query_plan(statement, parameters) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN details for a captured statement."""
+    cursor = db.session.connection().connection.cursor()
+    rows = cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+    return " | ".join(row[-1] for row in rows)
+
+
+class TestConflictQueryPlan:
+    """Test the conflict-detection queries use the partial approved-bookings index."""
+
+    def test_find_conflicts_uses_partial_index(self, app):
+        """Test find_conflicts searches idx_bookings_approved_window by resource and start."""
+        with app.app_context():
+            with _captured_selects() as selects:
+                BookingRepository.find_conflicts(
+                    1, datetime(2030, 1, 1, 10, 0), datetime(2030, 1, 1, 12, 0)
+                )
+
+            plan = _query_plan(*selects[-1])
+            assert (
+                "USING INDEX idx_bookings_approved_window "
+                "(status=? AND resource_id=? AND start_datetime<?)" in plan
+            )
+
+    def test_approved_intervals_use_covering_index(self, app):
+        """Test window scans of approved bookings never touch the table rows."""
+        with app.app_context():
+            with _captured_selects() as selects:
+                BookingRepository.get_intervals_in_range(
+                    [1, 2],
+                    datetime(2030, 1, 1),
+                    datetime(2030, 1, 8),
+                    statuses=["approved"],
+                    with_ids=True,
+                )
+
+            plan = _query_plan(*selects[-1])
+            assert "USING COVERING INDEX idx_bookings_approved_window" in plan
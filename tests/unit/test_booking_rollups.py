@@ -0,0 +1,227 @@
+"""
+Unit Tests for Daily Booking Rollups - Campus Resource Hub
+Tests incremental maintenance in repositories/analytics_repo.py against a
+full rebuild, and the analytics readers in AdminService that use them.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from src.app import db
+from src.models import Booking, BookingDailyRollup, Resource, User
+from src.repositories import AnalyticsRepository, BookingRepository
+from src.services.admin_service import AdminService
+from src.services.booking_service import BookingService
+
+DAY = (datetime.now() + timedelta(days=5)).replace(hour=9, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture
+def campus(app):
+    """Create an admin, a student, a lab and a room; yields ids."""
+    with app.app_context():
+        admin = User(
+            name="Admin", email="admin@example.com", password="TestPassword123", role="admin"
+        )
+        student = User(name="Student", email="student@example.com", password="TestPassword123")
+        db.session.add_all([admin, student])
+        db.session.commit()
+        lab = Resource(owner_id=admin.user_id, title="Lab", category="lab", status="published")
+        room = Resource(
+            owner_id=admin.user_id, title="Room", category="study_room", status="published"
+        )
+        db.session.add_all([lab, room])
+        db.session.commit()
+        yield {
+            "admin": admin.user_id,
+            "student": student.user_id,
+            "lab": lab.resource_id,
+            "room": room.resource_id,
+        }
+
+
+def _snapshot():
+    """Non-empty rollup rows as {(day, resource_id, status): (count, minutes, created)}."""
+    return {
+        (row.day, row.resource_id, row.status): (
+            row.booking_count,
+            row.booked_minutes,
+            row.created_count,
+        )
+        for row in BookingDailyRollup.query.all()
+        if row.booking_count or row.booked_minutes or row.created_count
+    }
+
+
+def _book(campus, resource, hours, duration=1, status="pending"):
+    start = DAY + timedelta(hours=hours)
+    return BookingService.create_booking(
+        campus[resource],
+        campus["student"],
+        start,
+        start + timedelta(hours=duration),
+        enforce_rules=False,
+        status=status,
+    )
+
+
+@contextmanager
+def _bookings_scans():
+    """Collect statements that read the bookings table."""
+    scans = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM bookings" in statement:
+            scans.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        yield scans
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+
+class TestIncrementalRollups:
+    """Test every write path keeps the rollups equal to a rebuild."""
+
+    def test_orm_writes_match_rebuild(self, app, campus):
+        """Test creates, status changes, reschedules and deletes are applied incrementally."""
+        with app.app_context():
+            first = _book(campus, "lab", 0, duration=2)
+            second = _book(campus, "lab", 3)
+            third = _book(campus, "room", 0, status="approved")
+
+            assert _snapshot()[(DAY.date(), campus["lab"], "pending")] == (2, 180, 0)
+
+            BookingService.approve_booking(first.booking_id)
+            BookingService.cancel_booking(third.booking_id)
+            # Old values that were never loaded are read back before the UPDATE
+            db.session.expire_all()
+            db.session.get(Booking, third.booking_id).status = "rejected"
+            db.session.commit()
+            BookingRepository.update(
+                second.booking_id,
+                start_datetime=DAY + timedelta(days=1),
+                end_datetime=DAY + timedelta(days=1, minutes=30),
+            )
+            db.session.delete(db.session.get(Booking, first.booking_id))
+            db.session.commit()
+
+            incremental = _snapshot()
+            assert incremental[(DAY.date() + timedelta(days=1), campus["lab"], "pending")] == (
+                1,
+                30,
+                0,
+            )
+            assert incremental[(DAY.date(), campus["room"], "rejected")] == (1, 60, 0)
+            AnalyticsRepository.rebuild()
+            assert _snapshot() == incremental
+
+    def test_bulk_writes_match_rebuild(self, app, campus):
+        """Test Core UPDATEs and bulk inserts keep the rollups exact."""
+        with app.app_context():
+            pending = [_book(campus, "room", hours).booking_id for hours in (0, 2, 4)]
+            past = _book(campus, "lab", -24 * 10, status="approved")
+
+            AdminService.process_booking_approvals(pending[:2], "approve", campus["admin"])
+            BookingService.complete_finished_bookings()
+            BookingRepository.bulk_insert(
+                [
+                    {
+                        "resource_id": campus["lab"],
+                        "requester_id": campus["student"],
+                        "start_datetime": DAY + timedelta(days=2),
+                        "end_datetime": DAY + timedelta(days=2, hours=3),
+                        "status": "approved",
+                    }
+                ]
+            )
+            db.session.commit()
+
+            incremental = _snapshot()
+            completed_day = past.start_datetime.date()
+            assert incremental[(completed_day, campus["lab"], "completed")] == (1, 60, 0)
+            assert incremental[(DAY.date(), campus["room"], "approved")] == (2, 120, 0)
+            AnalyticsRepository.rebuild()
+            assert _snapshot() == incremental
+
+    def test_rebuild_since_keeps_earlier_days(self, app, campus, runner):
+        """Test a partial rebuild only replaces days from its start date on."""
+        with app.app_context():
+            _book(campus, "lab", 0)
+            _book(campus, "lab", 24 * 3)
+            expected = _snapshot()
+            BookingDailyRollup.query.delete()
+            db.session.commit()
+
+        since = (DAY + timedelta(days=1)).strftime("%Y-%m-%d")
+        result = runner.invoke(args=["rebuild-booking-rollups", "--since", since])
+        assert result.exit_code == 0, result.output
+
+        with app.app_context():
+            assert set(_snapshot()) == {(DAY.date() + timedelta(days=3), campus["lab"], "pending")}
+            runner.invoke(args=["rebuild-booking-rollups"])
+            assert _snapshot() == expected
+
+    def test_resource_deleted_with_its_bookings(self, app, campus):
+        """Test an ORM cascade delete of a resource and its bookings in one flush."""
+        with app.app_context():
+            _book(campus, "lab", 0)
+            _book(campus, "lab", 2, status="approved")
+            _book(campus, "room", 0)
+
+            db.session.delete(db.session.get(Resource, campus["lab"]))
+            db.session.commit()
+
+            assert Booking.query.count() == 1
+            incremental = _snapshot()
+            assert {resource_id for _, resource_id, _ in incremental} == {campus["room"]}
+            AnalyticsRepository.rebuild()
+            assert _snapshot() == incremental
+
+
+class TestAnalyticsReaders:
+    """Test the admin analytics read rollups instead of bookings."""
+
+    def test_readers_use_rollups_only(self, app, campus):
+        """Test per-day, trend and category figures without scanning bookings."""
+        with app.app_context():
+            today = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+            seeded = [(0, "lab", "approved"), (-1, "lab", "pending"), (-1, "room", "approved")]
+            for offset, resource, status in seeded:
+                start = today + timedelta(days=offset)
+                end = start + timedelta(hours=1)
+                db.session.add(Booking(campus[resource], campus["student"], start, end, status))
+            db.session.commit()
+
+            with _bookings_scans() as scans:
+                per_day = AdminService.get_bookings_per_day(days=3)
+                trends = AdminService.get_booking_trends(days=30)
+                popularity = AdminService.get_category_popularity(days=30)
+            assert scans == []
+
+            assert per_day["datasets"][0]["data"] == [0, 2, 1]
+            assert trends == {
+                "period_days": 30,
+                "total_bookings": 3,
+                "by_status": {"approved": 2, "pending": 1},
+            }
+            assert popularity["labels"] == ["Lab", "Study Room"]
+            assert popularity["datasets"][0]["data"] == [1, 1]
+
+    def test_recategorized_resource_moves_its_history(self, app, campus):
+        """Test category figures follow a resource's current category without a rebuild."""
+        with app.app_context():
+            _book(campus, "lab", 0, status="approved")
+            _book(campus, "room", 0, status="approved")
+            assert AdminService.get_category_popularity(days=30)["labels"] == ["Lab", "Study Room"]
+
+            db.session.get(Resource, campus["lab"]).category = "study_room"
+            db.session.commit()
+
+            popularity = AdminService.get_category_popularity(days=30)
+            assert popularity["labels"] == ["Study Room"]
+            assert popularity["datasets"][0]["data"] == [2]
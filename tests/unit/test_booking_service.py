@@ -435,3 +435,37 @@ class TestBookingServiceQueries:
             assert stats["total"] == 2
             assert stats["pending"] == 1
             assert stats["approved"] == 1
+            assert stats["completed"] == stats["cancelled"] == stats["rejected"] == 0
+
+    def test_booking_statistics_cache(self, app, sample_resource, sample_user):
+        """Test statistics are served from cache until a booking write commits."""
+        from sqlalchemy import event
+
+        with app.app_context():
+            booking = BookingService.create_booking(
+                resource_id=sample_resource.resource_id,
+                requester_id=sample_user.user_id,
+                start_datetime=datetime(2025, 12, 3, 10, 0),
+                end_datetime=datetime(2025, 12, 3, 12, 0),
+            )
+            queries = []
+
+            def count_queries(conn, cursor, statement, *args):
+                if "FROM bookings" in statement:
+                    queries.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", count_queries)
+            try:
+                first = BookingService.get_booking_statistics()
+                second = BookingService.get_booking_statistics()
+                assert first == second and first["pending"] == 1
+                assert len(queries) == 1
+                assert "GROUP BY" in queries[0]
+
+                BookingService.cancel_booking(booking.booking_id)
+                queries.clear()
+
+                stats = BookingService.get_booking_statistics()
+                assert (stats["pending"], stats["cancelled"]) == (0, 1)
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count_queries)
@@ -0,0 +1,151 @@
+"""
+Unit Tests for Bulk Booking Approval - Campus Resource Hub
+Tests set-based conflict resolution in AdminService.process_booking_approvals.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from src.app import db
+from src.models import Booking, Resource, User
+from src.models.cache_generation import CacheGeneration
+from src.services.admin_service import AdminService, AdminServiceError
+
+DAY = datetime(2030, 2, 5)
+
+
+@pytest.fixture
+def setup_data(app):
+    """Create an admin, a requester and two resources; yields a booking factory."""
+    with app.app_context():
+        admin = User(
+            name="Admin", email="admin@example.com", password="TestPassword123", role="admin"
+        )
+        student = User(name="Student", email="student@example.com", password="TestPassword123")
+        db.session.add_all([admin, student])
+        db.session.commit()
+        resources = [
+            Resource(owner_id=admin.user_id, title=title, category="room", status="published")
+            for title in ("Room A", "Room B")
+        ]
+        db.session.add_all(resources)
+        db.session.commit()
+
+        def book(resource, start_hour, end_hour, status="pending", created_minute=0):
+            booking = Booking(
+                resource_id=resources[resource].resource_id,
+                requester_id=student.user_id,
+                start_datetime=DAY.replace(hour=start_hour),
+                end_datetime=DAY.replace(hour=end_hour),
+                status=status,
+            )
+            booking.created_at = DAY - timedelta(days=1) + timedelta(minutes=created_minute)
+            db.session.add(booking)
+            db.session.commit()
+            return booking.booking_id
+
+        yield {"admin_id": admin.user_id, "book": book}
+
+
+def _statements(app):
+    """Record UPDATE statements sent to the database."""
+    seen = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE BOOKINGS"):
+            seen.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before)
+    return seen, lambda: event.remove(db.engine, "before_cursor_execute", before)
+
+
+class TestProcessBookingApprovals:
+    """Test bulk approval outcomes and conflict resolution."""
+
+    def test_earliest_created_wins_and_existing_approvals_block(self, app, setup_data):
+        """Test batch conflicts resolve by creation time in a single UPDATE."""
+        book = setup_data["book"]
+        with app.app_context():
+            # Inserted first but requested later, so it loses to `early`
+            late = book(0, 11, 13, created_minute=30)
+            early = book(0, 10, 12, created_minute=10)
+            adjacent = book(0, 12, 14, created_minute=20)
+            blocker = book(0, 15, 17, status="approved")
+            blocked = book(0, 16, 18, created_minute=5)
+            other_room = book(1, 10, 12, created_minute=40)
+            cancelled = book(1, 13, 14, status="cancelled")
+            generation = CacheGeneration.current("search")
+
+            seen, stop = _statements(app)
+            try:
+                result = AdminService.process_booking_approvals(
+                    [late, early, adjacent, blocked, other_room, cancelled, 999999],
+                    "approve",
+                    setup_data["admin_id"],
+                )
+            finally:
+                stop()
+
+            outcomes = {r["booking_id"]: r for r in result["results"]}
+            assert [r["booking_id"] for r in result["results"]][0] == late
+            assert outcomes[early]["outcome"] == "approved"
+            assert outcomes[adjacent]["outcome"] == "approved"
+            assert outcomes[other_room]["outcome"] == "approved"
+            assert outcomes[late]["outcome"] == "conflict"
+            assert sorted(outcomes[late]["conflicting_booking_ids"]) == [early, adjacent]
+            assert outcomes[blocked] == {
+                "booking_id": blocked,
+                "outcome": "conflict",
+                "reason": "Conflicts with an existing approved booking",
+                "conflicting_booking_ids": [blocker],
+            }
+            assert outcomes[cancelled]["outcome"] == "skipped"
+            assert outcomes[999999]["outcome"] == "not_found"
+            assert (result["processed"], result["conflicts"], result["skipped"]) == (3, 2, 2)
+
+            assert len(seen) == 1
+            assert CacheGeneration.current("search") == generation + 1
+            statuses = {b.booking_id: b.status for b in Booking.query.all()}
+            assert statuses[early] == statuses[adjacent] == statuses[other_room] == "approved"
+            assert statuses[late] == statuses[blocked] == "pending"
+
+    def test_long_request_reports_every_overlapped_batch_booking(self, app, setup_data):
+        """Test a conflict lists all earlier batch approvals it spans, not just neighbours."""
+        book = setup_data["book"]
+        with app.app_context():
+            morning = book(0, 8, 9, created_minute=1)
+            midday = book(0, 10, 11, created_minute=2)
+            afternoon = book(0, 12, 13, created_minute=3)
+            evening = book(0, 14, 15, created_minute=4)
+            all_day = book(0, 8, 14, created_minute=5)
+
+            result = AdminService.process_booking_approvals(
+                [morning, midday, afternoon, evening, all_day], "approve", setup_data["admin_id"]
+            )
+
+            outcomes = {r["booking_id"]: r for r in result["results"]}
+            assert outcomes[all_day]["outcome"] == "conflict"
+            assert outcomes[all_day]["conflicting_booking_ids"] == [morning, midday, afternoon]
+            assert (result["processed"], result["conflicts"]) == (4, 1)
+
+    def test_reject_ignores_conflicts(self, app, setup_data):
+        """Test bulk rejection rejects every pending booking."""
+        book = setup_data["book"]
+        with app.app_context():
+            first, second = book(0, 10, 12), book(0, 10, 12)
+
+            result = AdminService.process_booking_approvals(
+                [first, second], "reject", setup_data["admin_id"]
+            )
+
+            assert result["processed"] == 2
+            assert {b.status for b in Booking.query.all()} == {"rejected"}
+
+    @pytest.mark.parametrize("ids, action", [([], "approve"), ([1], "archive")])
+    def test_invalid_input(self, app, setup_data, ids, action):
+        """Test empty selections and unknown actions are rejected."""
+        with app.app_context():
+            with pytest.raises(AdminServiceError):
+                AdminService.process_booking_approvals(ids, action, setup_data["admin_id"])
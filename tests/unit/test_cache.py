@@ -0,0 +1,64 @@
+"""
+Unit Tests for In-Process Caching Helpers - Campus Resource Hub
+Tests the bounded LRU + TTL cache in utils/cache.py.
+"""
+
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_get_or_set_counts_hits_and_misses(self):
+        """Test the factory runs once and later lookups are hits."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_set("key", factory) == "value"
+        assert cache.get_or_set("key", factory) == "value"
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache stays within maxsize, evicting the LRU entry."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries are dropped once their TTL has passed."""
+        import src.utils.cache as cache_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+
+        now[0] += 5
+        assert cache.get("a") == 1
+        now[0] += 6
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear_and_invalidate(self):
+        """Test single-key and full invalidation."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
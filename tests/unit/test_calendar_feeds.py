@@ -0,0 +1,166 @@
+"""
+Unit Tests for iCalendar Feeds - Campus Resource Hub
+Tests serialization helpers, fingerprints and feed tokens in
+services/calendar_service.py.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.app import db
+from src.models import Booking, Resource, User
+from src.services.calendar_service import (
+    RESOURCE_FEED_STATUSES,
+    USER_FEED_STATUSES,
+    CalendarService,
+    _escape,
+    _fold,
+)
+
+NOW = datetime(2030, 5, 6, 15, 30)
+
+
+@pytest.fixture
+def room(app):
+    """Create a resource with one approved booking inside the feed window; yields ids."""
+    with app.app_context():
+        user = User(name="Feed User", email="feed@example.com", password="TestPassword123")
+        db.session.add(user)
+        db.session.commit()
+        resource = Resource(
+            owner_id=user.user_id,
+            title="Seminar Room, East",
+            category="room",
+            location="Hall; Floor 2",
+            status="published",
+        )
+        db.session.add(resource)
+        db.session.commit()
+        booking = Booking(
+            resource.resource_id,
+            user.user_id,
+            NOW + timedelta(days=1),
+            NOW + timedelta(days=1, hours=2),
+            "approved",
+        )
+        db.session.add(booking)
+        db.session.commit()
+        yield {
+            "resource_id": resource.resource_id,
+            "booking_id": booking.booking_id,
+            "user_id": user.user_id,
+        }
+
+
+class TestSerialization:
+    """Test RFC 5545 text escaping and line folding."""
+
+    def test_escape_special_characters(self):
+        """Test backslashes, separators and newlines are escaped."""
+        assert _escape("a\\b;c,d\ne") == "a\\\\b\\;c\\,d\\ne"
+
+    def test_fold_limits_octets_per_line(self):
+        """Test long lines fold at 75 octets without splitting multi-byte characters."""
+        line = "SUMMARY:" + "é" * 100
+        folded = _fold(line)
+
+        pieces = folded.split("\r\n")
+        assert len(pieces) > 1
+        assert all(len(piece.encode("utf-8")) <= 75 for piece in pieces)
+        assert all(piece.startswith(" ") for piece in pieces[1:])
+        assert "".join(piece[1:] if i else piece for i, piece in enumerate(pieces)) == line
+
+    def test_short_lines_are_unchanged(self):
+        """Test lines within the limit are not folded."""
+        assert _fold("VERSION:2.0") == "VERSION:2.0"
+
+
+class TestFeeds:
+    """Test feed fingerprints, streaming output and tokens."""
+
+    def test_window_is_anchored_at_midnight(self, app):
+        """Test the feed window only depends on the date."""
+        with app.app_context():
+            start, end = CalendarService.feed_window(NOW)
+
+            assert start == datetime(2030, 5, 6) - timedelta(days=30)
+            assert end == datetime(2030, 5, 7) + timedelta(days=180)
+            assert CalendarService.feed_window(NOW.replace(hour=23)) == (start, end)
+
+    def test_fingerprint_changes_when_a_booking_leaves_the_feed(self, app, room):
+        """Test cancelling a booking changes the ETag of the resource feed."""
+        with app.app_context():
+            window = CalendarService.feed_window(NOW)
+            args = ("resource:1", window, RESOURCE_FEED_STATUSES)
+            etag, last_modified = CalendarService.fingerprint(
+                *args, resource_id=room["resource_id"]
+            )
+            assert last_modified is not None
+            assert CalendarService.fingerprint(*args, resource_id=room["resource_id"])[0] == etag
+
+            booking = db.session.get(Booking, room["booking_id"])
+            booking.status = "cancelled"
+            db.session.commit()
+
+            assert CalendarService.fingerprint(*args, resource_id=room["resource_id"])[0] != etag
+
+    def test_iter_feed_streams_one_chunk_per_event(self, app, room):
+        """Test the feed is a VCALENDAR with escaped, anonymous events."""
+        with app.app_context():
+            chunks = list(
+                CalendarService.iter_feed(
+                    "Seminar Room",
+                    CalendarService.feed_window(NOW),
+                    RESOURCE_FEED_STATUSES,
+                    "hub.example",
+                    resource_id=room["resource_id"],
+                    public=True,
+                )
+            )
+
+            assert len(chunks) == 3
+            assert chunks[0].startswith("BEGIN:VCALENDAR\r\n")
+            assert chunks[-1] == "END:VCALENDAR\r\n"
+            event = chunks[1]
+            assert f"UID:booking-{room['booking_id']}@hub.example\r\n" in event
+            assert "DTSTART:20300507T153000\r\n" in event
+            assert "SUMMARY:Seminar Room\\, East (booked)\r\n" in event
+            assert "LOCATION:Hall\\; Floor 2\r\n" in event
+            assert "DESCRIPTION" not in event
+
+    def test_user_fingerprint_changes_when_a_resource_is_renamed(self, app, room):
+        """Test resource edits invalidate user feeds, which show the resource title."""
+        with app.app_context():
+            window = CalendarService.feed_window(NOW)
+            args = ("user:1", window, USER_FEED_STATUSES)
+            etag = CalendarService.fingerprint(*args, requester_id=room["user_id"])[0]
+
+            resource = db.session.get(Resource, room["resource_id"])
+            resource.title = "Seminar Room, West"
+            resource.updated_at = datetime(2030, 5, 6, 16, 0)
+            db.session.commit()
+
+            assert CalendarService.fingerprint(*args, requester_id=room["user_id"])[0] != etag
+
+    def test_feed_token_round_trip(self, app, room):
+        """Test tokens identify their user and tampered tokens are rejected."""
+        with app.app_context():
+            user = db.session.get(User, room["user_id"])
+            token = CalendarService.feed_token(user)
+
+            assert CalendarService.user_from_token(token) is user
+            assert CalendarService.user_from_token(token[:-2] + "xx") is None
+            assert CalendarService.user_from_token("garbage") is None
+
+    def test_rotating_the_nonce_revokes_old_tokens(self, app, room):
+        """Test a rotated feed token replaces, rather than adds to, the old one."""
+        with app.app_context():
+            old = CalendarService.feed_token(db.session.get(User, room["user_id"]))
+
+            new = CalendarService.rotate_feed_token(room["user_id"])
+
+            assert new != old
+            assert CalendarService.user_from_token(old) is None
+            assert CalendarService.user_from_token(new).user_id == room["user_id"]
+            assert CalendarService.rotate_feed_token(room["user_id"] + 100) is None
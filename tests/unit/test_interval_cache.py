@@ -0,0 +1,210 @@
+"""
+Unit Tests for the Approved-Bookings Interval Cache - Campus Resource Hub
+Tests utils/interval_tree.py and services/interval_cache_service.py, including
+commit-time invalidation and the create_booking fast path.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from src.app import db
+from src.models import Booking, Resource, User
+from src.services.availability_service import AvailabilityService
+from src.services.booking_service import BookingConflictError, BookingService
+from src.services.interval_cache_service import INTERVAL_CACHE_NAME, IntervalCacheService
+from src.utils.interval_tree import IntervalTree
+
+TOMORROW = (datetime.now() + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture
+def hall(app):
+    """Create a resource with an approved 10:00-12:00 booking tomorrow; yields ids."""
+    app.config["BOOKING_INTERVAL_CACHE_ENABLED"] = True
+    with app.app_context():
+        user = User(
+            name="Hall Staff", email="hall@example.com", password="TestPassword123", role="staff"
+        )
+        db.session.add(user)
+        db.session.commit()
+        resource = Resource(
+            owner_id=user.user_id, title="Main Auditorium", category="room", status="published"
+        )
+        db.session.add(resource)
+        db.session.commit()
+        booking = Booking(
+            resource.resource_id,
+            user.user_id,
+            TOMORROW + timedelta(hours=1),
+            TOMORROW + timedelta(hours=3),
+            "approved",
+        )
+        db.session.add(booking)
+        db.session.commit()
+        yield {
+            "resource_id": resource.resource_id,
+            "booking_id": booking.booking_id,
+            "user_id": user.user_id,
+        }
+
+
+def _cache_stats(app):
+    return app.extensions["caches"][INTERVAL_CACHE_NAME].stats()
+
+
+class TestIntervalTree:
+    """Test overlap queries against a brute-force scan."""
+
+    def test_matches_brute_force(self):
+        """Test has_overlap and overlaps agree with a linear scan on random data."""
+        rng = random.Random(7)
+        intervals = []
+        for index in range(300):
+            start = rng.randrange(0, 10_000)
+            intervals.append((start, start + rng.randrange(1, 400), index))
+        tree = IntervalTree(intervals)
+
+        for _ in range(500):
+            start = rng.randrange(-100, 10_500)
+            end = start + rng.randrange(1, 300)
+            expected = sorted(
+                (item for item in intervals if item[0] < end and item[1] > start),
+                key=lambda item: (item[0], item[1]),
+            )
+            assert tree.overlaps(start, end) == expected
+            assert tree.has_overlap(start, end) is bool(expected)
+
+    def test_half_open_bounds(self):
+        """Test touching intervals do not overlap and an empty tree never does."""
+        tree = IntervalTree([(10, 20, "a")])
+
+        assert not tree.has_overlap(20, 30)
+        assert not tree.has_overlap(0, 10)
+        assert tree.overlaps(19, 21) == [(10, 20, "a")]
+        assert not IntervalTree().has_overlap(0, 100)
+
+
+class TestIntervalCache:
+    """Test lazy loading, invalidation and the booking fast path."""
+
+    def test_disabled_cache_defers_to_database(self, app, hall):
+        """Test queries return None when the cache is switched off."""
+        app.config["BOOKING_INTERVAL_CACHE_ENABLED"] = False
+        with app.app_context():
+            start = TOMORROW + timedelta(hours=2)
+            assert (
+                IntervalCacheService.has_conflict(
+                    hall["resource_id"], start, start + timedelta(hours=1)
+                )
+                is None
+            )
+            assert BookingService.is_conflicting(
+                hall["resource_id"], start, start + timedelta(hours=1)
+            )
+
+    def test_loads_once_and_answers_conflicts(self, app, hall):
+        """Test the tree is loaded on first use and reused for later checks."""
+        with app.app_context():
+            resource_id = hall["resource_id"]
+            assert IntervalCacheService.has_conflict(
+                resource_id, TOMORROW + timedelta(hours=2), TOMORROW + timedelta(hours=4)
+            )
+            assert not IntervalCacheService.has_conflict(
+                resource_id, TOMORROW + timedelta(hours=3), TOMORROW + timedelta(hours=4)
+            )
+            assert not IntervalCacheService.has_conflict(
+                resource_id,
+                TOMORROW + timedelta(hours=2),
+                TOMORROW + timedelta(hours=4),
+                exclude_booking_id=hall["booking_id"],
+            )
+
+            stats = _cache_stats(app)
+            assert stats["size"] == 1
+            assert stats["misses"] == 1 and stats["hits"] == 2
+
+    def test_windows_outside_the_cached_range_fall_back(self, app, hall):
+        """Test past or far-future windows are not answered from the cache."""
+        with app.app_context():
+            far = datetime.now() + timedelta(days=400)
+            assert (
+                IntervalCacheService.has_conflict(
+                    hall["resource_id"], far, far + timedelta(hours=1)
+                )
+                is None
+            )
+            past = datetime.now() - timedelta(days=2)
+            assert (
+                IntervalCacheService.busy_intervals(
+                    hall["resource_id"], past, past + timedelta(hours=1)
+                )
+                is None
+            )
+
+    def test_committed_booking_writes_invalidate_the_resource(self, app, hall):
+        """Test cancelling and creating approved bookings are visible immediately."""
+        with app.app_context():
+            resource_id = hall["resource_id"]
+            busy = (TOMORROW + timedelta(hours=1), TOMORROW + timedelta(hours=2))
+            assert IntervalCacheService.has_conflict(resource_id, *busy)
+
+            BookingService.cancel_booking(hall["booking_id"])
+            assert not IntervalCacheService.has_conflict(resource_id, *busy)
+
+            BookingService.create_booking(
+                resource_id, hall["user_id"], *busy, enforce_rules=False, status="approved"
+            )
+            assert IntervalCacheService.has_conflict(resource_id, *busy)
+
+    def test_create_booking_rejects_from_cache(self, app, hall):
+        """Test a cached conflict is refused with the conflicting bookings attached."""
+        with app.app_context():
+            start = TOMORROW + timedelta(hours=2)
+            with pytest.raises(BookingConflictError) as error:
+                BookingService.create_booking(
+                    hall["resource_id"],
+                    hall["user_id"],
+                    start,
+                    start + timedelta(hours=1),
+                    enforce_rules=False,
+                )
+            assert [booking.booking_id for booking in error.value.conflicts] == [hall["booking_id"]]
+
+    def test_stale_cache_never_refuses_a_free_slot(self, app, hall):
+        """Test a write the cache did not see falls through to the database check."""
+        with app.app_context():
+            start = TOMORROW + timedelta(hours=2)
+            assert IntervalCacheService.has_conflict(
+                hall["resource_id"], start, start + timedelta(hours=1)
+            )
+
+            # Core UPDATE, as another process would do: no commit hook runs here
+            db.session.execute(
+                update(Booking)
+                .where(Booking.booking_id == hall["booking_id"])
+                .values(status="cancelled")
+            )
+            db.session.commit()
+
+            booking = BookingService.create_booking(
+                hall["resource_id"],
+                hall["user_id"],
+                start,
+                start + timedelta(hours=1),
+                enforce_rules=False,
+            )
+            assert booking.booking_id is not None
+
+    def test_free_slots_match_database(self, app, hall):
+        """Test free-slot search gives the same answer from the cache and from SQL."""
+        with app.app_context():
+            resource = db.session.get(Resource, hall["resource_id"])
+            window = (TOMORROW, TOMORROW + timedelta(hours=8))
+            cached = AvailabilityService.find_free_slots(resource, *window)
+
+            app.config["BOOKING_INTERVAL_CACHE_ENABLED"] = False
+            assert AvailabilityService.find_free_slots(resource, *window) == cached
+            assert (TOMORROW + timedelta(hours=1), TOMORROW + timedelta(hours=3)) not in cached
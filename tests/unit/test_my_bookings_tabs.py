@@ -0,0 +1,93 @@
+"""
+Unit Tests for My Bookings Tabs - Campus Resource Hub
+Tests per-tab paginated queries and GROUP BY counts in BookingRepository.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.app import db
+from src.models import Booking, Resource, User
+from src.repositories.booking_repo import REQUESTER_TABS, BookingRepository
+
+NOW = datetime(2030, 6, 3, 12, 0)
+
+
+@pytest.fixture
+def requester(app):
+    """Create a requester with bookings in every tab, plus another user's booking."""
+    with app.app_context():
+        user = User(name="Dept Account", email="dept@example.com", password="TestPassword123")
+        other = User(name="Other", email="other@example.com", password="TestPassword123")
+        db.session.add_all([user, other])
+        db.session.commit()
+        resource = Resource(
+            owner_id=other.user_id, title="Studio", category="room", status="published"
+        )
+        db.session.add(resource)
+        db.session.commit()
+
+        def add(owner, days, status):
+            start = NOW + timedelta(days=days)
+            booking = Booking(
+                resource.resource_id, owner.user_id, start, start + timedelta(hours=1), status
+            )
+            db.session.add(booking)
+            return booking
+
+        ids = {
+            "upcoming": [add(user, day, "approved") for day in (3, 1, 2)],
+            "pending": [add(user, 5, "pending")],
+            "past": [
+                add(user, -1, "completed"),
+                add(user, -3, "approved"),  # ended, not yet swept
+                add(user, -2, "pending"),  # expired request
+            ],
+            "cancelled": [add(user, 4, "cancelled"), add(user, -4, "rejected")],
+        }
+        add(other, 1, "approved")
+        db.session.commit()
+        yield user.user_id, {tab: [b.booking_id for b in items] for tab, items in ids.items()}
+
+
+class TestRequesterTabs:
+    """Test the My Bookings partition."""
+
+    def test_counts_match_tab_queries(self, app, requester):
+        """Test the GROUP BY counts agree with each tab's own query."""
+        user_id, ids = requester
+        with app.app_context():
+            counts = BookingRepository.count_requester_tabs(user_id, NOW)
+
+            assert counts == {tab: len(ids[tab]) for tab in REQUESTER_TABS}
+            for tab in REQUESTER_TABS:
+                rows = BookingRepository.get_requester_tab(user_id, tab, NOW, per_page=50)
+                assert sorted(b.booking_id for b, _ in rows) == sorted(ids[tab])
+                assert all(resource.title == "Studio" for _, resource in rows)
+
+    def test_ordering_and_pagination(self, app, requester):
+        """Test upcoming is soonest-first, past latest-first, and pages do not overlap."""
+        user_id, ids = requester
+        with app.app_context():
+            first = BookingRepository.get_requester_tab(
+                user_id, "upcoming", NOW, page=1, per_page=2
+            )
+            second = BookingRepository.get_requester_tab(
+                user_id, "upcoming", NOW, page=2, per_page=2
+            )
+            past = BookingRepository.get_requester_tab(user_id, "past", NOW)
+
+            starts = [b.start_datetime for b, _ in first + second]
+            assert starts == sorted(starts) and len(starts) == 3
+            assert [b.booking_id for b, _ in past] == [
+                ids["past"][0],
+                ids["past"][2],
+                ids["past"][1],
+            ]
+
+    def test_unknown_tab(self, app, requester):
+        """Test unknown tabs are rejected."""
+        with app.app_context():
+            with pytest.raises(ValueError):
+                BookingRepository.get_requester_tab(requester[0], "archived", NOW)
@@ -0,0 +1,98 @@
+"""
+Unit Tests for Platform Statistics - Campus Resource Hub
+Tests the aggregated, cached AdminService.get_platform_stats and its refresh path.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from src.app import db
+from src.models import Booking, Message, Resource, Review, User
+from src.services.admin_service import AdminService
+
+
+@contextmanager
+def _counted_selects():
+    """Count SELECT statements sent to the database."""
+    selects = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        yield selects
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+
+class TestPlatformStats:
+    """Test grouped aggregates, caching and refresh."""
+
+    def test_counts_match_per_filter_queries(self, app, demo_seed):
+        """Test the grouped aggregates agree with one COUNT per filter."""
+        with app.app_context():
+            student = User.query.filter_by(email=demo_seed["student"]["email"]).one()
+            student.is_active = False
+            db.session.add(Resource(owner_id=student.user_id, title="Draft Room", category="room"))
+            db.session.commit()
+
+            stats = AdminService.get_platform_stats(refresh=True)
+
+            assert stats["total_users"] == User.query.count()
+            assert stats["suspended_users"] == User.query.filter_by(is_active=False).count() == 1
+            assert stats["active_users"] == User.query.filter_by(is_active=True).count()
+            assert (stats["admins"], stats["staff"], stats["students"]) == (1, 1, 1)
+            assert stats["total_resources"] == Resource.query.count()
+            assert stats["published_resources"] == 2
+            assert stats["draft_resources"] == Resource.query.filter_by(status="draft").count() == 1
+            assert stats["total_bookings"] == Booking.query.count()
+            assert stats["approved_bookings"] == Booking.query.filter_by(status="approved").count()
+            assert stats["total_messages"] == Message.query.count()
+            assert stats["unread_messages"] == Message.query.filter_by(is_read=False).count()
+            assert stats["total_reviews"] == Review.query.count()
+            assert stats["hidden_reviews"] == 0
+
+    def test_one_query_per_table_then_cached(self, app, demo_seed):
+        """Test a cold read runs five aggregates and a warm read runs none."""
+        with app.app_context():
+            with _counted_selects() as selects:
+                first = AdminService.get_platform_stats()
+            assert len(selects) == 5
+
+            with _counted_selects() as selects:
+                assert AdminService.get_platform_stats() == first
+            assert selects == []
+
+    def test_refresh_and_admin_writes_recompute(self, app, demo_seed):
+        """Test refresh=True and admin user actions bypass stale counts."""
+        with app.app_context():
+            assert AdminService.get_platform_stats()["total_users"] == 3
+            db.session.add(User(name="New", email="new@example.com", password="TestPassword123"))
+            db.session.commit()
+
+            assert AdminService.get_platform_stats()["total_users"] == 3
+            assert AdminService.get_platform_stats(refresh=True)["total_users"] == 4
+
+            admin = User.query.filter_by(email=demo_seed["admin"]["email"]).one()
+            student = User.query.filter_by(email=demo_seed["student"]["email"]).one()
+            AdminService.suspend_user(student.user_id, admin.user_id)
+            assert AdminService.get_platform_stats()["suspended_users"] == 1
+
+    def test_stats_endpoint_refresh(self, app, client, demo_seed):
+        """Test /admin/stats serves cached counts unless refresh=1 is passed."""
+        client.post(
+            "/auth/login",
+            data={"email": demo_seed["admin"]["email"], "password": demo_seed["admin"]["password"]},
+            follow_redirects=True,
+        )
+        assert client.get("/admin/stats").get_json()["total_users"] == 3
+
+        with app.app_context():
+            db.session.add(User(name="New", email="new@example.com", password="TestPassword123"))
+            db.session.commit()
+
+        assert client.get("/admin/stats").get_json()["total_users"] == 3
+        assert client.get("/admin/stats?refresh=1").get_json()["total_users"] == 4
@@ -0,0 +1,184 @@
+"""
+Unit Tests for Recurring Bookings - Campus Resource Hub
+Tests pattern expansion and series creation in services/recurring_booking_service.py.
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+
+from src.app import db
+from src.models import Booking, BookingSeries, Resource, User
+from src.services.recurring_booking_service import RecurrenceError, RecurringBookingService
+
+# 2030-01-08 is a Tuesday
+TUESDAY = datetime(2030, 1, 8, 14, 0)
+
+
+@pytest.fixture
+def lab(app):
+    """Create a staff user and a lab resource; yields (resource_id, user_id)."""
+    with app.app_context():
+        user = User(
+            name="Lab Staff", email="staff@example.com", password="TestPassword123", role="staff"
+        )
+        db.session.add(user)
+        db.session.commit()
+        resource = Resource(
+            owner_id=user.user_id,
+            title="Chemistry Lab",
+            category="lab",
+            location="Science Hall",
+            capacity=20,
+            status="published",
+        )
+        db.session.add(resource)
+        db.session.commit()
+        yield resource.resource_id, user.user_id
+
+
+class TestExpand:
+    """Test RRULE-like pattern expansion."""
+
+    def test_weekly_with_count(self):
+        """Test a weekly series repeats on the first occurrence's weekday."""
+        occurrences = RecurringBookingService.expand(
+            TUESDAY, TUESDAY + timedelta(hours=2), "weekly", count=3
+        )
+
+        assert [start for start, _ in occurrences] == [
+            TUESDAY,
+            TUESDAY + timedelta(weeks=1),
+            TUESDAY + timedelta(weeks=2),
+        ]
+        assert all(end - start == timedelta(hours=2) for start, end in occurrences)
+
+    def test_weekly_weekdays_interval_and_until(self):
+        """Test several weekdays every other week, bounded by an inclusive end date."""
+        occurrences = RecurringBookingService.expand(
+            TUESDAY,
+            TUESDAY + timedelta(hours=1),
+            "weekly",
+            interval=2,
+            weekdays=["tue", "thursday"],
+            until=date(2030, 1, 22),
+        )
+
+        assert [start.date() for start, _ in occurrences] == [
+            date(2030, 1, 8),
+            date(2030, 1, 10),
+            date(2030, 1, 22),
+        ]
+
+    def test_daily_interval(self):
+        """Test a daily series every third day."""
+        occurrences = RecurringBookingService.expand(
+            TUESDAY, TUESDAY + timedelta(hours=1), "daily", interval=3, count=3
+        )
+
+        assert [start.day for start, _ in occurrences] == [8, 11, 14]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"frequency": "monthly", "count": 2},
+            {"count": None},
+            {"count": 0},
+            {"interval": 0, "count": 2},
+            {"weekdays": ["funday"], "count": 2},
+            {"until": date(2031, 12, 31), "frequency": "daily"},
+            {"frequency": "daily", "count": 2, "hours": 30},
+        ],
+    )
+    def test_invalid_patterns(self, kwargs):
+        """Test unbounded, oversized, overlapping or unknown patterns are rejected."""
+        kwargs = dict(kwargs)
+        end = TUESDAY + timedelta(hours=kwargs.pop("hours", 1))
+        with pytest.raises(RecurrenceError):
+            RecurringBookingService.expand(TUESDAY, end, **kwargs)
+
+
+class TestCreateSeries:
+    """Test set-based conflict detection and bulk creation."""
+
+    def test_creates_all_occurrences_in_one_series(self, app, lab):
+        """Test a conflict-free series creates one booking per occurrence."""
+        resource_id, user_id = lab
+        with app.app_context():
+            result = RecurringBookingService.create_series(
+                resource_id, user_id, TUESDAY, TUESDAY + timedelta(hours=2), count=15
+            )
+
+            assert result["requested"] == 15
+            assert len(result["created"]) == 15
+            assert result["conflicts"] == []
+            series = db.session.get(BookingSeries, result["series_id"])
+            assert series.get_weekdays() == [1]
+            assert Booking.query.filter_by(series_id=series.series_id).count() == 15
+
+    def test_reports_conflicts_per_occurrence(self, app, lab):
+        """Test occurrences overlapping approved bookings are skipped and reported."""
+        resource_id, user_id = lab
+        with app.app_context():
+            blocker = Booking(
+                resource_id=resource_id,
+                requester_id=user_id,
+                start_datetime=TUESDAY + timedelta(weeks=1, hours=1),
+                end_datetime=TUESDAY + timedelta(weeks=1, hours=3),
+                status="approved",
+            )
+            pending = Booking(
+                resource_id=resource_id,
+                requester_id=user_id,
+                start_datetime=TUESDAY + timedelta(weeks=2),
+                end_datetime=TUESDAY + timedelta(weeks=2, hours=2),
+                status="pending",
+            )
+            db.session.add_all([blocker, pending])
+            db.session.commit()
+            blocker_id = blocker.booking_id
+
+            result = RecurringBookingService.create_series(
+                resource_id,
+                user_id,
+                TUESDAY,
+                TUESDAY + timedelta(hours=2),
+                count=4,
+                status="approved",
+            )
+
+            assert [item["start"] for item in result["created"]] == [
+                TUESDAY,
+                TUESDAY + timedelta(weeks=2),
+                TUESDAY + timedelta(weeks=3),
+            ]
+            assert result["conflicts"] == [
+                {
+                    "start": TUESDAY + timedelta(weeks=1),
+                    "end": TUESDAY + timedelta(weeks=1, hours=2),
+                    "reason": "Conflicts with an approved booking",
+                    "conflicting_booking_ids": [blocker_id],
+                }
+            ]
+
+    def test_nothing_created_when_every_occurrence_conflicts(self, app, lab):
+        """Test no series row is written when no occurrence can be booked."""
+        resource_id, user_id = lab
+        with app.app_context():
+            db.session.add(
+                Booking(
+                    resource_id=resource_id,
+                    requester_id=user_id,
+                    start_datetime=TUESDAY - timedelta(hours=1),
+                    end_datetime=TUESDAY + timedelta(weeks=1, hours=1),
+                    status="approved",
+                )
+            )
+            db.session.commit()
+
+            result = RecurringBookingService.create_series(
+                resource_id, user_id, TUESDAY, TUESDAY + timedelta(hours=2), count=2
+            )
+
+            assert result["series_id"] is None
+            assert len(result["conflicts"]) == 2
+            assert BookingSeries.query.count() == 0
@@ -0,0 +1,223 @@
+"""
+Unit Tests for the Booking Waitlist - Campus Resource Hub
+Tests joining and promotion in services/waitlist_service.py and the
+cancellation/rejection hooks in BookingService.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.app import db
+from src.models import Booking, Resource, User, WaitlistEntry
+from src.services.admin_service import AdminService
+from src.services.booking_service import BookingService
+from src.services.waitlist_service import WaitlistError, WaitlistService
+
+SLOT = datetime(2030, 4, 2, 10, 0)
+
+
+@pytest.fixture
+def room(app):
+    """Create a resource with an approved booking at SLOT; yields ids."""
+    with app.app_context():
+        users = [
+            User(name=f"User {n}", email=f"user{n}@example.com", password="TestPassword123")
+            for n in range(4)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        resource = Resource(
+            owner_id=users[0].user_id, title="Music Room", category="room", status="published"
+        )
+        db.session.add(resource)
+        db.session.commit()
+        booking = Booking(
+            resource.resource_id, users[0].user_id, SLOT, SLOT + timedelta(hours=2), "approved"
+        )
+        db.session.add(booking)
+        db.session.commit()
+        yield {
+            "resource_id": resource.resource_id,
+            "booking_id": booking.booking_id,
+            "users": [user.user_id for user in users],
+        }
+
+
+def _join(room, user_index, start_hour, end_hour):
+    return WaitlistService.join(
+        room["resource_id"],
+        room["users"][user_index],
+        SLOT.replace(hour=start_hour),
+        SLOT.replace(hour=end_hour),
+    ).entry_id
+
+
+class TestJoin:
+    """Test queueing rules."""
+
+    def test_free_slot_and_duplicates_are_refused(self, app, room):
+        """Test only booked slots can be queued, once per user."""
+        with app.app_context():
+            with pytest.raises(WaitlistError, match="available"):
+                _join(room, 1, 13, 14)
+
+            _join(room, 1, 10, 11)
+            with pytest.raises(WaitlistError, match="already"):
+                _join(room, 1, 10, 12)
+
+            assert WaitlistEntry.query.count() == 1
+
+
+class TestPromotion:
+    """Test promotion when a booking frees its slot."""
+
+    def test_cancellation_promotes_oldest_fitting_entries(self, app, room):
+        """Test FIFO promotion skips entries that collide with earlier promotions."""
+        with app.app_context():
+            first = _join(room, 1, 10, 12)
+            clashes_with_first = _join(room, 2, 11, 12)
+            # Overlaps the freed slot but also another approved booking
+            db.session.add(
+                Booking(
+                    room["resource_id"],
+                    room["users"][0],
+                    SLOT.replace(hour=12),
+                    SLOT.replace(hour=13),
+                    "approved",
+                )
+            )
+            db.session.commit()
+            still_blocked = _join(room, 0, 11, 13)
+
+            BookingService.cancel_booking(room["booking_id"])
+
+            entries = {e.entry_id: e for e in WaitlistEntry.query.all()}
+            assert entries[first].status == "promoted"
+            assert entries[clashes_with_first].status == "waiting"
+            assert entries[still_blocked].status == "waiting"
+
+            promoted = db.session.get(Booking, entries[first].booking_id)
+            assert promoted.status == "approved"
+            assert promoted.requester_id == room["users"][1]
+            assert db.session.get(Booking, room["booking_id"]).status == "cancelled"
+
+    def test_pending_promotion_when_resource_requires_approval(self, app, room):
+        """Test promotions follow the resource's approval setting."""
+        with app.app_context():
+            resource = db.session.get(Resource, room["resource_id"])
+            resource.set_availability_rules({"requires_approval": True})
+            db.session.commit()
+            entry_id = _join(room, 1, 10, 11)
+
+            BookingService.cancel_booking(room["booking_id"])
+
+            entry = db.session.get(WaitlistEntry, entry_id)
+            assert entry.booking.status == "pending"
+
+    def test_rejection_of_promoted_request_promotes_next(self, app, room):
+        """Test rejecting a promoted pending request hands the slot to the next entry."""
+        with app.app_context():
+            resource = db.session.get(Resource, room["resource_id"])
+            resource.set_availability_rules({"requires_approval": True})
+            db.session.commit()
+            first = _join(room, 1, 10, 12)
+            second = _join(room, 2, 10, 12)
+            BookingService.cancel_booking(room["booking_id"])
+            assert db.session.get(WaitlistEntry, second).status == "waiting"
+
+            BookingService.deny_booking(db.session.get(WaitlistEntry, first).booking_id)
+
+            assert db.session.get(WaitlistEntry, second).status == "promoted"
+
+    def test_ordinary_pending_requests_free_nothing(self, app, room):
+        """Test rejecting or cancelling a pending request never promotes anyone."""
+        with app.app_context():
+            entry_id = _join(room, 1, 10, 11)
+            denied, cancelled = [
+                Booking(room["resource_id"], room["users"][user], SLOT, SLOT + timedelta(hours=1))
+                for user in (2, 3)
+            ]
+            db.session.add_all([denied, cancelled])
+            # Free the slot outside the service, so only the pending requests overlap
+            db.session.get(Booking, room["booking_id"]).status = "cancelled"
+            db.session.commit()
+
+            BookingService.deny_booking(denied.booking_id)
+            BookingService.cancel_booking(cancelled.booking_id)
+
+            assert db.session.get(WaitlistEntry, entry_id).status == "waiting"
+
+    def test_promoted_pending_requests_keep_blocking_the_queue(self, app, room):
+        """Test a later freed slot skips entries overlapping a promoted pending request."""
+        with app.app_context():
+            resource = db.session.get(Resource, room["resource_id"])
+            resource.set_availability_rules({"requires_approval": True})
+            later = Booking(
+                room["resource_id"],
+                room["users"][0],
+                SLOT.replace(hour=12),
+                SLOT.replace(hour=13),
+                "approved",
+            )
+            db.session.add(later)
+            db.session.commit()
+            first = _join(room, 1, 10, 12)
+            second = _join(room, 2, 11, 13)
+
+            BookingService.cancel_booking(room["booking_id"])
+            BookingService.cancel_booking(later.booking_id)
+
+            assert db.session.get(WaitlistEntry, first).booking.status == "pending"
+            assert db.session.get(WaitlistEntry, second).status == "waiting"
+
+    def test_bulk_rejection_frees_promoted_requests(self, app, room):
+        """Test bulk rejection promotes the queue only for rejected slot holders."""
+        with app.app_context():
+            resource = db.session.get(Resource, room["resource_id"])
+            resource.set_availability_rules({"requires_approval": True})
+            db.session.commit()
+            first = _join(room, 1, 10, 12)
+            second = _join(room, 2, 10, 11)
+            BookingService.cancel_booking(room["booking_id"])
+            promoted = db.session.get(WaitlistEntry, first).booking_id
+            ordinary = Booking(
+                room["resource_id"], room["users"][3], SLOT.replace(hour=14), SLOT.replace(hour=15)
+            )
+            db.session.add(ordinary)
+            db.session.commit()
+            assert db.session.get(WaitlistEntry, second).status == "waiting"
+
+            result = AdminService.process_booking_approvals(
+                [ordinary.booking_id, promoted], "reject", room["users"][0]
+            )
+
+            assert result["processed"] == 2
+            assert db.session.get(WaitlistEntry, second).booking.status == "pending"
+
+    def test_started_entries_expire(self, app, room):
+        """Test entries whose window has started are expired instead of promoted."""
+        with app.app_context():
+            entry_id = _join(room, 1, 10, 11)
+
+            promoted = WaitlistService.promote_freed(
+                room["resource_id"],
+                SLOT,
+                SLOT + timedelta(hours=2),
+                now=SLOT + timedelta(minutes=5),
+            )
+            db.session.commit()
+
+            assert promoted == []
+            assert db.session.get(WaitlistEntry, entry_id).status == "expired"
+
+    def test_leave(self, app, room):
+        """Test users can only withdraw their own waiting entries."""
+        with app.app_context():
+            entry_id = _join(room, 1, 10, 11)
+            with pytest.raises(WaitlistError):
+                WaitlistService.leave(entry_id, room["users"][2])
+
+            WaitlistService.leave(entry_id, room["users"][1])
+
+            assert db.session.get(WaitlistEntry, entry_id).status == "cancelled"